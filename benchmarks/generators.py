@@ -0,0 +1,190 @@
+"""Parameterised synthetic grammars for the construction benchmarks.
+
+Every generator returns a new `ContextFreeGrammar`. Parsers work on their own copy, so one grammar
+can be shared by any number of builds.
+"""
+
+# LOCAL IMPORTS
+from src.grammars.context_free_grammar import ContextFreeGrammar
+
+
+def _grammar(productions, start_symbol):
+    non_terminals = list(dict.fromkeys(lhs for lhs, _ in productions))
+    terminals = list(dict.fromkeys(symbol for _, rhs in productions for symbol in rhs
+                                   if symbol not in non_terminals and symbol != 'ε'))
+    return ContextFreeGrammar(terminals, non_terminals, productions, start_symbol)
+
+
+def layered_expressions(levels):
+    """Creates an expression grammar with `levels` left-associative binary operator precedence levels.
+
+    Level `i` is `E{i} -> E{i} op{i} E{i+1} | E{i+1}`; the innermost level has parentheses,
+    identifiers and function calls.
+
+    Args:
+        levels (int): Number of precedence levels.
+
+    Returns:
+        ContextFreeGrammar: The generated grammar.
+    """
+    productions = [('S', ['E0'])]
+    for i in range(levels):
+        productions.append((f'E{i}', [f'E{i}', f'op{i}', f'E{i + 1}']))
+        productions.append((f'E{i}', [f'E{i + 1}']))
+    productions += [
+        (f'E{levels}', ['(', 'E0', ')']),
+        (f'E{levels}', ['id']),
+        (f'E{levels}', ['id', '(', 'args', ')']),
+        ('args', ['E0']),
+        ('args', ['args', ',', 'E0']),
+    ]
+    return _grammar(productions, 'S')
+
+
+def precedence_expressions(levels):
+    """Creates the ambiguous counterpart of `layered_expressions`, ordered by precedence declarations.
+
+    A single non-terminal `E -> E op{i} E` carries every operator; `op0` binds loosest and every
+    operator is left-associative, so the parsers accept the same language with the same structure.
+
+    Args:
+        levels (int): Number of precedence levels.
+
+    Returns:
+        ContextFreeGrammar: The generated grammar.
+    """
+    productions = [('S', ['E'])]
+    productions += [('E', ['E', f'op{i}', 'E']) for i in range(levels)]
+    productions += [
+        ('E', ['(', 'E', ')']),
+        ('E', ['id']),
+        ('E', ['id', '(', 'args', ')']),
+        ('args', ['E']),
+        ('args', ['args', ',', 'E']),
+    ]
+    grammar = _grammar(productions, 'S')
+    for i in range(levels):
+        grammar.declare_precedence('left', [f'op{i}'])
+    return grammar
+
+
+def statement_language(kinds):
+    """Creates a block-structured statement language with `kinds` distinct statement forms.
+
+    Statement kinds cycle through assignments, conditionals, loops and calls, each introduced by its
+    own keyword, so the number of states grows linearly with `kinds`.
+
+    Args:
+        kinds (int): Number of statement kinds.
+
+    Returns:
+        ContextFreeGrammar: The generated grammar.
+    """
+    productions = [
+        ('program', ['stmts']),
+        ('stmts', ['stmts', 'stmt']),
+        ('stmts', ['stmt']),
+        ('stmt', ['{', 'stmts', '}']),
+    ]
+    shapes = [
+        lambda kw: [kw, 'id', '=', 'expr', ';'],
+        lambda kw: [kw, '(', 'expr', ')', 'stmt', 'else', 'stmt'],
+        lambda kw: [kw, '(', 'expr', ')', 'stmt'],
+        lambda kw: [kw, 'id', '(', 'expr', ')', ';'],
+    ]
+    for i in range(kinds):
+        productions.append(('stmt', shapes[i % len(shapes)](f'kw{i}')))
+    productions += [
+        ('expr', ['expr', '+', 'term']),
+        ('expr', ['term']),
+        ('term', ['term', '*', 'factor']),
+        ('term', ['factor']),
+        ('factor', ['(', 'expr', ')']),
+        ('factor', ['id']),
+        ('factor', ['num']),
+    ]
+    return _grammar(productions, 'program')
+
+
+def lalr_stressors(copies):
+    """Creates `copies` independent LR(1) grammars that are not LALR(1), joined under one start symbol.
+
+    Each copy is the classic example `X -> a A d | b B d | a B e | b A e`, `A -> c`, `B -> c` with its
+    own terminals: merging the LR(1) states reached on `a c` and `b c` produces reduce/reduce
+    conflicts, and LR(1) needs separate states for every copy.
+
+    Args:
+        copies (int): Number of copies.
+
+    Returns:
+        ContextFreeGrammar: The generated grammar.
+    """
+    productions = []
+    for i in range(copies):
+        productions.append(('S', [f'X{i}']))
+    for i in range(copies):
+        a, b, c, d, e = (f'{t}{i}' for t in 'abcde')
+        productions += [
+            (f'X{i}', [a, f'A{i}', d]),
+            (f'X{i}', [b, f'B{i}', d]),
+            (f'X{i}', [a, f'B{i}', e]),
+            (f'X{i}', [b, f'A{i}', e]),
+            (f'A{i}', [c]),
+            (f'B{i}', [c]),
+        ]
+    return _grammar(productions, 'S')
+
+
+def epsilon_chains(width, depth):
+    """Creates `width` chains of `depth` nullable non-terminals each.
+
+    Chain `j` is `N{j}_0 -> t{j}_0 N{j}_1 | N{j}_1`, ..., `N{j}_{depth} -> t{j}_{depth} | ε`, and the start
+    symbol is the sequence of all chain heads, so FIRST and FOLLOW sets propagate through long runs of
+    nullable symbols.
+
+    Args:
+        width (int): Number of chains.
+        depth (int): Length of each chain.
+
+    Returns:
+        ContextFreeGrammar: The generated grammar.
+    """
+    productions = [('S', [f'N{j}_0' for j in range(width)])]
+    for j in range(width):
+        for k in range(depth):
+            productions.append((f'N{j}_{k}', [f't{j}_{k}', f'N{j}_{k + 1}']))
+            productions.append((f'N{j}_{k}', [f'N{j}_{k + 1}']))
+        productions.append((f'N{j}_{depth}', [f't{j}_{depth}']))
+        productions.append((f'N{j}_{depth}', ['ε']))
+    return _grammar(productions, 'S')
+
+
+# Generators by name, with the parameters used by the default and the quick suite
+GENERATORS = {
+    'layered_expressions': layered_expressions,
+    'precedence_expressions': precedence_expressions,
+    'statement_language': statement_language,
+    'lalr_stressors': lalr_stressors,
+    'epsilon_chains': epsilon_chains,
+}
+
+DEFAULT_CASES = [
+    ('layered_expressions', {'levels': 4}),
+    ('layered_expressions', {'levels': 8}),
+    ('precedence_expressions', {'levels': 4}),
+    ('precedence_expressions', {'levels': 8}),
+    ('statement_language', {'kinds': 8}),
+    ('statement_language', {'kinds': 24}),
+    ('lalr_stressors', {'copies': 4}),
+    ('lalr_stressors', {'copies': 16}),
+    ('epsilon_chains', {'width': 3, 'depth': 4}),
+    ('epsilon_chains', {'width': 6, 'depth': 8}),
+]
+
+QUICK_CASES = [
+    ('layered_expressions', {'levels': 2}),
+    ('precedence_expressions', {'levels': 2}),
+    ('statement_language', {'kinds': 4}),
+    ('lalr_stressors', {'copies': 2}),
+    ('epsilon_chains', {'width': 2, 'depth': 2}),
+]
@@ -0,0 +1,135 @@
+"""Lex-and-parse benchmarks comparing ordinary and state-aware (contextual) lexing.
+
+A random sentence of a synthetic grammar is rendered as source text, with identifiers and numbers
+for the `id` and `num` terminals, written to a file and parsed with `LRParser.parse_file` in both
+lexing modes. The statement language is keyword-heavy: every statement kind has its own keyword,
+all of which the identifier pattern also matches.
+
+    python -m benchmarks.lexing --length 1000000 --output lexing.json
+"""
+
+# GLOBAL IMPORTS
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+# LOCAL IMPORTS
+from benchmarks.generators import GENERATORS
+from src.grammars.sentence_generator import SentenceGenerator
+from src.lexer.lexer import Lexer
+from src.parsers.parser_types import build_parser
+
+DEFAULT_CASES = [
+    ('statement_language', {'kinds': 8}),
+    ('statement_language', {'kinds': 32}),
+    ('layered_expressions', {'levels': 4}),
+]
+
+PATTERNS = {'id': r'[A-Za-z_]\w*', 'num': r'\d+'}
+
+
+def render(tokens, seed=0):
+    """Renders a terminal sequence as source text.
+
+    Args:
+        tokens (Iterable[str]): The terminals.
+        seed (int, optional): Seed for the identifiers and numbers.
+
+    Returns:
+        str: The text, one statement-sized line at a time.
+    """
+    rng = random.Random(seed)
+    words = []
+    for token in tokens:
+        if token == 'id':
+            words.append(f"v{rng.randrange(1000)}")
+        elif token == 'num':
+            words.append(str(rng.randrange(10000)))
+        else:
+            words.append(token)
+        if token in (';', '{', '}'):
+            words.append('\n')
+    return ' '.join(words)
+
+
+def measure(generator, params, parser_name, length, seed=0):
+    """Times lexing and parsing one rendered sentence in both lexing modes.
+
+    Args:
+        generator (str): Name of the grammar generator.
+        params (dict): Keyword arguments for the generator.
+        parser_name (str): Parser display name.
+        length (int): Target sentence length in tokens.
+        seed (int, optional): Seed of the sentence generator.
+
+    Returns:
+        dict: The case, the number of tokens, and for each mode whether the text was accepted, the
+            parse time in milliseconds, the throughput in tokens per second and the number of
+            master-pattern alternatives offered per token.
+    """
+    grammar = GENERATORS[generator](**params)
+    parser = build_parser(grammar, parser_name)
+    lexer = Lexer.for_grammar(grammar, {t: p for t, p in PATTERNS.items() if t in grammar.terminal_set})
+    text = render(SentenceGenerator(grammar, seed=seed).tokens(length), seed)
+
+    result = {'generator': generator, 'params': params, 'parser': parser_name}
+    with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as file:
+        file.write(text)
+    try:
+        for mode, contextual in (('plain', False), ('contextual', True)):
+            start = time.perf_counter()
+            parsed = parser.parse_file(file.name, lexer, contextual=contextual)
+            elapsed = time.perf_counter() - start
+            result['tokens'] = parsed.tokens
+            result[mode] = {
+                'accepted': parsed.accepted,
+                'parse_ms': elapsed * 1000,
+                'tokens_per_second': parsed.tokens / elapsed if elapsed else None,
+                'alternatives_per_token': parsed.alternatives / parsed.tokens if parsed.tokens else None,
+            }
+    finally:
+        os.unlink(file.name)
+    return result
+
+
+def main(argv=None):
+    """Runs the lexing benchmarks from the command line.
+
+    Args:
+        argv (List[str], optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit status.
+    """
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.lexing", description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--length", type=int, default=100000, help="target sentence length in tokens")
+    arg_parser.add_argument("--parser", default="LALR(1)", help="parser display name, e.g. 'LR(1)'")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--output", "-o", help="write the JSON results to this file (default: stdout)")
+    args = arg_parser.parse_args(argv)
+
+    results = []
+    for generator, params in DEFAULT_CASES:
+        result = measure(generator, params, args.parser, args.length, args.seed)
+        plain, contextual = result['plain'], result['contextual']
+        print(f"{generator} {params}: {result['tokens']} tokens, "
+              f"{plain['alternatives_per_token']:.1f} -> {contextual['alternatives_per_token']:.1f} alternatives/token, "
+              f"{plain['tokens_per_second'] or 0:,.0f} -> {contextual['tokens_per_second'] or 0:,.0f} tokens/s",
+              file=sys.stderr)
+        results.append(result)
+
+    text = json.dumps({'results': results}, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
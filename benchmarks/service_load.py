@@ -0,0 +1,154 @@
+"""Load test for the parse service: latency percentiles and throughput under concurrent clients.
+
+Each client keeps one connection and sends its requests back to back; the requests are random
+sentences of a synthetic grammar, generated before timing starts. Without `--socket` or `--port`
+a service is started in-process on a temporary Unix socket:
+
+    python -m benchmarks.service_load --clients 16 --requests 200 --length 500
+"""
+
+# GLOBAL IMPORTS
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# LOCAL IMPORTS
+from benchmarks.generators import GENERATORS
+from src.grammars.sentence_generator import SentenceGenerator
+from src.service.client import ParseClient
+from src.service.server import ParseService
+
+
+def grammar_text(grammar):
+    """Renders a grammar in the grammar file format, quoting every symbol.
+
+    Args:
+        grammar (ContextFreeGrammar): The grammar.
+
+    Returns:
+        str: The grammar text.
+    """
+    lines = [f"%start '{grammar.start_symbol}'", "%token " + ' '.join(f"'{t}'" for t in grammar.terminals)]
+    for lhs, rhs in grammar.productions:
+        lines.append(f"'{lhs}' -> " + ' '.join(f"'{symbol}'" for symbol in rhs if symbol != 'ε'))
+    return '\n'.join(lines) + '\n'
+
+
+def percentile(values, fraction):
+    """Returns the nearest-rank percentile of a non-empty list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+async def run_load(connect, grammar, clients=8, requests=100, length=200, parser_type='lalr1', seed=0):
+    """Registers a grammar and measures parse requests from concurrent clients.
+
+    Args:
+        connect (Callable[[], Awaitable[ParseClient]]): Opens a client connection.
+        grammar (ContextFreeGrammar): The grammar to register and generate sentences of.
+        clients (int, optional): Number of concurrent connections.
+        requests (int, optional): Requests per client.
+        length (int, optional): Target sentence length in tokens.
+        parser_type (str, optional): The parser type to register.
+        seed (int, optional): Seed of the sentence generator.
+
+    Returns:
+        dict: Request and token counts, rejected requests, p50/p99/max latency in milliseconds,
+            and throughput in requests and tokens per second.
+    """
+    admin = await connect()
+    await admin.register('load', grammar_text(grammar), parser_type)
+    await admin.close()
+
+    generator = SentenceGenerator(grammar, seed=seed)
+    sentences = [generator.sentence(length) for _ in range(min(requests, 50))]
+    latencies = []
+    rejected = 0
+
+    async def client(index):
+        nonlocal rejected
+        connection = await connect()
+        try:
+            for number in range(requests):
+                tokens = sentences[(index + number) % len(sentences)]
+                start = time.perf_counter()
+                result = await connection.parse('load', tokens)
+                latencies.append(time.perf_counter() - start)
+                rejected += not result['accepted']
+        finally:
+            await connection.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(index) for index in range(clients)))
+    elapsed = time.perf_counter() - start
+    tokens = sum(len(sentences[(index + number) % len(sentences)])
+                 for index in range(clients) for number in range(requests))
+    return {
+        'clients': clients,
+        'requests': len(latencies),
+        'tokens': tokens,
+        'rejected': rejected,
+        'p50_ms': percentile(latencies, 0.50) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'max_ms': max(latencies) * 1000,
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'requests_per_second': len(latencies) / elapsed,
+        'tokens_per_second': tokens / elapsed,
+    }
+
+
+async def _main(args):
+    grammar = GENERATORS[args.generator](**json.loads(args.params))
+    if args.socket is not None or args.port is not None:
+        return await run_load(lambda: ParseClient.connect(args.socket, args.host, args.port), grammar,
+                              args.clients, args.requests, args.length, args.parser, args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'parse.sock')
+        service = await ParseService(workers=args.workers, inline_limit=args.inline_limit).start(path)
+        try:
+            return await run_load(lambda: ParseClient.connect(path), grammar, args.clients, args.requests,
+                                  args.length, args.parser, args.seed)
+        finally:
+            await service.close()
+
+
+def main(argv=None):
+    """Runs the load test from the command line.
+
+    Args:
+        argv (List[str], optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit status.
+    """
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.service_load", description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--socket", help="Unix socket of a running service")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, help="TCP port of a running service")
+    arg_parser.add_argument("--generator", default="statement_language", choices=sorted(GENERATORS))
+    arg_parser.add_argument("--params", default='{"kinds": 8}', help="generator arguments as JSON")
+    arg_parser.add_argument("--parser", default="lalr1")
+    arg_parser.add_argument("--clients", type=int, default=8)
+    arg_parser.add_argument("--requests", type=int, default=100, help="requests per client")
+    arg_parser.add_argument("--length", type=int, default=200, help="target sentence length in tokens")
+    arg_parser.add_argument("--workers", type=int, help="process pool size of the in-process service")
+    arg_parser.add_argument("--inline-limit", type=int, default=10000,
+                            help="largest input the in-process service parses without its pool")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args(argv)
+
+    result = asyncio.run(_main(args))
+    print(f"{result['requests']} requests from {result['clients']} clients: p50 {result['p50_ms']:.2f} ms, "
+          f"p99 {result['p99_ms']:.2f} ms, {result['requests_per_second']:,.0f} requests/s, "
+          f"{result['tokens_per_second']:,.0f} tokens/s", file=sys.stderr)
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,222 @@
+"""Construction benchmarks for all parser types over the synthetic grammars in `benchmarks.generators`.
+
+Each case times `compute_first`, `compute_follow`, `items()`, `merge_states()` (LALR(1) only) and
+`construct_parsing_table()`, keeping the best of several repeats, and measures the peak memory of one
+further, untimed build with `tracemalloc`. Results are written as JSON so runs on different commits
+can be compared:
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json
+    python -m benchmarks.suite --compare before.json after.json
+"""
+
+# GLOBAL IMPORTS
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+# LOCAL IMPORTS
+from benchmarks.generators import DEFAULT_CASES, GENERATORS, QUICK_CASES
+from src.parsers.lalr1_parser import LALR1Parser
+from src.parsers.lr_parser import LRParser
+from src.parsers.parser_types import PARSER_TYPES
+
+PHASES = ['compute_first', 'compute_follow', 'items', 'merge_states', 'construct_parsing_table']
+
+
+def _timed(timings, phase, function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    timings[phase] = time.perf_counter() - start
+    return result
+
+
+def build_once(generator, params, parser_class):
+    """Builds a parser for a freshly generated grammar, timing each construction phase.
+
+    `compute_first` and `compute_follow` are timed on a separate copy of the grammar, because the
+    parser computes them inside its constructor.
+
+    Args:
+        generator (str): Name of the grammar generator.
+        params (dict): Keyword arguments for the generator.
+        parser_class (Type[LRParser]): The parser class to build.
+
+    Returns:
+        Tuple[LRParser, Dict[str, float]]: The built parser and the seconds spent in each phase.
+    """
+    timings = {}
+    grammar = GENERATORS[generator](**params)
+    grammar.augment_grammar()
+    _timed(timings, 'compute_first', grammar.compute_first)
+    _timed(timings, 'compute_follow', grammar.compute_follow)
+
+    parser = parser_class(GENERATORS[generator](**params))
+    _timed(timings, 'items', parser.items)
+    if isinstance(parser, LALR1Parser):
+        _timed(timings, 'merge_states', parser.merge_states)
+        _timed(timings, 'construct_parsing_table', LRParser.construct_parsing_table, parser)
+    else:
+        _timed(timings, 'construct_parsing_table', parser.construct_parsing_table)
+    return parser, timings
+
+
+def peak_memory(generator, params, parser_class):
+    """Measures the peak traced memory of a complete build, in bytes.
+
+    Args:
+        generator (str): Name of the grammar generator.
+        params (dict): Keyword arguments for the generator.
+        parser_class (Type[LRParser]): The parser class to build.
+
+    Returns:
+        int: The peak size of the memory blocks allocated during the build.
+    """
+    tracemalloc.start()
+    try:
+        build_once(generator, params, parser_class)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_case(generator, params, parser_name, repeat):
+    """Benchmarks one grammar with one parser type.
+
+    Returns:
+        dict: The case description, the number of states, the best time of each phase in milliseconds
+            and the peak memory in bytes.
+    """
+    parser_class = PARSER_TYPES[parser_name]
+    best = {}
+    for _ in range(repeat):
+        parser, timings = build_once(generator, params, parser_class)
+        for phase, seconds in timings.items():
+            best[phase] = min(best.get(phase, seconds), seconds)
+    memory = peak_memory(generator, params, parser_class)
+    return {
+        'generator': generator,
+        'params': params,
+        'parser': parser_name,
+        'states': len(parser.C),
+        'best_ms': {phase: best[phase] * 1000 for phase in PHASES if phase in best},
+        'peak_memory_bytes': memory,
+    }
+
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(cases=None, parser_names=None, repeat=3, progress=None):
+    """Runs every case with every parser type.
+
+    Args:
+        cases (List[Tuple[str, dict]], optional): `(generator, params)` pairs. Defaults to `DEFAULT_CASES`.
+        parser_names (List[str], optional): Parser display names. Defaults to all parser types.
+        repeat (int, optional): Timed builds per case; the best time of each phase is kept.
+        progress (Callable[[dict], None], optional): Called with each result as soon as it is available.
+
+    Returns:
+        dict: `metadata` (commit, Python version, platform, time) and the list of `results`.
+    """
+    results = []
+    for generator, params in cases or DEFAULT_CASES:
+        for parser_name in parser_names or list(PARSER_TYPES):
+            result = run_case(generator, params, parser_name, repeat)
+            results.append(result)
+            if progress is not None:
+                progress(result)
+    return {
+        'metadata': {
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'repeat': repeat,
+        },
+        'results': results,
+    }
+
+
+def _case_key(result):
+    params = ','.join(f'{k}={v}' for k, v in sorted(result['params'].items()))
+    return f"{result['generator']}({params}) {result['parser']}"
+
+
+def compare(before, after):
+    """Compares two suite runs case by case.
+
+    Args:
+        before (dict): The baseline run, as returned by `run_suite`.
+        after (dict): The run to compare against the baseline.
+
+    Returns:
+        List[Tuple[str, str, float, float]]: `(case, phase, before_ms, after_ms)` for every phase
+            present in both runs, plus a `peak_memory_bytes` row per case.
+    """
+    baseline = {_case_key(result): result for result in before['results']}
+    rows = []
+    for result in after['results']:
+        old = baseline.get(_case_key(result))
+        if old is None:
+            continue
+        for phase, ms in result['best_ms'].items():
+            if phase in old['best_ms']:
+                rows.append((_case_key(result), phase, old['best_ms'][phase], ms))
+        rows.append((_case_key(result), 'peak_memory_bytes', old['peak_memory_bytes'], result['peak_memory_bytes']))
+    return rows
+
+
+def _print_result(result):
+    phases = '  '.join(f"{phase} {ms:8.2f}" for phase, ms in result['best_ms'].items())
+    print(f"{_case_key(result):<45} {result['states']:>6} states  {phases}  "
+          f"peak {result['peak_memory_bytes'] / 1024:9.1f} KiB", file=sys.stderr)
+
+
+def main(argv=None):
+    """Runs the benchmark suite from the command line.
+
+    Args:
+        argv (List[str], optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit status.
+    """
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.suite", description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--quick", action="store_true", help="run the small cases only")
+    arg_parser.add_argument("--parser", action="append", help="parser display name, e.g. 'LR(1)'; repeatable")
+    arg_parser.add_argument("--repeat", type=int, default=3, help="timed builds per case")
+    arg_parser.add_argument("--output", "-o", help="write the JSON results to this file (default: stdout)")
+    arg_parser.add_argument("--compare", nargs=2, metavar=("BEFORE", "AFTER"),
+                            help="compare two result files instead of running the suite")
+    args = arg_parser.parse_args(argv)
+
+    if args.compare:
+        with open(args.compare[0], encoding="utf-8") as before, open(args.compare[1], encoding="utf-8") as after:
+            rows = compare(json.load(before), json.load(after))
+        for case, phase, old, new in rows:
+            ratio = new / old if old else float('inf')
+            print(f"{case:<45} {phase:<25} {old:12.2f} {new:12.2f} {ratio:7.2f}x")
+        return 0
+
+    report = run_suite(QUICK_CASES if args.quick else DEFAULT_CASES, args.parser, args.repeat, _print_result)
+    text = json.dumps(report, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
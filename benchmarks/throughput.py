@@ -0,0 +1,96 @@
+"""Parse-throughput benchmarks on random sentences of the synthetic grammars.
+
+Sentences come from `SentenceGenerator` and are fed to `LRParser.recognize`, which consumes them
+token by token. The input is generated before timing starts, so only parsing is measured:
+
+    python -m benchmarks.throughput --length 1000000 --output throughput.json
+"""
+
+# GLOBAL IMPORTS
+import argparse
+import json
+import sys
+import time
+
+# LOCAL IMPORTS
+from benchmarks.generators import GENERATORS
+from src.grammars.sentence_generator import SentenceGenerator
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+
+# Grammars with a large language, so long sentences exist
+DEFAULT_CASES = [
+    ('layered_expressions', {'levels': 4}),
+    ('statement_language', {'kinds': 8}),
+]
+
+
+def measure(generator, params, parser_name, length, seed=0, near_miss=False):
+    """Times the recognition of one random sentence.
+
+    Args:
+        generator (str): Name of the grammar generator.
+        params (dict): Keyword arguments for the generator.
+        parser_name (str): Parser display name.
+        length (int): Target sentence length in tokens.
+        seed (int, optional): Seed of the sentence generator.
+        near_miss (bool, optional): Parse a near-miss invalid sentence instead.
+
+    Returns:
+        dict: The case, the number of tokens, whether they were accepted, the parse time in milliseconds
+            and the throughput in tokens per second.
+    """
+    parser = build_parser(GENERATORS[generator](**params), parser_name)
+    sentences = SentenceGenerator(GENERATORS[generator](**params), seed=seed)
+    tokens = list(sentences.near_miss(length, parser) if near_miss else sentences.tokens(length))
+
+    start = time.perf_counter()
+    accepted = parser.recognize(tokens)
+    elapsed = time.perf_counter() - start
+    return {
+        'generator': generator,
+        'params': params,
+        'parser': parser_name,
+        'tokens': len(tokens),
+        'near_miss': near_miss,
+        'accepted': accepted,
+        'parse_ms': elapsed * 1000,
+        'tokens_per_second': len(tokens) / elapsed if elapsed else None,
+    }
+
+
+def main(argv=None):
+    """Runs the throughput benchmarks from the command line.
+
+    Args:
+        argv (List[str], optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit status.
+    """
+    arg_parser = argparse.ArgumentParser(prog="python -m benchmarks.throughput", description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--length", type=int, default=100000, help="target sentence length in tokens")
+    arg_parser.add_argument("--parser", action="append", help="parser display name, e.g. 'LR(1)'; repeatable")
+    arg_parser.add_argument("--seed", type=int, default=0)
+    arg_parser.add_argument("--near-miss", action="store_true", help="parse near-miss invalid sentences")
+    arg_parser.add_argument("--output", "-o", help="write the JSON results to this file (default: stdout)")
+    args = arg_parser.parse_args(argv)
+
+    results = []
+    for generator, params in DEFAULT_CASES:
+        for parser_name in args.parser or list(PARSER_TYPES):
+            result = measure(generator, params, parser_name, args.length, args.seed, args.near_miss)
+            print(f"{generator} {params} {parser_name}: {result['tokens']} tokens, "
+                  f"{result['tokens_per_second'] or 0:,.0f} tokens/s", file=sys.stderr)
+            results.append(result)
+
+    text = json.dumps({'results': results}, indent=2) + "\n"
+    if args.output is None:
+        sys.stdout.write(text)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
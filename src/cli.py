@@ -0,0 +1,388 @@
+"""Headless command-line interface for the LR parser generator.
+
+Only the core `src.grammars`, `src.items` and `src.parsers` modules are imported, so the CLI starts
+without paying for Streamlit or pandas. Usage:
+
+    python -m src.cli build GRAMMAR [--parser TYPE] [--workers N] [--prune] [--profile] [--output FILE]
+    python -m src.cli parse GRAMMAR [--parser TYPE] [--lazy | --unit-shortcuts] [--input FILE | TOKEN ...]
+                            [--lex | --mmap [--contextual]] [--pattern TERMINAL=REGEX ...]
+                            [--trace | --profile | --glr | --recover [--sync TERMINAL ...] [--max-errors N]]
+    python -m src.cli tables GRAMMAR [--parser TYPE] [--workers N] [--format csv|json] [--output FILE]
+    python -m src.cli bench GRAMMAR [--parser TYPE ...] [--repeat N]
+    python -m src.cli generate GRAMMAR [--length N] [--seed N] [--near-miss] [--output FILE]
+    python -m src.cli check GRAMMAR ... [--parser TYPE ...] [--all] [--json]
+    python -m src.cli compare GRAMMAR [--lr1] [--prune] [--json]
+"""
+
+# GLOBAL IMPORTS
+import argparse
+import contextlib
+import csv
+import io
+import json
+import sys
+import time
+
+# LOCAL IMPORTS
+from src.grammars.loader import load_grammar
+from src.grammars.sentence_generator import SentenceGenerator
+from src.lexer.lexer import Lexer
+from src.parsers.conflicts import format_action
+from src.parsers.glr import paused_gc
+from src.parsers.instrumentation import BuildInstrumentation
+from src.parsers.parse_profile import ParseProfile
+from src.parsers.parser_types import PARSER_ALIASES, build_parser, classify, get_parser_class
+from src.parsers.recovery import ErrorRecovery
+from src.parsers.tables import EncodedTables, NO_GOTO
+from src.parsers.variants import build_variants
+
+
+def _build(grammar, parser_type, lazy=False, workers=None, instrumentation=None, unit_shortcuts=False,
+           prune=False):
+    parser = build_parser(grammar, parser_type, lazy=lazy, workers=workers, instrumentation=instrumentation,
+                          unit_shortcuts=unit_shortcuts, prune=prune)
+    if parser.pruned:
+        print(f"pruned: {parser.pruned}", file=sys.stderr)
+    # Conflicts are resolved in the tables; report those that precedence did not settle on stderr,
+    # keeping stdout for the command
+    for conflict in parser.conflicts.values():
+        if conflict.resolved_by == 'default':
+            print(f"warning: {conflict}, resolved as {format_action(conflict.resolution)}", file=sys.stderr)
+    return parser
+
+
+def _lexer(args, grammar):
+    patterns = {}
+    for definition in args.pattern or ():
+        terminal, separator, regex = definition.partition("=")
+        if not separator:
+            raise ValueError(f"--pattern expects TERMINAL=REGEX, got '{definition}'")
+        patterns[terminal] = regex
+    return Lexer.for_grammar(grammar, patterns)
+
+
+def _read_tokens(args, grammar=None):
+    lexer = _lexer(args, grammar) if grammar is not None and (args.lex or args.pattern) else None
+    if args.input is not None:
+        with open(args.input, encoding="utf-8") as file:
+            return list(lexer.terminals(file)) if lexer else file.read().split()
+    return list(lexer.terminals(" ".join(args.tokens))) if lexer else list(args.tokens)
+
+
+def _write_output(text, path):
+    if path is None:
+        sys.stdout.write(text)
+    else:
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            file.write(text)
+
+
+def _tables_json(tables):
+    return json.dumps({
+        "terminals": tables.terminals,
+        "non_terminals": tables.non_terminals,
+        "productions": [[lhs, list(rhs)] for lhs, rhs in tables.productions],
+        "action": [row.tolist() for row in tables.action],
+        "goto": [row.tolist() for row in tables.goto],
+    }) + "\n"
+
+
+def _tables_csv(tables):
+    output = io.StringIO()
+    writer = csv.writer(output)
+    writer.writerow(["State"] + tables.terminals + tables.non_terminals)
+    for state in range(tables.n_states):
+        action = [tables.action_label(code) for code in tables.action[state]]
+        goto = ['' if target == NO_GOTO else target for target in tables.goto[state]]
+        writer.writerow([state] + action + goto)
+    return output.getvalue()
+
+
+def cmd_build(args):
+    """Builds a parser and reports its size; optionally writes the encoded tables as JSON."""
+    grammar = load_grammar(args.grammar)
+    start = time.perf_counter()
+    instrumentation = BuildInstrumentation() if args.profile else None
+    parser = _build(grammar, args.parser, workers=args.workers, instrumentation=instrumentation, prune=args.prune)
+    elapsed = time.perf_counter() - start
+    print(f"{get_parser_class(args.parser).__name__}: {len(parser.C)} states, "
+          f"{len(parser.action)} ACTION entries, {len(parser.goto_table)} GOTO entries "
+          f"({elapsed * 1000:.1f} ms)")
+    if instrumentation is not None:
+        print(instrumentation.report())
+    if args.output is not None:
+        _write_output(_tables_json(EncodedTables.from_parser(parser)), args.output)
+    return 0
+
+
+def cmd_parse(args):
+    """Parses a token stream; exits with status 0 when it is accepted and 1 otherwise."""
+    grammar = load_grammar(args.grammar)
+    if args.mmap:
+        if args.input is None:
+            raise ValueError("--mmap needs --input")
+        lexer = _lexer(args, grammar)
+        parser = _build(grammar, args.parser, args.lazy, unit_shortcuts=args.unit_shortcuts)
+        result = parser.parse_file(args.input, lexer, contextual=args.contextual)
+        if result.error is not None:
+            print(f"error: rejected at byte {result.error[0]} after {result.tokens} tokens", file=sys.stderr)
+        print("accepted" if result.accepted else "rejected")
+        return 0 if result.accepted else 1
+    tokens = _read_tokens(args, grammar)
+    parser = _build(grammar, args.parser, args.lazy, unit_shortcuts=args.unit_shortcuts)
+    if args.recover:
+        result = parser.diagnose(tokens, ErrorRecovery(sync_terminals=args.sync or (),
+                                                       max_errors=args.max_errors))
+        for diagnostic in result.diagnostics:
+            print(f"error: {diagnostic}", file=sys.stderr)
+        if result.error_limit_reached:
+            print(f"error: stopped after {args.max_errors} errors", file=sys.stderr)
+        print("accepted" if result.accepted else f"rejected ({len(result.diagnostics)} errors)")
+        return 0 if result.accepted else 1
+    if args.glr:
+        with paused_gc():
+            result = parser.parse_glr(tokens)
+        if not result.accepted:
+            print(f"error: no parse can continue at token {result.error_position}", file=sys.stderr)
+            print("rejected")
+            return 1
+        print(f"accepted ({result.derivations()} derivations, {len(result.ambiguous_nodes())} ambiguous nodes)")
+        return 0
+    if args.profile:
+        profile = ParseProfile(parser)
+        accepted = parser.recognize(tokens, profile)
+        print(json.dumps(profile.report(), indent=2), file=sys.stderr)
+        configurations = None
+    else:
+        # The driver reports its verdict on stdout; keep the CLI output under our control
+        with contextlib.redirect_stdout(io.StringIO()):
+            configurations = parser.parse(tokens)
+        accepted = configurations is not None and configurations[-1][2] == ('accept',)
+
+    if args.trace and configurations is not None:
+        for stack, remaining, action in configurations:
+            print(f"{' '.join(map(str, stack))}\t{' '.join(remaining)}\t{action}")
+    if parser.lazy:
+        print(f"built {len(parser.built_states)} of {len(parser.C)} discovered states", file=sys.stderr)
+    print("accepted" if accepted else "rejected")
+    return 0 if accepted else 1
+
+
+def cmd_tables(args):
+    """Writes the ACTION and GOTO tables as CSV or JSON."""
+    parser = _build(load_grammar(args.grammar), args.parser, workers=args.workers)
+    tables = EncodedTables.from_parser(parser)
+    text = _tables_json(tables) if args.format == "json" else _tables_csv(tables)
+    _write_output(text, args.output)
+    return 0
+
+
+def cmd_bench(args):
+    """Times the construction phases of one or more parser types."""
+    results = []
+    for parser_type in args.parser or list(PARSER_ALIASES):
+        parser_class = get_parser_class(parser_type)
+        timings = {"init": [], "items": [], "table": []}
+        for _ in range(args.repeat):
+            grammar = load_grammar(args.grammar)
+            start = time.perf_counter()
+            parser = parser_class(grammar)
+            after_init = time.perf_counter()
+            parser.items()
+            after_items = time.perf_counter()
+            parser.construct_parsing_table()
+            end = time.perf_counter()
+            timings["init"].append(after_init - start)
+            timings["items"].append(after_items - after_init)
+            timings["table"].append(end - after_items)
+        results.append({
+            "parser": parser_class.__name__,
+            "states": len(parser.C),
+            "best_ms": {phase: min(values) * 1000 for phase, values in timings.items()},
+        })
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            best = result["best_ms"]
+            print(f"{result['parser']:<12} {result['states']:>6} states  "
+                  f"init {best['init']:8.2f} ms  items {best['items']:8.2f} ms  table {best['table']:8.2f} ms")
+    return 0
+
+
+def cmd_generate(args):
+    """Writes a random sentence of the grammar, one token per line; `--near-miss` makes it invalid."""
+    generator = SentenceGenerator(load_grammar(args.grammar), max_depth=args.max_depth, seed=args.seed)
+    if args.near_miss:
+        parser = _build(load_grammar(args.grammar), args.parser)
+        tokens = generator.near_miss(args.length, parser)
+    else:
+        tokens = generator.tokens(args.length)
+
+    output = sys.stdout if args.output is None else open(args.output, "w", encoding="utf-8")
+    try:
+        for token in tokens:
+            output.write(token + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+def cmd_check(args):
+    """Checks grammars for conflicts without building tables; exits with status 1 if any is found."""
+    results = {}
+    for path in args.grammar:
+        results[path] = classify(load_grammar(path), args.parser, stop_at_first=not args.all)
+
+    if args.json:
+        print(json.dumps({path: {name: [conflict.as_dict() for conflict in conflicts]
+                                 for name, conflicts in classes.items()}
+                          for path, classes in results.items()}, indent=2))
+    else:
+        for path, classes in results.items():
+            print(path)
+            for name, conflicts in classes.items():
+                print(f"  {name:<8} {'ok' if not conflicts else 'conflicts'}")
+                for conflict in conflicts:
+                    print(f"    {conflict}")
+                    for item in conflict.items:
+                        print(f"      {item}")
+    has_conflicts = any(conflicts for classes in results.values() for conflicts in classes.values())
+    return 1 if has_conflicts else 0
+
+
+def cmd_compare(args):
+    """Builds the LR(0), SLR(1) and LALR(1) parsers from one LR(0) collection and compares them."""
+    build = build_variants(load_grammar(args.grammar), include_lr1=args.lr1, prune=args.prune)
+    if args.json:
+        print(json.dumps({
+            "collection_seconds": round(build.collection_seconds, 6),
+            "weakest_conflict_free": build.weakest_conflict_free(),
+            "parsers": build.comparison(),
+        }, indent=2))
+        return 0
+    print(f"{'parser':<8} {'states':>7} {'ACTION':>7} {'GOTO':>7} {'bytes':>9} {'s/r':>5} {'r/r':>5} {'ms':>8}")
+    for summary in build.summaries:
+        print(f"{summary.parser_type:<8} {summary.states:>7} {summary.action_entries:>7} {summary.goto_entries:>7} "
+              f"{summary.table_bytes:>9} {summary.shift_reduce:>5} {summary.reduce_reduce:>5} "
+              f"{summary.seconds * 1000:>8.1f}")
+    print(f"shared LR(0) collection: {build.collection_seconds * 1000:.1f} ms")
+    print(f"weakest conflict-free type: {build.weakest_conflict_free() or 'none'}")
+    return 0
+
+
+def build_arg_parser():
+    """Creates the argument parser for the CLI.
+
+    Returns:
+        argparse.ArgumentParser: The configured argument parser.
+    """
+    arg_parser = argparse.ArgumentParser(prog="python -m src.cli", description="Headless LR parser generator.")
+    subparsers = arg_parser.add_subparsers(dest="command", required=True)
+    parser_help = f"parser type: {', '.join(PARSER_ALIASES)} (default: lalr1)"
+
+    build = subparsers.add_parser("build", help="build a parser and report its size")
+    build.add_argument("grammar", help="path to the grammar file")
+    build.add_argument("--parser", default="lalr1", help=parser_help)
+    build.add_argument("--output", "-o", help="write the encoded tables as JSON to this file")
+    build.add_argument("--workers", type=int, help="build the canonical collection in N processes")
+    build.add_argument("--prune", action="store_true",
+                       help="remove unproductive and unreachable symbols before construction")
+    build.add_argument("--profile", action="store_true", help="report the time and allocations of each phase")
+    build.set_defaults(func=cmd_build)
+
+    parse = subparsers.add_parser("parse", help="parse a whitespace-separated token stream")
+    parse.add_argument("grammar", help="path to the grammar file")
+    parse.add_argument("tokens", nargs="*", help="input tokens (ignored when --input is given)")
+    parse.add_argument("--parser", default="lalr1", help=parser_help)
+    parse.add_argument("--input", "-i", help="read whitespace-separated tokens from this file")
+    parse.add_argument("--lex", action="store_true",
+                       help="split the input with a lexer for the grammar's terminals instead of at whitespace")
+    parse.add_argument("--pattern", action="append", metavar="TERMINAL=REGEX",
+                       help="regular expression for a terminal; repeatable, implies --lex")
+    parse.add_argument("--mmap", action="store_true",
+                       help="memory-map the --input file and lex and parse it in place (implies --lex)")
+    parse.add_argument("--contextual", action="store_true",
+                       help="with --mmap, lex only the terminals the current parser state accepts")
+    parse.add_argument("--trace", action="store_true", help="print every parser configuration")
+    parse.add_argument("--profile", action="store_true",
+                       help="report hot states and productions as JSON on stderr (replaces --trace)")
+    parse.add_argument("--lazy", action="store_true",
+                       help="build only the states the input reaches (not available for lalr1)")
+    parse.add_argument("--unit-shortcuts", action="store_true",
+                       help="bypass chains of unit reductions (traces still show every reduction)")
+    parse.add_argument("--glr", action="store_true",
+                       help="follow every action of conflicting entries and report the number of derivations")
+    parse.add_argument("--recover", action="store_true",
+                       help="recover from syntax errors and report all of them on stderr")
+    parse.add_argument("--sync", action="append", metavar="TERMINAL",
+                       help="synchronising terminal for panic-mode recovery; repeatable")
+    parse.add_argument("--max-errors", type=int, default=100, help="stop recovering after N errors (default: 100)")
+    parse.set_defaults(func=cmd_parse)
+
+    tables = subparsers.add_parser("tables", help="write the ACTION and GOTO tables")
+    tables.add_argument("grammar", help="path to the grammar file")
+    tables.add_argument("--parser", default="lalr1", help=parser_help)
+    tables.add_argument("--format", choices=["csv", "json"], default="csv")
+    tables.add_argument("--workers", type=int, help="build the canonical collection in N processes")
+    tables.add_argument("--output", "-o", help="output file (default: stdout)")
+    tables.set_defaults(func=cmd_tables)
+
+    bench = subparsers.add_parser("bench", help="time parser construction")
+    bench.add_argument("grammar", help="path to the grammar file")
+    bench.add_argument("--parser", action="append", help=f"{parser_help}; repeatable, default: all")
+    bench.add_argument("--repeat", type=int, default=5, help="number of timed builds per parser type")
+    bench.add_argument("--json", action="store_true", help="emit the results as JSON")
+    bench.set_defaults(func=cmd_bench)
+
+    generate = subparsers.add_parser("generate", help="write a random sentence of the grammar")
+    generate.add_argument("grammar", help="path to the grammar file")
+    generate.add_argument("--length", type=int, default=100, help="target number of tokens (default: 100)")
+    generate.add_argument("--seed", type=int, help="random seed")
+    generate.add_argument("--max-depth", type=int, help="maximum derivation depth for random choices")
+    generate.add_argument("--near-miss", action="store_true", help="insert or replace one token so that "
+                                                                   "the parser rejects the sentence")
+    generate.add_argument("--parser", default="lalr1", help=f"{parser_help}; used by --near-miss")
+    generate.add_argument("--output", "-o", help="output file (default: stdout)")
+    generate.set_defaults(func=cmd_generate)
+
+    check = subparsers.add_parser("check", help="check grammars for conflicts without building tables")
+    check.add_argument("grammar", nargs="+", help="paths to the grammar files")
+    check.add_argument("--parser", action="append", help=f"{parser_help}; repeatable, default: all")
+    check.add_argument("--all", action="store_true", help="report every conflict instead of stopping at the first")
+    check.add_argument("--json", action="store_true", help="emit the conflicts as JSON")
+    check.set_defaults(func=cmd_check)
+
+    compare = subparsers.add_parser("compare", help="build LR(0), SLR(1) and LALR(1) from one LR(0) collection "
+                                                    "and compare their sizes and conflicts")
+    compare.add_argument("grammar", help="path to the grammar file")
+    compare.add_argument("--lr1", action="store_true", help="also build the canonical LR(1) parser")
+    compare.add_argument("--prune", action="store_true",
+                         help="remove unproductive and unreachable symbols before construction")
+    compare.add_argument("--json", action="store_true", help="emit the comparison as JSON")
+    compare.set_defaults(func=cmd_compare)
+
+    return arg_parser
+
+
+def main(argv=None):
+    """Runs the CLI.
+
+    Args:
+        argv (List[str], optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit status.
+    """
+    args = build_arg_parser().parse_args(argv)
+    try:
+        return args.func(args)
+    except (OSError, ValueError, NotImplementedError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
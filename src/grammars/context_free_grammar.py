@@ -1,4 +1,5 @@
 from src.grammars.grammar import Grammar
+from src.grammars.pruning import prune
 
 
 class ContextFreeGrammar(Grammar):
@@ -11,7 +12,8 @@ class ContextFreeGrammar(Grammar):
         follow (dict): Dictionary storing FOLLOW sets for non-terminals.
     """
 
-    def __init__(self, terminals, non_terminals, productions, start_symbol):
+    def __init__(self, terminals, non_terminals, productions, start_symbol, precedence=None,
+                 production_precedence=None):
         """Initializes a ContextFreeGrammar with the given grammar components.
 
         Args:
@@ -19,8 +21,11 @@ class ContextFreeGrammar(Grammar):
             non_terminals (List[str]): List of non-terminal symbols.
             productions (List[Tuple[str, List[str]]]): List of production rules.
             start_symbol (str): The start symbol of the grammar.
+            precedence (Dict[str, Tuple[int, str]], optional): Terminal precedence and associativity.
+            production_precedence (Dict[Tuple[str, Tuple[str, ...]], str], optional): `%prec` terminals
+                of productions.
         """
-        super().__init__(terminals, non_terminals, productions, start_symbol)
+        super().__init__(terminals, non_terminals, productions, start_symbol, precedence, production_precedence)
         self.first = None
         self.follow = None
 
@@ -40,26 +45,34 @@ class ContextFreeGrammar(Grammar):
         while changed:
             changed = False
             for lhs, rhs in self.productions:
-                first_before = self.first[lhs].copy()
+                if self._first_step(lhs, rhs):
+                    changed = True
+
+    def _first_step(self, lhs, rhs):
+        """Adds FIRST(rhs) to FIRST(lhs).
 
-                # Compute FIRST(lhs) based on FIRST(rhs)
-                if rhs == ['ε']:
-                    self.first[lhs].add('ε')
+        Returns:
+            bool: True if FIRST(lhs) grew.
+        """
+        first_before = self.first[lhs].copy()
+
+        # Compute FIRST(lhs) based on FIRST(rhs)
+        if rhs == ['ε']:
+            self.first[lhs].add('ε')
+        else:
+            counter_of_epsilon = 0
+            for symbol in rhs:
+                self.first[lhs].update(self.first[symbol] - {'ε'})
+                if 'ε' not in self.first[symbol]:
+                    break
                 else:
-                    counter_of_epsilon = 0
-                    for symbol in rhs:
-                        self.first[lhs].update(self.first[symbol] - {'ε'})
-                        if 'ε' not in self.first[symbol]:
-                            break
-                        else:
-                            counter_of_epsilon += 1
-
-                    # If all symbols in RHS can derive ε, add ε to FIRST(lhs)
-                    if counter_of_epsilon == len(rhs):
-                        self.first[lhs].add('ε')
-
-                if first_before != self.first[lhs]:
-                    changed = True
+                    counter_of_epsilon += 1
+
+            # If all symbols in RHS can derive ε, add ε to FIRST(lhs)
+            if counter_of_epsilon == len(rhs):
+                self.first[lhs].add('ε')
+
+        return first_before != self.first[lhs]
 
     def compute_follow(self):
         """Computes the FOLLOW sets for all non-terminals in the grammar.
@@ -75,18 +88,166 @@ class ContextFreeGrammar(Grammar):
         while changed:
             changed = False
             for lhs, rhs in self.productions:
-                trailer = self.follow[lhs].copy()
-                for symbol in reversed(rhs):
-                    if symbol in self.non_terminals:
-                        before = self.follow[symbol].copy()
-                        self.follow[symbol].update(trailer)
-
-                        if 'ε' in self.first[symbol]:
-                            trailer.update(self.first[symbol] - {'ε'})
-                        else:
-                            trailer = self.first[symbol]
-
-                        if before != self.follow[symbol]:
-                            changed = True
-                    elif symbol in self.terminals:
-                        trailer = self.first[symbol]
+                if self._follow_step(lhs, rhs):
+                    changed = True
+
+    def _follow_step(self, lhs, rhs):
+        """Propagates FOLLOW information through one production.
+
+        Returns:
+            bool: True if the FOLLOW set of any symbol in `rhs` grew.
+        """
+        changed = False
+        trailer = self.follow[lhs].copy()
+        for symbol in reversed(rhs):
+            if symbol in self.non_terminal_set:
+                before = self.follow[symbol].copy()
+                self.follow[symbol].update(trailer)
+
+                if 'ε' in self.first[symbol]:
+                    trailer.update(self.first[symbol] - {'ε'})
+                else:
+                    trailer = set(self.first[symbol])
+
+                if before != self.follow[symbol]:
+                    changed = True
+            elif symbol in self.terminal_set:
+                trailer = set(self.first[symbol])
+        return changed
+
+    def nullable_non_terminals(self):
+        """Computes the non-terminals that derive the empty string, without using the FIRST sets.
+
+        Returns:
+            Set[str]: The nullable non-terminals.
+        """
+        nullable = set()
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.productions:
+                if lhs not in nullable and all(symbol == 'ε' or symbol in nullable for symbol in rhs):
+                    nullable.add(lhs)
+                    changed = True
+        return nullable
+
+    def prune(self):
+        """Removes unproductive and unreachable non-terminals, their productions and unused terminals.
+
+        The grammar is modified in place and its FIRST and FOLLOW sets are discarded.
+
+        Returns:
+            PruneReport: What was removed.
+
+        Raises:
+            ValueError: If the start symbol derives no terminal string.
+        """
+        report = prune(self)
+        if report:
+            self.first = None
+            self.follow = None
+        return report
+
+    def update_first(self, changed_non_terminals):
+        """Incrementally updates the FIRST sets after the productions of some non-terminals changed.
+
+        Only the non-terminals whose FIRST set can depend on a changed non-terminal are recomputed:
+        those that reach one of them through a chain of leftmost, possibly preceded by nullable,
+        right-hand-side symbols. All other FIRST sets are kept as they are.
+
+        Args:
+            changed_non_terminals (Set[str]): Non-terminals whose productions were added or removed.
+
+        Returns:
+            Set[str]: The non-terminals whose FIRST set actually changed.
+        """
+        for terminal in self.terminals:
+            self.first.setdefault(terminal, {terminal})
+        for non_terminal in self.non_terminals:
+            self.first.setdefault(non_terminal, set())
+
+        # Nullable under either the old or the new productions
+        maybe_nullable = self.nullable_non_terminals()
+        maybe_nullable.update(A for A in self.non_terminals if 'ε' in self.first[A])
+
+        dependents = {}
+        for lhs, rhs in self.productions:
+            for symbol in rhs:
+                if symbol in self.non_terminal_set:
+                    dependents.setdefault(symbol, set()).add(lhs)
+                if symbol not in maybe_nullable:
+                    break
+
+        affected = set(changed_non_terminals)
+        stack = list(affected)
+        while stack:
+            for dependent in dependents.get(stack.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    stack.append(dependent)
+
+        old_first = {A: self.first[A] for A in affected}
+        for A in affected:
+            self.first[A] = set()
+        productions = [prod for A in affected for prod in self.productions_by_lhs.get(A, ())]
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in productions:
+                if self._first_step(lhs, rhs):
+                    changed = True
+
+        return {A for A in affected if self.first[A] != old_first[A]}
+
+    def update_follow(self, touched_productions, first_changed):
+        """Incrementally updates the FOLLOW sets after a grammar edit.
+
+        The FOLLOW sets that may change are those of the symbols in the added or removed productions
+        and of the symbols sharing a production with a symbol whose FIRST set changed, together with
+        every symbol that can end a production of a non-terminal whose FOLLOW set may change. Only
+        these are recomputed; `update_first` must have been called before.
+
+        Args:
+            touched_productions (Iterable[Tuple[str, List[str]]]): The added and removed productions.
+            first_changed (Set[str]): Non-terminals whose FIRST set changed.
+
+        Returns:
+            Set[str]: The non-terminals whose FOLLOW set actually changed.
+        """
+        for non_terminal in self.non_terminals:
+            self.follow.setdefault(non_terminal, set())
+
+        seeds = set()
+        for _, rhs in touched_productions:
+            seeds.update(symbol for symbol in rhs if symbol in self.non_terminal_set)
+        # Symbols at the end of a production inherit the FOLLOW set of its left-hand side
+        tails = {}
+        for lhs, rhs in self.productions:
+            if first_changed and any(symbol in first_changed for symbol in rhs):
+                seeds.update(symbol for symbol in rhs if symbol in self.non_terminal_set)
+            for symbol in reversed(rhs):
+                if symbol in self.non_terminal_set:
+                    tails.setdefault(lhs, set()).add(symbol)
+                if symbol != 'ε' and 'ε' not in self.first[symbol]:
+                    break
+
+        affected = set(seeds)
+        stack = list(affected)
+        while stack:
+            for tail in tails.get(stack.pop(), ()):
+                if tail not in affected:
+                    affected.add(tail)
+                    stack.append(tail)
+
+        old_follow = {A: self.follow[A] for A in affected}
+        for A in affected:
+            self.follow[A] = {'$'} if A == self.start_symbol else set()
+        productions = [prod for prod in self.productions if any(symbol in affected for symbol in prod[1])]
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in productions:
+                if self._follow_step(lhs, rhs):
+                    changed = True
+
+        return {A for A in affected if self.follow[A] != old_follow[A]}
@@ -8,9 +8,18 @@ class Grammar:
         start_symbol (str): The start symbol of the grammar.
         augmented_start_symbol (str): The augmented start symbol used in parsing algorithms.
         production_numbers (dict): A dictionary mapping productions to their unique numbers.
+        terminal_set (Set[str]): The terminals as a set, for constant-time membership tests.
+        non_terminal_set (Set[str]): The non-terminals as a set, for constant-time membership tests.
+        productions_by_lhs (Dict[str, List[Tuple[str, List[str]]]]): The productions grouped by their
+            left-hand side, in grammar order.
+        precedence (Dict[str, Tuple[int, str]]): The declared precedence of terminals as `(level, associativity)`
+            pairs; higher levels bind tighter and the associativity is `'left'`, `'right'` or `'nonassoc'`.
+        production_precedence (Dict[Tuple[str, Tuple[str, ...]], str]): The terminal whose precedence a
+            production takes (`%prec`), keyed by `(lhs, tuple(rhs))`.
     """
 
-    def __init__(self, terminals, non_terminals, productions, start_symbol):
+    def __init__(self, terminals, non_terminals, productions, start_symbol, precedence=None,
+                 production_precedence=None):
         """Initializes a Grammar with given terminals, non-terminals, productions, and a start symbol.
 
         Args:
@@ -18,13 +27,68 @@ class Grammar:
             non_terminals (List[str]): List of non-terminal symbols.
             productions (List[Tuple[str, List[str]]]): List of production rules.
             start_symbol (str): The start symbol of the grammar.
+            precedence (Dict[str, Tuple[int, str]], optional): Terminal precedence and associativity.
+            production_precedence (Dict[Tuple[str, Tuple[str, ...]], str], optional): `%prec` terminals
+                of productions.
         """
         self.terminals = terminals
         self.non_terminals = non_terminals
         self.productions = productions
         self.start_symbol = start_symbol
+        self.precedence = precedence or {}
+        self.production_precedence = production_precedence or {}
         self.augmented_start_symbol = None
         self.production_numbers = None
+        self.index_symbols()
+
+    def copy(self):
+        """Creates an independent, unaugmented copy of the grammar.
+
+        Parsers augment their grammar in place, so a copy is needed to build several parsers from
+        the same grammar.
+
+        Returns:
+            Grammar: A grammar of the same class with copies of the symbol and production lists.
+        """
+        productions = [(lhs, list(rhs)) for lhs, rhs in self.productions if lhs != self.augmented_start_symbol]
+        non_terminals = [A for A in self.non_terminals if A != self.augmented_start_symbol]
+        return type(self)(list(self.terminals), non_terminals, productions, self.start_symbol,
+                          dict(self.precedence), dict(self.production_precedence))
+
+    def declare_precedence(self, associativity, terminals):
+        """Declares a new precedence level that binds tighter than all earlier ones, like yacc's `%left`.
+
+        Args:
+            associativity (str): `'left'`, `'right'` or `'nonassoc'`.
+            terminals (Iterable[str]): The terminals of the level.
+
+        Raises:
+            ValueError: If the associativity is unknown or a terminal already has a precedence.
+        """
+        if associativity not in ('left', 'right', 'nonassoc'):
+            raise ValueError(f"Unknown associativity '{associativity}'")
+        level = 1 + max((level for level, _ in self.precedence.values()), default=0)
+        for terminal in terminals:
+            if terminal in self.precedence:
+                raise ValueError(f"Precedence of '{terminal}' is already declared")
+            self.precedence[terminal] = (level, associativity)
+
+    def get_production_precedence(self, prod):
+        """Gets the precedence of a production.
+
+        A production takes the precedence of its `%prec` terminal if it has one, and otherwise that
+        of the last terminal on its right-hand side.
+
+        Args:
+            prod (Tuple[str, List[str]]): The production rule as a tuple (lhs, rhs).
+
+        Returns:
+            Tuple[int, str]: The `(level, associativity)` pair, or None if the production has no precedence.
+        """
+        terminal = self.production_precedence.get((prod[0], tuple(prod[1])))
+        if terminal is None:
+            terminal = next((symbol for symbol in reversed(prod[1]) if symbol in self.terminal_set), None)
+        return self.precedence.get(terminal)
 
     def augment_grammar(self):
         """Augments the grammar by adding a new start symbol and production.
@@ -35,8 +99,75 @@ class Grammar:
         self.augmented_start_symbol = self.start_symbol + "'"
         self.productions.insert(0, (self.augmented_start_symbol, [self.start_symbol]))
         self.non_terminals.insert(0, self.augmented_start_symbol)
+        self.index_symbols()
         self.number_productions()
 
+    def index_symbols(self):
+        """Builds the set and per-LHS indexes over the symbol and production lists.
+
+        Must be called again whenever the lists are modified in place.
+        """
+        self.terminal_set = set(self.terminals)
+        self.non_terminal_set = set(self.non_terminals)
+        self.productions_by_lhs = {}
+        for prod in self.productions:
+            self.productions_by_lhs.setdefault(prod[0], []).append(prod)
+
+    def apply_delta(self, added=(), removed=()):
+        """Adds and removes productions in place, keeping the indexes and production numbers up to date.
+
+        Left-hand sides of added productions become non-terminals; other unknown symbols on their
+        right-hand sides become terminals. Symbols are never removed, even if no production uses
+        them any more.
+
+        Args:
+            added (Iterable[Tuple[str, List[str]]]): Productions to add, appended in order.
+            removed (Iterable[Tuple[str, List[str]]]): Productions to remove.
+
+        Returns:
+            Set[str]: The left-hand sides whose productions changed.
+
+        Raises:
+            ValueError: If a removed production does not exist, an added production already exists,
+                a terminal is used as a left-hand side, or the augmented production is removed.
+        """
+        added = [(lhs, list(rhs)) for lhs, rhs in added]
+        removed_keys = {(lhs, tuple(rhs)) for lhs, rhs in removed}
+        existing = {(lhs, tuple(rhs)) for lhs, rhs in self.productions}
+
+        for lhs, rhs in removed_keys:
+            if (lhs, rhs) not in existing:
+                raise ValueError(f"Cannot remove unknown production {lhs} -> {' '.join(rhs)}")
+            if lhs == self.augmented_start_symbol:
+                raise ValueError("Cannot remove the augmented start production")
+        added_lhs = set()
+        for lhs, rhs in added:
+            key = (lhs, tuple(rhs))
+            if key in existing and key not in removed_keys:
+                raise ValueError(f"Production {lhs} -> {' '.join(rhs)} already exists")
+            if lhs in self.terminal_set:
+                raise ValueError(f"Terminal '{lhs}' cannot be the left-hand side of a production")
+            existing.add(key)
+            added_lhs.add(lhs)
+
+        for lhs, rhs in added:
+            if lhs not in self.non_terminal_set:
+                self.non_terminals.append(lhs)
+                self.non_terminal_set.add(lhs)
+        for _, rhs in added:
+            for symbol in rhs:
+                if symbol != 'ε' and symbol not in self.non_terminal_set and symbol not in self.terminal_set:
+                    self.terminals.append(symbol)
+                    self.terminal_set.add(symbol)
+
+        if removed_keys:
+            self.productions[:] = [prod for prod in self.productions if (prod[0], tuple(prod[1])) not in removed_keys]
+        self.productions.extend(added)
+        self.index_symbols()
+        if self.production_numbers is not None:
+            self.number_productions()
+        return added_lhs | {lhs for lhs, _ in removed_keys}
+
     def number_productions(self):
         """Assigns a unique number to each production in the grammar."""
         self.production_numbers = {}
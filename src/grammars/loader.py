@@ -0,0 +1,368 @@
+"""Loader for grammar files.
+
+A grammar file lists productions one rule per line, with optional symbol declarations:
+
+    # Arithmetic expressions
+    %start E
+    %token + * ( ) id
+    E -> E + T
+       | T
+    T -> T * F | F
+    F -> ( E ) | id
+
+- `#` starts a comment that runs to the end of the line.
+- `A -> x y | z` defines the productions `A -> x y` and `A -> z`; a line starting with `|` adds
+  further alternatives to the previous rule, and a trailing `;` may close a rule.
+- An empty alternative, `ε` or `%empty` stands for the empty string.
+- `%token` declares terminals and `%nonterminal` declares non-terminals. Every symbol that appears
+  on a left-hand side is a non-terminal. When no `%token` declaration is present, all remaining
+  symbols are terminals; otherwise using an undeclared symbol is an error.
+- `%start` names the start symbol, which defaults to the left-hand side of the first rule.
+- `%left`, `%right` and `%nonassoc` declare terminals with a precedence and an associativity, as in
+  yacc; each line starts a new level that binds tighter than the previous ones. A production takes the
+  precedence of its last terminal, or of the terminal named by a trailing `%prec` in the alternative
+  (`E -> - E %prec UMINUS`). Shift/reduce conflicts are resolved with these declarations.
+- `error` is a terminal that yacc-style error productions such as `stmt -> error ';'` can use for
+  error recovery (see `src.parsers.recovery`); it needs no declaration.
+- Symbols that clash with the syntax (`|`, `;`, `#`, `->`) can be written in quotes, e.g. `'|'`.
+
+The whole text is processed in a single pass with dictionary and set lookups only, so loading
+is linear in the size of the file.
+"""
+
+# GLOBAL IMPORTS
+import json
+import re
+
+# LOCAL IMPORTS
+from src.grammars.context_free_grammar import ContextFreeGrammar
+
+EPSILON = 'ε'
+# The yacc error token; it is always a terminal and needs no declaration
+ERROR_TOKEN = 'error'
+
+_TOKEN = re.compile(r"""
+    \s*(?:
+        (?P<comment>\#.*)
+      | '(?P<single>[^']*)'
+      | "(?P<double>[^"]*)"
+      | (?P<arrow>->|→)
+      | (?P<bar>\|)
+      | (?P<semi>;)
+      | (?P<word>(?:[^\s|;'"\#-]|-(?!>))+)
+    )
+""", re.VERBOSE)
+
+
+class GrammarSyntaxError(ValueError):
+    """Raised when a grammar text cannot be loaded.
+
+    Attributes:
+        errors (List[Tuple[int, str]]): Every problem found, as `(line number, message)` pairs.
+            Line numbers start at 1; 0 is used for problems that concern the grammar as a whole.
+    """
+
+    def __init__(self, errors, source='<string>'):
+        """Initializes the error from the collected problems.
+
+        Args:
+            errors (List[Tuple[int, str]]): The `(line number, message)` pairs.
+            source (str, optional): Name of the grammar source used in the message.
+        """
+        self.errors = errors
+        self.source = source
+        super().__init__('\n'.join(
+            f"{source}:{line}: {message}" if line else f"{source}: {message}" for line, message in errors
+        ))
+
+
+def _tokenize(line):
+    """Splits one line into `(kind, text)` tokens, dropping whitespace and comments.
+
+    Returns:
+        Union[List[Tuple[str, str]], None]: The tokens, or None if the line contains a character
+        that cannot start a token (such as an unterminated quote).
+    """
+    tokens = []
+    pos = 0
+    line = line.rstrip()
+    while pos < len(line):
+        match = _TOKEN.match(line, pos)
+        if match is None or match.end() == pos:
+            return None
+        pos = match.end()
+        kind = match.lastgroup
+        if kind == 'comment':
+            break
+        if kind in ('single', 'double', 'word'):
+            tokens.append(('symbol', match.group(kind)))
+        else:
+            tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _GrammarBuilder:
+    """Accumulates declarations and productions while a grammar text is scanned."""
+
+    def __init__(self, source):
+        self.source = source
+        self.errors = []
+        self.terminals = {}
+        self.non_terminals = {}
+        self.productions = []
+        self.seen_productions = set()
+        self.symbol_lines = {}
+        self.start_symbol = None
+        self.start_line = 0
+        self.current_lhs = None
+        self.declared_tokens = False
+        self.precedence = {}
+        self.precedence_level = 0
+        self.precedence_lines = {}
+        self.production_precedence = {}
+        self.prec_uses = []
+
+    def error(self, line_no, message):
+        self.errors.append((line_no, message))
+
+    def directive(self, line_no, name, args):
+        handler = self.DIRECTIVES.get(name)
+        if handler is None:
+            self.error(line_no, f"unknown directive '{name}'")
+            return
+        handler(self, line_no, args)
+
+    def declare_tokens(self, line_no, args):
+        self.declared_tokens = True
+        for symbol in args:
+            if symbol in self.non_terminals:
+                self.error(line_no, f"'{symbol}' is declared as both a terminal and a non-terminal")
+            self.terminals.setdefault(symbol, line_no)
+
+    def declare_non_terminals(self, line_no, args):
+        for symbol in args:
+            self.add_non_terminal(line_no, symbol)
+
+    def declare_start(self, line_no, args):
+        if len(args) != 1:
+            self.error(line_no, "%start expects exactly one symbol")
+        elif self.start_symbol is not None:
+            self.error(line_no, f"start symbol already declared on line {self.start_line}")
+        else:
+            self.start_symbol = args[0]
+            self.start_line = line_no
+
+    def declare_precedence(self, line_no, args, associativity):
+        self.precedence_level += 1
+        for symbol in args:
+            if symbol in self.non_terminals:
+                self.error(line_no, f"'{symbol}' is a non-terminal and cannot have a precedence")
+            elif symbol in self.precedence:
+                self.error(line_no, f"precedence of '{symbol}' already declared "
+                                    f"on line {self.precedence_lines[symbol]}")
+            else:
+                self.terminals.setdefault(symbol, line_no)
+                self.precedence[symbol] = (self.precedence_level, associativity)
+                self.precedence_lines[symbol] = line_no
+
+    DIRECTIVES = {
+        '%token': declare_tokens,
+        '%term': declare_tokens,
+        '%nonterminal': declare_non_terminals,
+        '%nonterm': declare_non_terminals,
+        '%start': declare_start,
+        '%left': lambda self, line_no, args: self.declare_precedence(line_no, args, 'left'),
+        '%right': lambda self, line_no, args: self.declare_precedence(line_no, args, 'right'),
+        '%nonassoc': lambda self, line_no, args: self.declare_precedence(line_no, args, 'nonassoc'),
+    }
+
+    def add_non_terminal(self, line_no, symbol):
+        if symbol in self.terminals:
+            self.error(line_no, f"'{symbol}' is declared as both a terminal and a non-terminal")
+        self.non_terminals.setdefault(symbol, line_no)
+
+    def add_alternatives(self, line_no, tokens):
+        """Adds the `|`-separated alternatives in `tokens` to the current rule."""
+        alternative = []
+        prec = None
+        for idx, (kind, text) in enumerate(tokens):
+            if kind == 'symbol':
+                if prec == '%prec':
+                    prec = text
+                    self.prec_uses.append((line_no, text))
+                elif prec is not None:
+                    self.error(line_no, "%prec must end the alternative")
+                    return
+                elif text == '%prec':
+                    prec = text
+                elif text not in (EPSILON, '%empty'):
+                    alternative.append(text)
+                    self.symbol_lines.setdefault(text, line_no)
+                continue
+            if prec == '%prec':
+                self.error(line_no, "%prec expects a symbol")
+                return
+            if kind == 'bar':
+                self.add_production(line_no, alternative or [EPSILON], prec)
+                alternative = []
+                prec = None
+            elif kind == 'semi':
+                if idx != len(tokens) - 1:
+                    self.error(line_no, "unexpected input after ';'")
+                self.add_production(line_no, alternative or [EPSILON], prec)
+                self.current_lhs = None
+                return
+            else:
+                self.error(line_no, f"unexpected '{text}'")
+                return
+        if prec == '%prec':
+            self.error(line_no, "%prec expects a symbol")
+            return
+        self.add_production(line_no, alternative or [EPSILON], prec)
+
+    def add_production(self, line_no, rhs, prec=None):
+        key = (self.current_lhs, tuple(rhs))
+        if key in self.seen_productions:
+            self.error(line_no, f"duplicate production {self.current_lhs} -> {' '.join(rhs)}")
+            return
+        self.seen_productions.add(key)
+        self.productions.append((self.current_lhs, rhs))
+        if prec is not None:
+            self.production_precedence[key] = prec
+
+    def line(self, line_no, text):
+        tokens = _tokenize(text)
+        if tokens is None:
+            self.error(line_no, "unterminated quote or invalid character")
+            return
+        if not tokens:
+            return
+
+        kind, head = tokens[0]
+        if kind == 'symbol' and head.startswith('%') and head != '%empty':
+            args = [text for kind, text in tokens[1:] if kind == 'symbol']
+            if len(args) != len(tokens) - 1:
+                self.error(line_no, f"unexpected punctuation in {head} directive")
+            self.directive(line_no, head, args)
+        elif kind == 'bar':
+            if self.current_lhs is None:
+                self.error(line_no, "alternative '|' without a preceding rule")
+                return
+            self.add_alternatives(line_no, tokens[1:])
+        elif kind == 'symbol' and len(tokens) > 1 and tokens[1][0] == 'arrow':
+            self.current_lhs = head
+            self.add_non_terminal(line_no, head)
+            self.add_alternatives(line_no, tokens[2:])
+        else:
+            self.error(line_no, "expected a rule of the form 'A -> ...', an alternative '| ...' or a directive")
+
+    def grammar(self):
+        """Validates the collected rules and builds the grammar.
+
+        Raises:
+            GrammarSyntaxError: If any error was recorded.
+        """
+        if not self.productions:
+            self.error(0, "the grammar has no productions")
+        non_terminals = self.non_terminals
+        terminals = self.terminals
+        for symbol, line_no in self.symbol_lines.items():
+            if symbol in non_terminals or symbol in terminals:
+                continue
+            if self.declared_tokens and symbol != ERROR_TOKEN:
+                self.error(line_no, f"undefined symbol '{symbol}'")
+            else:
+                terminals[symbol] = line_no
+
+        for line_no, symbol in self.prec_uses:
+            if symbol not in self.precedence:
+                self.error(line_no, f"%prec {symbol}: no precedence declared for '{symbol}'")
+
+        lhs_symbols = {lhs for lhs, _ in self.productions}
+        for symbol, line_no in non_terminals.items():
+            if symbol not in lhs_symbols:
+                self.error(line_no, f"non-terminal '{symbol}' has no productions")
+
+        start_symbol = self.start_symbol
+        if start_symbol is None and self.productions:
+            start_symbol = self.productions[0][0]
+        elif start_symbol is not None and start_symbol not in non_terminals:
+            self.error(self.start_line, f"start symbol '{start_symbol}' is not a non-terminal")
+
+        if self.errors:
+            raise GrammarSyntaxError(sorted(self.errors), self.source)
+        return ContextFreeGrammar(list(terminals), list(non_terminals), self.productions, start_symbol,
+                                  self.precedence, self.production_precedence)
+
+
+def parse_grammar(text, terminals=None, non_terminals=None, start_symbol=None, source='<string>'):
+    """Builds a grammar from its textual definition.
+
+    Declarations passed as arguments behave like `%token`, `%nonterminal` and `%start` lines at the
+    top of the text.
+
+    Args:
+        text (str): The grammar text.
+        terminals (List[str], optional): Terminals to declare.
+        non_terminals (List[str], optional): Non-terminals to declare.
+        start_symbol (str, optional): The start symbol.
+        source (str, optional): Name of the source used in error messages.
+
+    Returns:
+        ContextFreeGrammar: The loaded grammar.
+
+    Raises:
+        GrammarSyntaxError: If the text contains errors; all of them are reported at once.
+    """
+    builder = _GrammarBuilder(source)
+    if terminals is not None:
+        builder.declare_tokens(0, terminals)
+    if non_terminals is not None:
+        builder.declare_non_terminals(0, non_terminals)
+    if start_symbol is not None:
+        builder.declare_start(0, [start_symbol])
+    for line_no, line in enumerate(text.splitlines(), 1):
+        builder.line(line_no, line)
+    return builder.grammar()
+
+
+def load_grammar(path):
+    """Loads a grammar file.
+
+    Files ending in `.json` hold an object with the keys `terminals`, `non_terminals`,
+    `start_symbol` and `productions` (each either a `[lhs, [rhs...]]` pair or a rule string such as
+    `"E -> E + T | T"`), and optionally `precedence`, a list of levels such as `["left", "+", "-"]`
+    from the loosest to the tightest; every other file is read in the grammar text format.
+
+    Args:
+        path (str): Path to the grammar file.
+
+    Returns:
+        ContextFreeGrammar: The loaded grammar.
+
+    Raises:
+        GrammarSyntaxError: If the file contains errors.
+    """
+    with open(path, encoding='utf-8') as file:
+        if not str(path).endswith('.json'):
+            return parse_grammar(file.read(), source=str(path))
+        try:
+            data = json.load(file)
+        except ValueError as e:
+            raise GrammarSyntaxError([(getattr(e, 'lineno', 0), str(e))], str(path)) from e
+
+    try:
+        rules = [' '.join([f"%{level[0]}"] + [f"'{symbol}'" for symbol in level[1:]])
+                 for level in data.get('precedence', [])]
+        for production in data['productions']:
+            if isinstance(production, str):
+                rules.append(production)
+            else:
+                lhs, rhs = production
+                rules.append(' '.join([f"'{lhs}'", '->'] + [f"'{symbol}'" for symbol in rhs]))
+        return parse_grammar('\n'.join(rules), data['terminals'], data['non_terminals'], data['start_symbol'],
+                             source=str(path))
+    except (KeyError, TypeError, ValueError) as e:
+        if isinstance(e, GrammarSyntaxError):
+            raise
+        raise GrammarSyntaxError([(0, f"invalid grammar file ({e})")], str(path)) from e
@@ -0,0 +1,148 @@
+"""Removal of useless symbols from a grammar before parser construction.
+
+A non-terminal is useless if it derives no terminal string (unproductive) or cannot be reached
+from the start symbol (unreachable); its productions only add items, closure work and GOTO columns.
+Terminals that no remaining production uses only add ACTION columns. Unproductive symbols are
+removed first, since removing them can make further symbols unreachable.
+"""
+
+
+class PruneReport:
+    """What `ContextFreeGrammar.prune` removed.
+
+    Attributes:
+        unproductive (List[str]): Non-terminals that derive no terminal string, in grammar order.
+        unreachable (List[str]): Productive non-terminals that cannot be reached from the start symbol.
+        terminals (List[str]): Terminals that no remaining production uses.
+        productions (List[Tuple[str, List[str]]]): The removed productions, in grammar order.
+        total_productions (int): The number of productions before pruning.
+    """
+
+    def __init__(self, unproductive, unreachable, terminals, productions, total_productions):
+        self.unproductive = unproductive
+        self.unreachable = unreachable
+        self.terminals = terminals
+        self.productions = productions
+        self.total_productions = total_productions
+
+    @property
+    def removed_share(self):
+        """float: The share of productions removed."""
+        return len(self.productions) / self.total_productions if self.total_productions else 0.0
+
+    def __bool__(self):
+        return bool(self.productions or self.terminals)
+
+    def as_dict(self):
+        """Returns the report as a JSON-serialisable dictionary."""
+        return {
+            'unproductive': self.unproductive,
+            'unreachable': self.unreachable,
+            'terminals': self.terminals,
+            'productions': [[lhs, list(rhs)] for lhs, rhs in self.productions],
+            'removed_share': self.removed_share,
+        }
+
+    def __str__(self):
+        return (f"removed {len(self.productions)} of {self.total_productions} productions "
+                f"({self.removed_share:.0%}); unproductive: {', '.join(self.unproductive) or '-'}; "
+                f"unreachable: {', '.join(self.unreachable) or '-'}; "
+                f"unused terminals: {', '.join(self.terminals) or '-'}")
+
+    def __repr__(self):
+        return (f"PruneReport(unproductive={self.unproductive}, unreachable={self.unreachable}, "
+                f"terminals={self.terminals}, productions={len(self.productions)})")
+
+
+def productive_non_terminals(grammar):
+    """Computes the non-terminals that derive a terminal string (possibly the empty one).
+
+    Args:
+        grammar (Grammar): The grammar to analyse.
+
+    Returns:
+        Set[str]: The productive non-terminals.
+    """
+    non_terminals = grammar.non_terminal_set
+    productive = set()
+    changed = True
+    while changed:
+        changed = False
+        for lhs, rhs in grammar.productions:
+            if lhs not in productive and all(symbol in productive or symbol not in non_terminals for symbol in rhs):
+                productive.add(lhs)
+                changed = True
+    return productive
+
+
+def reachable_symbols(grammar, productions, start_symbol):
+    """Computes the symbols reachable from `start_symbol` using only the given productions.
+
+    Args:
+        grammar (Grammar): The grammar the productions belong to.
+        productions (List[Tuple[str, List[str]]]): The productions to follow.
+        start_symbol (str): The symbol to start from.
+
+    Returns:
+        Set[str]: The reachable symbols, including `start_symbol`.
+    """
+    by_lhs = {}
+    for lhs, rhs in productions:
+        by_lhs.setdefault(lhs, []).append(rhs)
+    reachable = {start_symbol}
+    stack = [start_symbol]
+    while stack:
+        for rhs in by_lhs.get(stack.pop(), ()):
+            for symbol in rhs:
+                if symbol not in reachable and symbol != 'ε':
+                    reachable.add(symbol)
+                    if symbol in grammar.non_terminal_set:
+                        stack.append(symbol)
+    return reachable
+
+
+def prune(grammar):
+    """Removes the unproductive and unreachable non-terminals and the unused terminals in place.
+
+    Args:
+        grammar (Grammar): The grammar to prune; if it is augmented, the augmented start symbol is
+            the root of reachability.
+
+    Returns:
+        PruneReport: What was removed.
+
+    Raises:
+        ValueError: If the start symbol derives no terminal string, i.e. the language is empty.
+    """
+    start_symbol = grammar.augmented_start_symbol or grammar.start_symbol
+    productive = productive_non_terminals(grammar)
+    if start_symbol not in productive:
+        raise ValueError(f"The start symbol '{grammar.start_symbol}' derives no terminal string")
+
+    non_terminals = grammar.non_terminal_set
+    useful = [(lhs, rhs) for lhs, rhs in grammar.productions
+              if lhs in productive and all(symbol in productive or symbol not in non_terminals for symbol in rhs)]
+    reachable = reachable_symbols(grammar, useful, start_symbol)
+    kept = [(lhs, rhs) for lhs, rhs in useful if lhs in reachable]
+
+    kept_keys = {(lhs, tuple(rhs)) for lhs, rhs in kept}
+    report = PruneReport(
+        unproductive=[A for A in grammar.non_terminals if A not in productive],
+        unreachable=[A for A in grammar.non_terminals if A in productive and A not in reachable],
+        terminals=[t for t in grammar.terminals if t not in reachable],
+        productions=[prod for prod in grammar.productions if (prod[0], tuple(prod[1])) not in kept_keys],
+        total_productions=len(grammar.productions),
+    )
+    if not report:
+        return report
+
+    grammar.productions[:] = kept
+    grammar.non_terminals[:] = [A for A in grammar.non_terminals if A in reachable]
+    grammar.terminals[:] = [t for t in grammar.terminals if t in reachable]
+    for key in list(grammar.production_precedence):
+        if key not in kept_keys:
+            del grammar.production_precedence[key]
+    grammar.index_symbols()
+    if grammar.production_numbers is not None:
+        grammar.number_productions()
+    return report
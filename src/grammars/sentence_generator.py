@@ -0,0 +1,192 @@
+# GLOBAL IMPORTS
+import random
+
+
+class SentenceGenerator:
+    """Generates random sentences of a context-free grammar, for example as parser benchmark inputs.
+
+    Sentences are produced by a leftmost derivation on an explicit stack and streamed token by token,
+    so inputs of millions of tokens never have to be held in memory. The derivation aims at a target
+    length: while the tokens emitted so far plus the shortest completion of the pending symbols stay
+    below the target, productions are chosen at random by weight, preferring productions that lengthen
+    that shortest completion; once the target is reached, or a symbol lies deeper than `max_depth`,
+    every non-terminal is closed with its lowest derivation tree.
+
+    Attributes:
+        grammar (ContextFreeGrammar): The grammar to generate sentences for.
+        weights (dict): Production weights keyed by `(lhs, tuple(rhs))`; missing productions weigh 1.
+            Productions of weight 0 are only used to close the derivation.
+        max_depth (int): Derivation depth beyond which only closing productions are used, or None.
+        growth (float): Probability of choosing among the growing productions of a non-terminal while
+            the target length has not been reached.
+        height (Dict[str, float]): Height of the lowest derivation tree of each non-terminal
+            (`inf` for non-terminals that derive no terminal string).
+        closing_length (Dict[str, int]): Length of the sentence derived by always choosing the lowest tree.
+
+    Methods:
+        tokens(target_length):
+            Streams the tokens of one random sentence.
+        sentence(target_length):
+            Returns one random sentence as a list.
+        near_miss(target_length, parser):
+            Streams a random sentence with one token inserted or replaced so that it is rejected.
+    """
+
+    def __init__(self, grammar, weights=None, max_depth=None, growth=0.8, seed=None):
+        """Initializes the generator and precomputes the closing productions.
+
+        Args:
+            grammar (ContextFreeGrammar): The grammar to generate sentences for.
+            weights (dict, optional): Production weights keyed by `(lhs, tuple(rhs))`.
+            max_depth (int, optional): Maximum derivation depth at which random choices are made.
+            growth (float, optional): Preference for growing productions below the target length.
+            seed (int, optional): Seed for the random number generator.
+
+        Raises:
+            ValueError: If the start symbol derives no terminal string.
+        """
+        self.grammar = grammar
+        self.weights = weights or {}
+        self.max_depth = max_depth
+        self.growth = growth
+        self.random = random.Random(seed)
+
+        self._compute_heights()
+        if self.height[grammar.start_symbol] == float('inf'):
+            raise ValueError(f"The start symbol '{grammar.start_symbol}' derives no terminal string")
+        self._compute_choices()
+
+    def _symbols(self, rhs):
+        return [symbol for symbol in rhs if symbol != 'ε']
+
+    def _compute_heights(self):
+        non_terminals = self.grammar.non_terminal_set
+        self.height = {A: float('inf') for A in non_terminals}
+        self._closing = {}
+        changed = True
+        while changed:
+            changed = False
+            for lhs, rhs in self.grammar.productions:
+                height = 1 + max((self.height[s] for s in rhs if s in non_terminals), default=0)
+                if height < self.height[lhs]:
+                    self.height[lhs] = height
+                    self._closing[lhs] = self._symbols(rhs)
+                    changed = True
+
+        # The closing production's symbols are strictly lower, so lengths can be computed by height
+        self.closing_length = {}
+        for A in sorted(self._closing, key=self.height.get):
+            self.closing_length[A] = sum(self.closing_length[s] if s in non_terminals else 1
+                                         for s in self._closing[A])
+
+    def _compute_choices(self):
+        # Per non-terminal: (all productions, growing productions), each as (right-hand sides, weights).
+        # A production grows if it lengthens the shortest completion of the sentence.
+        self._choices = {}
+        for A, productions in self.grammar.productions_by_lhs.items():
+            usable = [rhs for _, rhs in productions if all(self.height.get(s, 0) < float('inf') for s in rhs)
+                      and self.weights.get((A, tuple(rhs)), 1) > 0]
+            growing = [rhs for rhs in usable
+                       if sum(self._length(s) for s in self._symbols(rhs)) > self.closing_length[A]]
+            self._choices[A] = tuple(
+                ([self._symbols(rhs) for rhs in group], [self.weights.get((A, tuple(rhs)), 1) for rhs in group])
+                for group in (usable, growing)
+            )
+
+    def _length(self, symbol):
+        return self.closing_length.get(symbol, 1)
+
+    def _choose(self, symbol, depth, budget):
+        if budget <= 0 or (self.max_depth is not None and depth >= self.max_depth):
+            return self._closing[symbol]
+        (usable, usable_weights), (growing, growing_weights) = self._choices[symbol]
+        if not usable:
+            return self._closing[symbol]
+        if growing and self.random.random() < self.growth:
+            return self.random.choices(growing, growing_weights)[0]
+        return self.random.choices(usable, usable_weights)[0]
+
+    def tokens(self, target_length):
+        """Streams the tokens of one random sentence of roughly `target_length` tokens.
+
+        The sentence is shorter if the grammar cannot derive long enough sentences, or if `max_depth`
+        stops the derivation from growing, and it may exceed the target by the shortest completion of
+        the last production chosen at random.
+
+        Args:
+            target_length (int): The desired number of tokens.
+
+        Yields:
+            str: The terminals of the sentence, from left to right.
+        """
+        non_terminals = self.grammar.non_terminal_set
+        start = self.grammar.start_symbol
+        stack = [(start, 0)]
+        pending = self.closing_length[start]
+        emitted = 0
+        while stack:
+            symbol, depth = stack.pop()
+            if symbol not in non_terminals:
+                emitted += 1
+                pending -= 1
+                yield symbol
+                continue
+            pending -= self.closing_length[symbol]
+            rhs = self._choose(symbol, depth, target_length - emitted - pending)
+            for child in reversed(rhs):
+                stack.append((child, depth + 1))
+                pending += self._length(child)
+
+    def sentence(self, target_length):
+        """Returns one random sentence of roughly `target_length` tokens (see `tokens`).
+
+        Args:
+            target_length (int): The desired number of tokens.
+
+        Returns:
+            List[str]: The sentence.
+        """
+        return list(self.tokens(target_length))
+
+    def near_miss(self, target_length, parser=None):
+        """Streams a random sentence with a single error, i.e. a near-miss invalid input.
+
+        At a random position, a terminal is inserted before the next token or replaces it. With a built
+        `parser`, the inserted terminal is one the parser rejects in its configuration at that point, so
+        the stream is guaranteed to be rejected (unless every terminal is acceptable at every later
+        position, in which case the sentence is left intact). Without a parser, the terminal is chosen
+        at random and the result is only likely to be invalid.
+
+        Args:
+            target_length (int): The desired number of tokens.
+            parser (LRParser, optional): A built parser for the same grammar.
+
+        Yields:
+            str: The tokens of the invalid stream.
+        """
+        terminals = [t for t in self.grammar.terminals if t != 'ε']
+        position = self.random.randrange(max(target_length, 1))
+        replace = self.random.random() < 0.5
+        stack = [0]
+        mutated = False
+
+        def invalid_terminal():
+            candidates = [t for t in terminals if parser.step(list(stack), t) is None]
+            return self.random.choice(candidates) if candidates else None
+
+        for index, token in enumerate(self.tokens(target_length)):
+            if not mutated and index >= position:
+                wrong = invalid_terminal() if parser is not None else self.random.choice(terminals)
+                if wrong is not None and wrong != token:
+                    mutated = True
+                    yield wrong
+                    if replace:
+                        continue
+            if parser is not None and not mutated:
+                parser.step(stack, token)
+            yield token
+
+        if not mutated:
+            wrong = invalid_terminal() if parser is not None else self.random.choice(terminals)
+            if wrong is not None:
+                yield wrong
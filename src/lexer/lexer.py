@@ -0,0 +1,456 @@
+"""Regex lexer that turns text into the terminal stream the parsers consume.
+
+Terminals are defined as literals (the terminal name is its own text, as in `+` or `if`) or as
+regular expressions (`id` as `[A-Za-z_]\\w*`). All definitions are compiled into one master pattern
+of named alternatives, ordered by priority, so most tokens cost a single `re` match. The rules are
+those of lex:
+
+- The longest match wins. Alternatives after the one that matched are only tried when one of them
+  could be longer, which for literals is known in advance.
+- Among matches of equal length, the higher priority wins, then literals before patterns, then the
+  definition that came first.
+- A literal that a pattern also matches in full (a keyword such as `if` matched by `id`) is not an
+  alternative of its own: the text the pattern matched is looked up among these literals instead.
+
+Sources can be `str`, `bytes`, a memory map, which is scanned in place, or a file object, which is
+read in chunks; a token is only emitted once `LOOKAHEAD` characters after it have been read, so
+tokens that span two chunks are completed first, and consumed text is dropped so memory use does
+not grow with the input. Spans are character offsets for text and byte offsets for binary input.
+"""
+
+# GLOBAL IMPORTS
+import mmap
+import re
+
+# LOCAL IMPORTS
+from src.grammars.loader import EPSILON, ERROR_TOKEN
+
+DEFAULT_IGNORE = r'\s+'
+CHUNK_SIZE = 1 << 16
+# Text kept after a token before it is emitted from a chunked source, since a pattern may have
+# matched less than it would with more input (`3` of `3.14`)
+LOOKAHEAD = 4096
+
+
+class LexError(ValueError):
+    """Raised when no terminal matches the input.
+
+    Attributes:
+        position (int): Offset of the first unmatched character (or byte) in the input.
+        line (int): Line of the unmatched character, starting at 1.
+        column (int): Column of the unmatched character, starting at 1.
+    """
+
+    def __init__(self, position, line, column, text):
+        """Initializes the error.
+
+        Args:
+            position (int): Offset of the unmatched input.
+            line (int): Line of the unmatched input.
+            column (int): Column of the unmatched input.
+            text (Union[str, bytes]): The input at the unmatched position, used in the message.
+        """
+        self.position = position
+        self.line = line
+        self.column = column
+        self.text = text
+        super().__init__(f"{line}:{column}: no terminal matches {text!r}")
+
+    def __reduce__(self):
+        # Rebuild from the constructor arguments, e.g. when the error crosses a process boundary
+        return LexError, (self.position, self.line, self.column, self.text)
+
+
+class Token:
+    """A terminal found in the input.
+
+    Attributes:
+        terminal (str): The terminal, as used in the grammar and the parsing tables.
+        start (int): Offset of the first character (or byte) of the token.
+        end (int): Offset just past the token.
+        text (Union[str, bytes]): The matched text.
+    """
+
+    def __init__(self, terminal, start, end, text):
+        self.terminal = terminal
+        self.start = start
+        self.end = end
+        self.text = text
+
+    def __eq__(self, other):
+        return (isinstance(other, Token) and (self.terminal, self.start, self.end, self.text)
+                == (other.terminal, other.start, other.end, other.text))
+
+    def __repr__(self):
+        return f"Token({self.terminal!r}, {self.start}, {self.end}, {self.text!r})"
+
+
+class _Rule:
+    """One alternative of the master pattern."""
+
+    def __init__(self, terminal, source, priority, literal, order):
+        self.terminal = terminal
+        self.source = source
+        self.priority = priority
+        self.literal = literal
+        self.order = order
+        # Literals this pattern matches in full, by text
+        self.keywords = {}
+
+
+class _Compiled:
+    """The master pattern and its lookup tables for one input type (`str` or `bytes`)."""
+
+    def __init__(self, rules, encode):
+        self.rules = rules
+        self.encode = encode
+        self.sources = [encode(rule.source) for rule in rules]
+        self.names = {f'_{index}': index for index in range(len(rules))}
+        self.master = self.alternation(0)
+        self.keywords = [{encode(text): terminal for text, terminal in rule.keywords.items()} or None
+                         for rule in rules]
+        # The longest match a later alternative can produce: unbounded if a pattern follows
+        self.longer_possible = [0] * len(rules)
+        longest = 0
+        for index in range(len(rules) - 1, -1, -1):
+            self.longer_possible[index] = longest
+            if rules[index].literal:
+                longest = max(longest, len(encode(rules[index].terminal)))
+            else:
+                longest = float('inf')
+        self.continuations = {}
+
+    def alternation(self, first):
+        """Compiles the alternatives from `first` on into one pattern."""
+        if first >= len(self.rules):
+            return re.compile(self.encode('(?!)'))
+        return re.compile(self.encode('|').join(
+            self.encode(f'(?P<_{index}>') + self.sources[index] + self.encode(')')
+            for index in range(first, len(self.rules))
+        ))
+
+    def continuation(self, index):
+        """Returns the pattern of the alternatives after `index`, compiled on first use."""
+        pattern = self.continuations.get(index)
+        if pattern is None:
+            pattern = self.continuations[index] = self.alternation(index + 1)
+        return pattern
+
+    def longest(self, buffer, pos):
+        """Returns `(rule index, end)` of the longest match at `pos`, or None."""
+        match = self.master.match(buffer, pos)
+        if match is None:
+            return None
+        best = index = self.names[match.lastgroup]
+        end = match.end()
+        while end - pos < self.longer_possible[index]:
+            match = self.continuation(index).match(buffer, pos)
+            if match is None:
+                break
+            index = self.names[match.lastgroup]
+            if match.end() > end:
+                best, end = index, match.end()
+        return best, end
+
+
+def _read_chunks(source, chunk_size):
+    """Yields the non-empty chunks of a `str`, `bytes` or file source; a memory map is one chunk."""
+    if isinstance(source, (str, bytes, mmap.mmap)):
+        if source:
+            yield source
+        return
+    while True:
+        chunk = source.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+class Lexer:
+    """Splits text into terminals with one compiled master pattern.
+
+    Attributes:
+        literals (List[str]): The terminals matched by their own text.
+        patterns (Dict[str, str]): The terminals matched by a regular expression, with the expression.
+        ignore (str): The regular expression for text between tokens, such as whitespace and comments,
+            or None.
+        priorities (Dict[str, int]): Priorities that break ties between matches of equal length;
+            terminals default to 0.
+
+    Methods:
+        for_grammar(grammar, patterns, ignore, priorities):
+            Creates a lexer for the terminals of a grammar.
+        tokens(source, chunk_size):
+            Yields the tokens of a source, with their spans and text.
+        terminals(source, chunk_size):
+            Yields only the terminals of a source, ready for `LRParser.recognize`.
+        spans(source, chunk_size):
+            Yields the terminals of a source with `(offset, length)` spans.
+        next_token(buffer, pos, allowed):
+            Finds the next token, trying only the terminals a parser state allows.
+        alternatives(allowed):
+            Returns the size of the master pattern for a set of terminals.
+    """
+
+    def __init__(self, literals=(), patterns=None, ignore=DEFAULT_IGNORE, priorities=None):
+        """Compiles the terminal definitions.
+
+        Args:
+            literals (Iterable[str], optional): Terminals matched by their own text.
+            patterns (Dict[str, str], optional): Terminals matched by a regular expression.
+            ignore (str, optional): Regular expression for text to skip; None skips nothing.
+            priorities (Dict[str, int], optional): Tie-breaking priorities by terminal.
+
+        Raises:
+            ValueError: If a terminal is defined twice, or a regular expression is invalid or
+                matches the empty string.
+        """
+        self.literals = list(literals)
+        self.patterns = dict(patterns or {})
+        self.ignore = ignore
+        self.priorities = dict(priorities or {})
+
+        duplicates = (set(self.literals) & self.patterns.keys()) | {
+            terminal for terminal in self.literals if self.literals.count(terminal) > 1}
+        if duplicates:
+            raise ValueError(f"Terminals defined more than once: {', '.join(sorted(duplicates))}")
+        for literal in self.literals:
+            if not literal:
+                raise ValueError("A literal terminal cannot be empty")
+
+        for terminal, source in self.patterns.items():
+            self._check_pattern(terminal, source)
+        if ignore is not None:
+            self._check_pattern('ignore', ignore)
+        if not self.literals and not self.patterns and ignore is None:
+            raise ValueError("A lexer needs at least one terminal definition")
+        # Master patterns by input type and, for state-aware lexing, by the set of allowed terminals
+        self._compiled = {}
+
+    def _rules(self, allowed=None):
+        """Orders the alternatives of the master pattern for all terminals or only the allowed ones.
+
+        A pattern that is not allowed is kept if it carries allowed keywords, since one pattern is
+        cheaper to try than the keywords as literals; text it matches that is not an allowed keyword
+        keeps the pattern's terminal, which the parser then rejects.
+        """
+        rules = [_Rule(terminal, re.escape(terminal), self.priorities.get(terminal, 0), True, order)
+                 for order, terminal in enumerate(self.literals)]
+        rules += [_Rule(terminal, source, self.priorities.get(terminal, 0), False, len(rules) + order)
+                  for order, (terminal, source) in enumerate(self.patterns.items())]
+        rules.sort(key=lambda rule: (-rule.priority, not rule.literal, -len(rule.terminal) if rule.literal else 0,
+                                     rule.order))
+
+        # A literal that a pattern matches in full is found through that pattern, if it would win the tie
+        compiled = {rule.terminal: re.compile(rule.source) for rule in rules if not rule.literal}
+        reserved = set()
+        for rule in rules:
+            if not rule.literal:
+                continue
+            for candidate in rules:
+                if not candidate.literal and compiled[candidate.terminal].fullmatch(rule.terminal):
+                    if candidate.priority <= rule.priority:
+                        reserved.add(rule.terminal)
+                        if allowed is None or rule.terminal in allowed:
+                            candidate.keywords[rule.terminal] = rule.terminal
+                    break
+        rules = [rule for rule in rules
+                 if (allowed is None or rule.terminal in allowed or rule.keywords)
+                 and not (rule.literal and rule.terminal in reserved)]
+        if self.ignore is not None:
+            rules.append(_Rule(None, self.ignore, float('-inf'), False, len(rules)))
+        return rules
+
+    @staticmethod
+    def _check_pattern(terminal, source):
+        try:
+            pattern = re.compile(source)
+        except re.error as e:
+            raise ValueError(f"Invalid pattern for '{terminal}': {e}") from e
+        if pattern.match('') is not None:
+            raise ValueError(f"The pattern for '{terminal}' matches the empty string")
+
+    @classmethod
+    def for_grammar(cls, grammar, patterns=None, ignore=DEFAULT_IGNORE, priorities=None):
+        """Creates a lexer for the terminals of a grammar.
+
+        Terminals without a pattern are literals; `ε`, `$` and the `error` terminal are not lexed.
+
+        Args:
+            grammar (Grammar): The grammar whose terminals are recognised.
+            patterns (Dict[str, str], optional): Regular expressions for some of the terminals.
+            ignore (str, optional): Regular expression for text to skip.
+            priorities (Dict[str, int], optional): Tie-breaking priorities by terminal.
+
+        Returns:
+            Lexer: The lexer.
+
+        Raises:
+            ValueError: If a pattern is given for a symbol that is not a terminal of the grammar.
+        """
+        patterns = dict(patterns or {})
+        unknown = [terminal for terminal in patterns if terminal not in grammar.terminal_set]
+        if unknown:
+            raise ValueError(f"Patterns for symbols that are not terminals: {', '.join(unknown)}")
+        literals = [t for t in grammar.terminals if t not in patterns and t not in (EPSILON, ERROR_TOKEN, '$')]
+        return cls(literals, patterns, ignore, priorities)
+
+    def _compiled_for(self, chunk, allowed=None):
+        kind = str if isinstance(chunk, str) else bytes
+        compiled = self._compiled.get((kind, allowed))
+        if compiled is None:
+            encode = (lambda text: text) if kind is str else (lambda text: text.encode('utf-8'))
+            compiled = self._compiled[(kind, allowed)] = _Compiled(self._rules(allowed), encode)
+        return compiled
+
+    @staticmethod
+    def _advance_line(buffer, pos, offset, newline, line, line_start):
+        last = buffer.rfind(newline, 0, pos)
+        if last < 0:
+            return line, line_start
+        if isinstance(buffer, mmap.mmap):
+            # Memory maps cannot count; copy one chunk at a time instead of the whole prefix
+            lines = sum(buffer[start:min(start + CHUNK_SIZE, pos)].count(newline)
+                        for start in range(0, pos, CHUNK_SIZE))
+        else:
+            lines = buffer.count(newline, 0, pos)
+        return line + lines, offset + last + 1
+
+    def _scan(self, source, chunk_size, text=True):
+        """Yields `(terminal, start, end, text)` for every token of a source; the text is None unless
+        requested."""
+        chunks = _read_chunks(source, chunk_size)
+        buffer = next(chunks, None)
+        if buffer is None:
+            return
+        compiled = self._compiled_for(buffer)
+        rules, keywords, longest = compiled.rules, compiled.keywords, compiled.longest
+        newline = compiled.encode('\n')
+        following = next(chunks, None)
+        offset = pos = 0
+        # Line number and line start of the text already dropped from the buffer, for error positions
+        line, line_start = 1, 0
+        while True:
+            if pos == len(buffer) and following is None:
+                return
+            found = longest(buffer, pos)
+            if following is not None and (found is None or len(buffer) - found[1] < LOOKAHEAD):
+                # The token may continue in the next chunk
+                line, line_start = self._advance_line(buffer, pos, offset, newline, line, line_start)
+                buffer = buffer[pos:] + following
+                offset += pos
+                pos = 0
+                following = next(chunks, None)
+                continue
+            if found is None:
+                line, line_start = self._advance_line(buffer, pos, offset, newline, line, line_start)
+                raise LexError(offset + pos, line, offset + pos - line_start + 1, buffer[pos:pos + 20])
+            index, end = found
+            terminal = rules[index].terminal
+            if terminal is not None:
+                if keywords[index] is not None:
+                    terminal = keywords[index].get(buffer[pos:end], terminal)
+                yield terminal, offset + pos, offset + end, buffer[pos:end] if text else None
+            pos = end
+
+    def alternatives(self, allowed=None):
+        """Returns the number of alternatives in the master pattern for a set of terminals.
+
+        Args:
+            allowed (FrozenSet[str], optional): The terminals to recognise; all of them by default.
+
+        Returns:
+            int: The number of alternatives, including the one for ignored text.
+        """
+        return len(self._compiled_for('', allowed).rules)
+
+    def next_token(self, buffer, pos, allowed=None):
+        """Finds the next token in a buffer, skipping ignored text.
+
+        With `allowed`, only those terminals are tried, using a master pattern compiled for that set,
+        so a keyword that is not allowed is read as the pattern that also matches it (`if` as `id`).
+        If none of them matches, the token is read with all terminals, so that the caller sees it as
+        a syntax error rather than a lexical one.
+
+        Args:
+            buffer (Union[str, bytes, mmap]): The whole input.
+            pos (int): The position to start at.
+            allowed (FrozenSet[str], optional): The terminals that are acceptable at this point.
+
+        Returns:
+            Union[Tuple[str, int, int], None]: The terminal, its start and its end, or None at the end
+                of the input.
+
+        Raises:
+            LexError: If no terminal matches at some position.
+        """
+        compiled = self._compiled_for(buffer, allowed)
+        while pos < len(buffer):
+            found = compiled.longest(buffer, pos)
+            if found is None and allowed is not None:
+                # Nothing acceptable matches: read the token with every terminal for the syntax error
+                return self.next_token(buffer, pos)
+            if found is None:
+                line, line_start = self._advance_line(buffer, pos, 0, compiled.encode('\n'), 1, 0)
+                raise LexError(pos, line, pos - line_start + 1, buffer[pos:pos + 20])
+            if compiled.rules[found[0]].terminal is not None:
+                return self._token(compiled, buffer, pos, found)
+            pos = found[1]
+        return None
+
+    @staticmethod
+    def _token(compiled, buffer, pos, found):
+        index, end = found
+        terminal = compiled.rules[index].terminal
+        if compiled.keywords[index] is not None:
+            terminal = compiled.keywords[index].get(buffer[pos:end], terminal)
+        return terminal, pos, end
+
+    def tokens(self, source, chunk_size=CHUNK_SIZE):
+        """Yields the tokens of a source lazily.
+
+        Args:
+            source (Union[str, bytes, IO]): The text, or a text or binary file object read in chunks.
+            chunk_size (int, optional): Characters (or bytes) read from a file at a time.
+
+        Yields:
+            Token: The next token; ignored text is skipped.
+
+        Raises:
+            LexError: If no terminal matches at some position.
+        """
+        for terminal, start, end, text in self._scan(source, chunk_size):
+            yield Token(terminal, start, end, text)
+
+    def terminals(self, source, chunk_size=CHUNK_SIZE):
+        """Yields the terminals of a source lazily, e.g. `parser.recognize(lexer.terminals(file))`.
+
+        Args:
+            source (Union[str, bytes, IO]): The text, or a text or binary file object read in chunks.
+            chunk_size (int, optional): Characters (or bytes) read from a file at a time.
+
+        Yields:
+            str: The next terminal.
+
+        Raises:
+            LexError: If no terminal matches at some position.
+        """
+        for terminal, _, _, _ in self._scan(source, chunk_size, text=False):
+            yield terminal
+
+    def spans(self, source, chunk_size=CHUNK_SIZE):
+        """Yields the terminals of a source with `(offset, length)` spans instead of copied text.
+
+        Args:
+            source (Union[str, bytes, mmap, IO]): The text, a memory map scanned in place (see
+                `src.lexer.mapped`), or a file object read in chunks.
+            chunk_size (int, optional): Characters (or bytes) read from a file at a time.
+
+        Yields:
+            Tuple[str, int, int]: The terminal, the offset of the token and its length.
+
+        Raises:
+            LexError: If no terminal matches at some position.
+        """
+        for terminal, start, end, _ in self._scan(source, chunk_size, text=False):
+            yield terminal, start, end - start
@@ -0,0 +1,122 @@
+"""Lexing and parsing of files too large to read into memory.
+
+`map_file` memory-maps a file read-only, and the lexer scans the map in place: tokens are reported
+as `(offset, length)` spans and only the terminals reach the parse driver, which keeps nothing but
+its state stack. Memory use therefore stays flat however large the file is, with the pages of the
+map managed by the operating system.
+
+In contextual mode the driver hands the lexer the terminals that the state on top of the stack has
+ACTION entries for, and the lexer matches only those, with a master pattern compiled once per
+distinct set. Fewer alternatives are tried per token, and a keyword the grammar does not allow at
+that point is read as the pattern that also matches it, e.g. as an identifier.
+"""
+
+# GLOBAL IMPORTS
+import contextlib
+import mmap
+import os
+
+# LOCAL IMPORTS
+from src.grammars.loader import ERROR_TOKEN
+
+
+class FileParseResult:
+    """The outcome of parsing a memory-mapped file.
+
+    Attributes:
+        accepted (bool): Whether the file is accepted.
+        tokens (int): Number of tokens consumed before the parse ended.
+        error (Tuple[int, int]): The `(offset, length)` span of the token that was rejected, `(size, 0)`
+            for the end of the file, or None if the file was accepted.
+        alternatives (int): The number of master-pattern alternatives offered to the regex engine for
+            the tokens, a measure of the matching work that contextual lexing reduces.
+    """
+
+    def __init__(self, accepted, tokens, error=None, alternatives=0):
+        self.accepted = accepted
+        self.tokens = tokens
+        self.error = error
+        self.alternatives = alternatives
+
+    def __bool__(self):
+        return self.accepted
+
+    def __repr__(self):
+        return f"FileParseResult(accepted={self.accepted}, tokens={self.tokens}, error={self.error})"
+
+
+@contextlib.contextmanager
+def map_file(path):
+    """Memory-maps a file read-only for sequential scanning.
+
+    Args:
+        path (str): The file to map.
+
+    Yields:
+        Union[mmap, bytes]: The map, or empty bytes for an empty file, which cannot be mapped.
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b''
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+            yield buffer
+
+
+def parse_file(parser, lexer, path, contextual=False):
+    """Lexes a memory-mapped file and parses its terminals as they are found.
+
+    Args:
+        parser (Union[LRParser, CompiledParser]): A parser with built tables (or a lazy one).
+        lexer (Lexer): The lexer for the parser's terminals.
+        path (str): The file to parse.
+        contextual (bool, optional): Let the lexer try only the terminals the current state allows.
+
+    Returns:
+        FileParseResult: Whether the file is accepted and, if not, where it was rejected.
+
+    Raises:
+        LexError: If no terminal matches at some position of the file.
+    """
+    with map_file(path) as buffer:
+        if contextual:
+            return _parse_contextual(parser, lexer, buffer)
+        step = parser.step
+        stack = [0]
+        tokens = 0
+        for terminal, offset, length in lexer.spans(buffer):
+            if step(stack, terminal) is None:
+                return FileParseResult(False, tokens, (offset, length), tokens * lexer.alternatives())
+            tokens += 1
+        alternatives = tokens * lexer.alternatives()
+        action = step(stack, '$')
+        if action is None or action[0] != 'accept':
+            return FileParseResult(False, tokens, (len(buffer), 0), alternatives)
+    return FileParseResult(True, tokens, alternatives=alternatives)
+
+
+def _parse_contextual(parser, lexer, buffer):
+    step = parser.step
+    next_token = lexer.next_token
+    # The allowed terminals and the size of their master pattern, by state
+    allowed_by_state = {}
+    stack = [0]
+    tokens = alternatives = pos = 0
+    while True:
+        state = stack[-1]
+        allowed = allowed_by_state.get(state)
+        if allowed is None:
+            terminals = parser.valid_terminals(state) - {'$', ERROR_TOKEN}
+            allowed = allowed_by_state[state] = (terminals, lexer.alternatives(terminals))
+        found = next_token(buffer, pos, allowed[0])
+        if found is None:
+            action = step(stack, '$')
+            accepted = action is not None and action[0] == 'accept'
+            return FileParseResult(accepted, tokens, None if accepted else (len(buffer), 0), alternatives)
+        terminal, start, pos = found
+        alternatives += allowed[1]
+        if step(stack, terminal) is None:
+            return FileParseResult(False, tokens, (start, pos - start), alternatives)
+        tokens += 1
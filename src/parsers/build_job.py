@@ -0,0 +1,139 @@
+# GLOBAL IMPORTS
+import threading
+import time
+
+# LOCAL IMPORTS
+from src.parsers.parser_types import get_parser_class
+
+
+class BuildCancelled(Exception):
+    """Raised inside a build thread to abort the construction when the job is cancelled."""
+
+
+class BuildTimedOut(BuildCancelled):
+    """Raised inside a build thread to abort the construction when the job exceeds its timeout."""
+
+
+class BuildJob:
+    """Builds a parser in a background thread, reporting progress and supporting cancellation.
+
+    The canonical collection is constructed with a progress callback that records the number of
+    states discovered and the length of the work queue. The same callback checks for cancellation
+    and for the timeout, so an abandoned build stops at the next expanded state. The table
+    construction checks them again after the collection is complete, after the LALR(1) merge and
+    after the rows of each state.
+
+    Attributes:
+        grammar (ContextFreeGrammar): The grammar to build the parser for.
+        parser_type (str): The display name or alias of the parser type.
+        timeout (float): Maximum build time in seconds, or None for no limit.
+        status (str): One of `'pending'`, `'running'`, `'done'`, `'cancelled'`, `'timed out'` or `'failed'`.
+        phase (str): The construction phase currently running (`'items'` or `'table'`).
+        states_discovered (int): Number of states discovered so far.
+        queue_length (int): Number of discovered states that have not been expanded yet.
+        parser (LRParser): The built parser, once `status` is `'done'`.
+        error (Exception): The exception that ended a failed build.
+    """
+
+    def __init__(self, grammar, parser_type, timeout=None):
+        """Initializes the job without starting it.
+
+        Args:
+            grammar (ContextFreeGrammar): The grammar to build the parser for.
+            parser_type (str): The display name or alias of the parser type.
+            timeout (float, optional): Maximum build time in seconds. Defaults to no limit.
+        """
+        self.grammar = grammar
+        self.parser_type = parser_type
+        self.timeout = timeout
+        self.status = 'pending'
+        self.phase = None
+        self.states_discovered = 0
+        self.queue_length = 0
+        self.parser = None
+        self.error = None
+        self.started_at = None
+        self.finished_at = None
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Starts the build in a daemon thread.
+
+        Returns:
+            BuildJob: The job itself, for chaining.
+        """
+        self.status = 'running'
+        self.started_at = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name=f"build-{self.parser_type}", daemon=True)
+        self._thread.start()
+        return self
+
+    def cancel(self):
+        """Requests cancellation; the build stops after the state it is currently expanding or filling in."""
+        self._cancel.set()
+
+    def wait(self, timeout=None):
+        """Blocks until the build finishes or `timeout` seconds elapse.
+
+        Returns:
+            bool: True if the build has finished.
+        """
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.finished
+
+    @property
+    def finished(self):
+        """bool: True once the build has ended, successfully or not."""
+        return self.status not in ('pending', 'running')
+
+    @property
+    def elapsed(self):
+        """float: Seconds spent on the build so far."""
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def fraction_done(self):
+        """float: Share of the discovered states that have already been expanded, between 0 and 1."""
+        if self.status == 'done':
+            return 1.0
+        if self.states_discovered == 0:
+            return 0.0
+        return (self.states_discovered - self.queue_length) / self.states_discovered
+
+    def _check(self):
+        if self._cancel.is_set():
+            raise BuildCancelled()
+        if self.timeout is not None and time.monotonic() - self.started_at > self.timeout:
+            raise BuildTimedOut()
+
+    def _run(self):
+        self.phase = 'items'
+        try:
+            parser = get_parser_class(self.parser_type)(self.grammar)
+            parser.items(self._on_progress)
+            self.phase = 'table'
+            self._check()
+            parser.construct_parsing_table(self._on_table_progress)
+            self.parser = parser
+            self.status = 'done'
+        except BuildTimedOut:
+            self.status = 'timed out'
+        except BuildCancelled:
+            self.status = 'cancelled'
+        except Exception as e:
+            self.error = e
+            self.status = 'failed'
+        finally:
+            self.finished_at = time.monotonic()
+
+    def _on_progress(self, states_discovered, queue_length):
+        self.states_discovered = states_discovered
+        self.queue_length = queue_length
+        self._check()
+
+    def _on_table_progress(self, rows_built, n_states):
+        self._check()
@@ -0,0 +1,255 @@
+"""Immutable runtime form of a constructed LR parser.
+
+An `LRParser` keeps everything its construction needed: the canonical collection `C`, the `states`
+dictionary keyed by item sets, the transitions and the grammar with its FIRST sets. For an LR(1)
+parser of a large grammar that is most of its memory, and none of it is needed to parse.
+`LRParser.compile()` copies the tables into a `CompiledParser`, which holds only flat, read-only
+integer tables and the production metadata, so the builder and its item sets can be garbage
+collected as soon as the caller drops them.
+
+A `CompiledParser` cannot be modified after it is created, and its drivers keep their state in the
+caller's stack, so one instance can be shared by any number of threads without locking.
+"""
+
+# GLOBAL IMPORTS
+from types import MappingProxyType
+
+# LOCAL IMPORTS
+from src.lexer.mapped import parse_file
+from src.parsers.recovery import ErrorRecovery, recover
+from src.parsers.tables import ERROR, EncodedTables, NO_GOTO
+
+
+class CompiledParser:
+    """The tables of an LR parser, frozen and detached from its construction data.
+
+    The ACTION and GOTO tables are stored row-major in read-only `memoryview`s of native `int32`
+    values, encoded as in `EncodedTables`. State numbers are those of the parser it was compiled from.
+    Unit shortcuts are not carried over.
+
+    Attributes:
+        parser_type (str): The class name of the parser it was compiled from, e.g. `LALR1Parser`.
+        start_symbol (str): The start symbol of the grammar.
+        terminals (Tuple[str, ...]): The ACTION columns, the grammar terminals followed by `$`.
+        non_terminals (Tuple[str, ...]): The GOTO columns.
+        productions (Tuple[Tuple[str, Tuple[str, ...]], ...]): The productions of the augmented
+            grammar, indexed by number.
+        n_states (int): Number of states.
+
+    Methods:
+        from_parser(parser):
+            Compiles a constructed parser.
+        action_for(state, terminal):
+            Returns an ACTION entry in the tuple form of `LRParser.action`.
+        goto(state, non_terminal):
+            Returns a GOTO entry.
+        valid_terminals(state):
+            Returns the terminals a state has actions for.
+        step(stack, token):
+            Advances a parse stack over one input token.
+        recognize(tokens):
+            Checks whether a token stream is accepted.
+        diagnose(tokens, recovery):
+            Reports every syntax error of a token stream, recovering after each one.
+        parse_file(path, lexer, contextual):
+            Lexes and parses a memory-mapped file with flat memory use.
+    """
+
+    __slots__ = ('parser_type', 'start_symbol', 'terminals', 'non_terminals', 'productions', 'n_states',
+                 '_action', '_goto', '_terminal_index', '_non_terminal_index', '_reductions', '_shifts',
+                 '_valid_terminals')
+
+    def __init__(self, parser_type, start_symbol, tables):
+        """Initializes the compiled parser from encoded tables.
+
+        Args:
+            parser_type (str): The class name of the parser the tables come from.
+            start_symbol (str): The start symbol of the grammar.
+            tables (EncodedTables): The encoded ACTION and GOTO tables; they are copied.
+        """
+        terminals = tuple(tables.terminals)
+        non_terminals = tuple(tables.non_terminals)
+        productions = tuple((lhs, tuple(rhs)) for lhs, rhs in tables.productions)
+        non_terminal_index = {A: index for index, A in enumerate(non_terminals)}
+        # Memoryviews of bytes are read-only
+        action = memoryview(tables.action_bytes()).cast('i')
+        n_states = tables.n_states
+        width = len(terminals)
+
+        # Interned, so that states with the same terminals share one set (and one lexer pattern)
+        interned = {}
+        valid_terminals = []
+        for state in range(n_states):
+            row = action[state * width:(state + 1) * width]
+            valid = frozenset(t for t, code in zip(terminals, row) if code != ERROR)
+            valid_terminals.append(interned.setdefault(valid, valid))
+
+        values = {
+            'parser_type': parser_type,
+            'start_symbol': start_symbol,
+            'terminals': terminals,
+            'non_terminals': non_terminals,
+            'productions': productions,
+            'n_states': n_states,
+            '_action': action,
+            '_goto': memoryview(tables.goto_bytes()).cast('i'),
+            '_terminal_index': MappingProxyType({t: index for index, t in enumerate(terminals)}),
+            '_non_terminal_index': MappingProxyType(non_terminal_index),
+            # (GOTO column of the left-hand side, number of symbols popped) by production number
+            '_reductions': tuple((non_terminal_index.get(lhs, NO_GOTO), 0 if rhs == ('ε',) else len(rhs))
+                                 for lhs, rhs in productions),
+            '_shifts': tuple(('shift', state) for state in range(n_states)),
+            '_valid_terminals': tuple(valid_terminals),
+        }
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    @classmethod
+    def from_parser(cls, parser):
+        """Compiles a constructed parser; a lazy parser first builds its remaining states.
+
+        Args:
+            parser (LRParser): The parser.
+
+        Returns:
+            CompiledParser: The compiled parser, which keeps no reference to `parser`.
+        """
+        if parser.lazy:
+            parser.finish_build()
+        return cls(type(parser).__name__, parser.grammar.start_symbol, EncodedTables.from_parser(parser))
+
+    def action_for(self, state, terminal):
+        """Returns the ACTION entry of a state and terminal.
+
+        Args:
+            state (int): The state.
+            terminal (str): The terminal, or `$`.
+
+        Returns:
+            Union[Tuple, None]: `('shift', state)`, `('reduce', lhs, rhs)` or `('accept',)` as in
+                `LRParser.action`, or None for an error entry.
+        """
+        column = self._terminal_index.get(terminal)
+        if column is None:
+            return None
+        code = self._action[state * len(self.terminals) + column]
+        if code == ERROR:
+            return None
+        if code > 0:
+            return self._shifts[code - 1]
+        if code == -1:
+            return ('accept',)
+        lhs, rhs = self.productions[-code - 1]
+        return ('reduce', lhs, list(rhs))
+
+    def goto(self, state, non_terminal):
+        """Returns the GOTO entry of a state and non-terminal, or None if it is empty."""
+        column = self._non_terminal_index.get(non_terminal)
+        if column is None:
+            return None
+        target = self._goto[state * len(self.non_terminals) + column]
+        return None if target == NO_GOTO else target
+
+    def valid_terminals(self, state):
+        """Returns the terminals with a non-error ACTION entry in a state (see
+        `LRParser.valid_terminals`).
+
+        Args:
+            state (int): The state on top of the stack.
+
+        Returns:
+            FrozenSet[str]: The terminals, including `$` if the state has an action on it.
+        """
+        return self._valid_terminals[state]
+
+    def step(self, stack, token):
+        """Advances a parse stack over one input token, as `LRParser.step` does.
+
+        Args:
+            stack (List[int]): The state stack, starting with `[0]`; modified in place.
+            token (str): The next input token, or `$` at the end of the input.
+
+        Returns:
+            Union[Tuple, None]: The `('shift', state)` or `('accept',)` action that consumed the token,
+                or None if the token is a syntax error.
+        """
+        column = self._terminal_index.get(token)
+        if column is None:
+            return None
+        action = self._action
+        goto = self._goto
+        reductions = self._reductions
+        width = len(self.terminals)
+        goto_width = len(self.non_terminals)
+        while True:
+            code = action[stack[-1] * width + column]
+            if code >= -1:
+                break
+            goto_column, length = reductions[-code - 1]
+            if length:
+                del stack[len(stack) - length:]
+            target = goto[stack[-1] * goto_width + goto_column]
+            if target == NO_GOTO:
+                return None
+            stack.append(target)
+        if code > 0:
+            stack.append(code - 1)
+            return self._shifts[code - 1]
+        if code == -1:
+            return ('accept',)
+        return None
+
+    def recognize(self, tokens):
+        """Checks whether a token stream is accepted.
+
+        Args:
+            tokens (Iterable[str]): The input tokens, without the end marker.
+
+        Returns:
+            bool: True if the input is accepted.
+        """
+        stack = [0]
+        step = self.step
+        for token in tokens:
+            if step(stack, token) is None:
+                return False
+        action = step(stack, '$')
+        return action is not None and action[0] == 'accept'
+
+    def diagnose(self, tokens, recovery=None):
+        """Parses a token sequence and reports every syntax error (see `LRParser.diagnose`).
+
+        Args:
+            tokens (Iterable[str]): The input tokens, without the end marker.
+            recovery (ErrorRecovery, optional): The recovery configuration.
+
+        Returns:
+            RecoveryResult: The diagnostics and whether the parse completed.
+        """
+        return recover(self, tokens, recovery or ErrorRecovery())
+
+    def parse_file(self, path, lexer, contextual=False):
+        """Parses a file of any size without reading it into memory (see `LRParser.parse_file`).
+
+        Args:
+            path (str): The file to parse.
+            lexer (Lexer): The lexer for the grammar's terminals.
+            contextual (bool, optional): Let the lexer try only the terminals the current state accepts.
+
+        Returns:
+            FileParseResult: Whether the file is accepted and, if not, the span of the rejected token.
+
+        Raises:
+            LexError: If no terminal matches at some position of the file.
+        """
+        return parse_file(self, lexer, path, contextual)
+
+    def __repr__(self):
+        return (f"CompiledParser({self.parser_type}, states={self.n_states}, terminals={len(self.terminals)}, "
+                f"productions={len(self.productions)})")
@@ -0,0 +1,97 @@
+"""Structured records of ACTION table conflicts.
+
+While the ACTION table is filled, every (state, terminal) entry that receives more than one action
+is recorded once as a `Conflict`, together with the items responsible for the competing actions.
+The table keeps a single action per entry, chosen by `LRParser.resolve_conflict` from the precedence
+declarations of the grammar or, failing that, by yacc's default rules.
+
+`LRParser.check_conflicts` finds the conflicts that the declarations leave open without materialising
+the tables and can stop at the first one; `parser_types.classify` runs it for several parser types,
+e.g. to sort grammar variants in CI.
+"""
+
+
+class Conflict:
+    """A (state, terminal) entry of the ACTION table with more than one possible action.
+
+    Attributes:
+        state (int): The state number.
+        symbol (str): The lookahead terminal.
+        actions (List[Tuple]): The competing actions; shift and accept first, then reductions by
+            production number.
+        items (List[LR0Item]): The items of the state that produce the competing actions.
+        resolution (Tuple): The action kept in the table; None leaves the entry empty (a syntax error).
+        resolved_by (str): `'precedence'` if the precedence declarations decided the conflict, `'default'`
+            if the default rules did, or None before the conflict is resolved.
+    """
+
+    def __init__(self, state, symbol, actions, items, resolution=None, resolved_by=None):
+        self.state = state
+        self.symbol = symbol
+        self.actions = actions
+        self.items = items
+        self.resolution = resolution
+        self.resolved_by = resolved_by
+
+    @property
+    def kind(self):
+        """str: `'shift/reduce'` if one of the actions is a shift or accept, `'reduce/reduce'` otherwise."""
+        if any(action[0] != 'reduce' for action in self.actions):
+            return 'shift/reduce'
+        return 'reduce/reduce'
+
+    def as_dict(self):
+        """Returns the conflict as a JSON-serialisable dictionary."""
+        return {
+            'state': self.state,
+            'symbol': self.symbol,
+            'kind': self.kind,
+            'actions': [format_action(action) for action in self.actions],
+            'items': [str(item) for item in self.items],
+            'resolution': format_action(self.resolution),
+            'resolved_by': self.resolved_by,
+        }
+
+    def __str__(self):
+        actions = ' vs '.join(format_action(action) for action in self.actions)
+        return f"{self.kind} conflict in state {self.state} on '{self.symbol}': {actions}"
+
+    def __repr__(self):
+        return f"Conflict(state={self.state}, symbol={self.symbol!r}, actions={self.actions})"
+
+
+def format_action(action):
+    """Formats an ACTION entry as `shift 3`, `reduce E -> E + T` or `accept`; None is an `error` entry."""
+    if action is None:
+        return 'error'
+    if action[0] == 'shift':
+        return f"shift {action[1]}"
+    if action[0] == 'reduce':
+        return f"reduce {action[1]} -> {' '.join(action[2])}"
+    return action[0]
+
+
+def conflict_items(I, symbol, actions, augmented_start_symbol=None):
+    """Returns the items of a state that produce the given actions on `symbol`.
+
+    Args:
+        I (Set[LR0Item]): The item set of the state.
+        symbol (str): The lookahead terminal.
+        actions (List[Tuple]): The competing actions.
+        augmented_start_symbol (str, optional): The left-hand side of the accepting item.
+
+    Returns:
+        List[LR0Item]: The shift items with the dot before `symbol`, the accepting item and the
+            completed items of the reduced productions, sorted by their string form.
+    """
+    kinds = {action[0] for action in actions}
+    reduced = {(action[1], tuple(action[2])) for action in actions if action[0] == 'reduce'}
+    items = []
+    for item in I:
+        if item.dot_position < len(item.rhs):
+            if 'shift' in kinds and item.rhs[item.dot_position] == symbol:
+                items.append(item)
+        elif (item.lhs, tuple(item.rhs)) in reduced or ('accept' in kinds and item.lhs == augmented_start_symbol):
+            items.append(item)
+    return sorted(items, key=str)
+
@@ -0,0 +1,405 @@
+"""Generalized LR (GLR) parsing for grammars with conflicts.
+
+`LRParser.parse_glr(tokens)` runs on the tables of any parser type but keeps every action of an
+ACTION entry that has a conflict (see `LRParser.conflicts`) instead of only the one the table
+resolved it to. Conflicts settled by precedence declarations stay settled.
+
+The parser stacks are merged into a graph-structured stack (GSS): all stacks that reach the same
+state at the same input position share one node, and each edge is labelled with the forest node of
+the symbol it was pushed for. Derivations are collected in a shared packed parse forest (SPPF): a
+symbol spanning the same input range is represented by a single `ForestNode`, whose `families` hold
+the alternative ways it was derived. Both structures have a polynomial number of nodes, so
+ambiguous input is handled without the exponential blow-up of backtracking or of copying stacks.
+Reductions are repeated along edges added to nodes that already took their actions, as proposed by
+Farshi, so that grammars with ε-productions are handled correctly.
+
+While the input is deterministic, i.e. there is a single stack and the ACTION entry has a single
+action, the driver works on a plain list on top of the last GSS node, as `LRParser.step` does, and
+only creates GSS nodes when it meets a conflict or a reduction reaches below the list.
+
+The forest and the stack graph are many small objects that all stay alive until the parse ends, so
+the cyclic garbage collector repeatedly traverses them for nothing. The collector is process-wide,
+so the driver leaves it alone; callers that own the process can wrap parses in `paused_gc()`.
+"""
+
+# GLOBAL IMPORTS
+import contextlib
+import gc
+import itertools
+import math
+import threading
+
+# Guards `_gc_pauses`, the number of `paused_gc` blocks in progress in any thread, and
+# `_gc_was_enabled`, the collector state when the first of them started
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextlib.contextmanager
+def paused_gc():
+    """Disables the cyclic garbage collector for the duration of the block.
+
+    Blocks may nest and overlap across threads: the collector is disabled when the first one starts
+    and restored to its previous state when the last one ends.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if not _gc_pauses:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if not _gc_pauses and _gc_was_enabled:
+                gc.enable()
+
+
+class ForestNode:
+    """A node of the shared packed parse forest: a symbol deriving the tokens `[start, end)`.
+
+    Attributes:
+        symbol (str): The terminal or non-terminal.
+        start (int): Index of the first token covered.
+        end (int): Index after the last token covered.
+        families (List[Tuple[Tuple[str, Tuple[str, ...]], Tuple[ForestNode, ...]]]): The alternative
+            derivations of a non-terminal, each a production `(lhs, rhs)` and the forest nodes of its
+            right-hand side symbols; empty for a terminal.
+    """
+
+    __slots__ = ('symbol', 'start', 'end', 'families', '_family_set')
+
+    def __init__(self, symbol, start, end):
+        self.symbol = symbol
+        self.start = start
+        self.end = end
+        self.families = []
+        self._family_set = None
+
+    @property
+    def ambiguous(self):
+        """bool: Whether the node has more than one derivation."""
+        return len(self.families) > 1
+
+    def add_family(self, production, children):
+        """Adds a derivation unless the node already has it."""
+        family = (production, children)
+        if not self.families:
+            self.families.append(family)
+            return
+        # The set is only built for nodes that are reached more than once
+        if self._family_set is None:
+            self._family_set = set(self.families)
+        if family not in self._family_set:
+            self._family_set.add(family)
+            self.families.append(family)
+
+    def trees(self):
+        """Generates every derivation tree of the node.
+
+        A tree is a `(symbol, children)` pair for a non-terminal and the symbol itself for a terminal.
+        The number of trees can grow exponentially with the input, so this is meant for inspecting
+        small forests; derivations that loop through the same node (cyclic grammars) are skipped.
+
+        Yields:
+            Union[str, Tuple[str, list]]: The trees.
+        """
+        yield from self._trees(set())
+
+    def _trees(self, active):
+        if not self.families:
+            yield self.symbol
+            return
+        if self in active:
+            return
+        active.add(self)
+        try:
+            for _, children in self.families:
+                for combination in itertools.product(*(list(child._trees(active)) for child in children)):
+                    yield self.symbol, list(combination)
+        finally:
+            active.discard(self)
+
+    def __repr__(self):
+        return f"ForestNode({self.symbol!r}, {self.start}, {self.end}, families={len(self.families)})"
+
+
+class GLRResult:
+    """The outcome of a GLR parse.
+
+    Attributes:
+        accepted (bool): Whether the input is accepted.
+        root (ForestNode): The forest node of the start symbol covering the whole input, or None.
+        tokens (int): Number of input tokens shifted.
+        error_position (int): Index of the token no stack could shift, `len(tokens)` for the end of
+            the input, or None.
+        forked_tokens (int): Number of tokens that needed the graph-structured stack.
+        max_stacks (int): Largest number of stack tops at one input position.
+    """
+
+    def __init__(self, accepted, root, tokens, error_position, forked_tokens, max_stacks):
+        self.accepted = accepted
+        self.root = root
+        self.tokens = tokens
+        self.error_position = error_position
+        self.forked_tokens = forked_tokens
+        self.max_stacks = max_stacks
+
+    def __bool__(self):
+        return self.accepted
+
+    def derivations(self):
+        """Counts the derivation trees of the input without enumerating them.
+
+        Returns:
+            Union[int, float]: The number of trees, 0 if the input is rejected, or `math.inf` if a
+                cyclic grammar derives the input in infinitely many ways.
+        """
+        if self.root is None:
+            return 0
+        counts, active, pending = {}, set(), [(self.root, False)]
+        while pending:
+            node, expanded = pending.pop()
+            if expanded:
+                active.discard(node)
+                counts[node] = sum(math.prod(counts[child] for child in children)
+                                   for _, children in node.families) if node.families else 1
+            elif node not in counts:
+                active.add(node)
+                pending.append((node, True))
+                for _, children in node.families:
+                    for child in children:
+                        if child in active:
+                            return math.inf
+                        if child not in counts:
+                            pending.append((child, False))
+        return counts[self.root]
+
+    def ambiguous_nodes(self):
+        """Returns the forest nodes with more than one derivation, in depth-first order."""
+        if self.root is None:
+            return []
+        found, seen, pending = [], {self.root}, [self.root]
+        while pending:
+            node = pending.pop()
+            if node.ambiguous:
+                found.append(node)
+            for _, children in reversed(node.families):
+                for child in reversed(children):
+                    if child not in seen:
+                        seen.add(child)
+                        pending.append(child)
+        return found
+
+    def __repr__(self):
+        return (f"GLRResult(accepted={self.accepted}, tokens={self.tokens}, "
+                f"error_position={self.error_position}, max_stacks={self.max_stacks})")
+
+
+class _StackNode:
+    # A GSS node; `edges` maps the nodes below to the forest nodes of the symbols between them
+    __slots__ = ('state', 'level', 'edges')
+
+    def __init__(self, state, level):
+        self.state = state
+        self.level = level
+        self.edges = {}
+
+
+def _paths(node, length, through=None):
+    """Yields `(bottom, labels)` for the paths of `length` edges down from `node`, with the edge
+    labels in right-hand side order; with `through`, only paths that use that `(top, bottom)` edge."""
+    if length == 0:
+        if through is None:
+            yield node, ()
+        return
+    if through is not None and node.level < through[0].level:
+        # Nodes of earlier positions cannot reach the edge, whose top is at the current position
+        return
+    for below, label in node.edges.items():
+        rest = None if through is not None and through == (node, below) else through
+        for bottom, labels in _paths(below, length - 1, rest):
+            yield bottom, labels + (label,)
+
+
+class _GLRDriver:
+    """The state of one GLR parse; see `glr_parse`."""
+
+    def __init__(self, parser):
+        self.parser = parser
+        self.action = parser.action
+        self.goto_table = parser.goto_table
+        self.conflicts = parser.conflicts
+        self.symbols = {}
+
+    def actions(self, state, token):
+        """Returns every action of an ACTION entry, keeping all sides of unresolved conflicts."""
+        if self.parser.lazy:
+            self.parser.build_state(state)
+        key = (state, token)
+        conflict = self.conflicts.get(key)
+        if conflict is not None and conflict.resolved_by != 'precedence':
+            return conflict.actions
+        action = self.action.get(key)
+        return () if action is None else (action,)
+
+    def symbol_node(self, symbol, start, end):
+        """Returns the forest node of a non-terminal ending at the current position, creating it once."""
+        node = self.symbols.get((symbol, start))
+        if node is None:
+            node = self.symbols[(symbol, start)] = ForestNode(symbol, start, end)
+        return node
+
+    def reduce_all(self, frontier, pending, position, token):
+        """Applies every reduction on `token` to the stack tops of `frontier`, adding new tops to it."""
+        processed = [node for node in frontier.values() if node not in pending]
+        pending = list(pending)
+        while pending:
+            node = pending.pop()
+            processed.append(node)
+            for action in self.actions(node.state, token):
+                if action[0] == 'reduce':
+                    length = 0 if action[2] == ['ε'] else len(action[2])
+                    for bottom, labels in list(_paths(node, length)):
+                        self.reduce(frontier, pending, processed, position, token, action, bottom, labels)
+
+    def reduce(self, frontier, pending, processed, position, token, action, bottom, labels):
+        """Reduces along one path, from `bottom` with the edge `labels`, adding the goto node."""
+        lhs = action[1]
+        state = self.goto_table.get((bottom.state, lhs))
+        if state is None:
+            return
+        label = self.symbol_node(lhs, bottom.level, position)
+        label.add_family((lhs, tuple(action[2])), labels)
+        top = frontier.get(state)
+        if top is None:
+            top = frontier[state] = _StackNode(state, position)
+            top.edges[bottom] = label
+            pending.append(top)
+        elif bottom not in top.edges:
+            top.edges[bottom] = label
+            # Stack tops that already took their actions may reduce along the new edge
+            for node in list(processed):
+                for other in self.actions(node.state, token):
+                    if other[0] == 'reduce' and other[2] != ['ε']:
+                        for path in list(_paths(node, len(other[2]), (top, bottom))):
+                            self.reduce(frontier, pending, processed, position, token, other, *path)
+
+    def run(self, tokens):
+        initial = _StackNode(0, 0)
+        base = initial
+        stack = []
+        frontier = {}
+        deterministic = True
+        forked = 0
+        max_stacks = 1
+        position = 0
+        action_get = self.action.get
+        goto_get = self.goto_table.get
+        conflicts = self.conflicts
+        parser = self.parser
+        for position, token in enumerate(itertools.chain(tokens, ['$'])):
+            symbols = self.symbols = {}
+            if deterministic:
+                # A single stack: a list of (state, level, label) entries on top of `base`, driven
+                # like `LRParser.step` until an entry with several actions is reached
+                reduced = set()
+                while True:
+                    state = stack[-1][0] if stack else base.state
+                    if parser.lazy:
+                        parser.build_state(state)
+                    key = (state, token)
+                    conflict = conflicts.get(key)
+                    if conflict is not None and conflict.resolved_by != 'precedence':
+                        action = None
+                        break
+                    action = action_get(key)
+                    if action is None:
+                        return GLRResult(False, None, position, position, forked, max_stacks)
+                    if action[0] != 'reduce':
+                        break
+                    if state in reduced:
+                        # Reductions came back to a state without consuming input, through a cycle
+                        # or a nullable recursion; the GSS merges the repeated nodes
+                        action = None
+                        break
+                    reduced.add(state)
+                    rhs = action[2]
+                    length = 0 if rhs == ['ε'] else len(rhs)
+                    if length > len(stack):
+                        # The reduction pops GSS nodes, which may have several paths
+                        action = None
+                        break
+                    below = len(stack) - length
+                    below_state, below_level = stack[below - 1][:2] if below else (base.state, base.level)
+                    lhs = action[1]
+                    goto_state = goto_get((below_state, lhs))
+                    if goto_state is None:
+                        return GLRResult(False, None, position, position, forked, max_stacks)
+                    label = symbols.get((lhs, below_level))
+                    if label is None:
+                        label = symbols[(lhs, below_level)] = ForestNode(lhs, below_level, position)
+                    label.add_family((lhs, tuple(rhs)), tuple([entry[2] for entry in stack[below:]]))
+                    del stack[below:]
+                    stack.append((goto_state, position, label))
+                if action is not None:
+                    if action[0] == 'shift':
+                        stack.append((action[1], position + 1, ForestNode(token, position, position + 1)))
+                        continue
+                    root = stack[-1][2] if stack else base.edges.get(initial)
+                    return GLRResult(True, root, position, None, forked, max_stacks)
+
+                # Turn the list into GSS nodes; those of the current position below the top have
+                # already taken their (single) action
+                frontier = {base.state: base} if base.level == position else {}
+                top = base
+                for state, level, label in stack:
+                    node = frontier.get(state) if level == position else None
+                    if node is None:
+                        node = _StackNode(state, level)
+                        if level == position:
+                            frontier[state] = node
+                    node.edges[top] = label
+                    top = node
+                stack = []
+                pending = [top]
+            else:
+                pending = list(frontier.values())
+
+            forked += 1
+            self.reduce_all(frontier, pending, position, token)
+            max_stacks = max(max_stacks, len(frontier))
+            shifted = {}
+            terminal = ForestNode(token, position, position + 1)
+            for node in frontier.values():
+                for action in self.actions(node.state, token):
+                    if action[0] == 'shift':
+                        target = shifted.get(action[1])
+                        if target is None:
+                            target = shifted[action[1]] = _StackNode(action[1], position + 1)
+                        target.edges[node] = terminal
+                    elif action[0] == 'accept':
+                        return GLRResult(True, node.edges.get(initial), position, None, forked, max_stacks)
+            if not shifted:
+                return GLRResult(False, None, position, position, forked, max_stacks)
+            frontier = shifted
+            deterministic = len(frontier) == 1
+            if deterministic:
+                base = next(iter(frontier.values()))
+        return GLRResult(False, None, position, position, forked, max_stacks)
+
+
+def glr_parse(parser, tokens):
+    """Parses a token stream with every action of conflicting ACTION entries.
+
+    Args:
+        parser (LRParser): A parser whose tables are built (or that builds them lazily).
+        tokens (Iterable[str]): The input tokens, without the end marker.
+
+    Returns:
+        GLRResult: Whether the input is accepted and the root of its parse forest.
+    """
+    return _GLRDriver(parser).run(tokens)
@@ -0,0 +1,220 @@
+"""Incremental reconstruction of a built parser after a grammar edit.
+
+`LRParser.rebuild` drives the steps below:
+
+1. The grammar applies the delta and updates only the FIRST/FOLLOW entries that depend on the
+   changed non-terminals.
+2. The canonical collection is re-explored from the initial state. States are identified by their
+   kernel; an old state whose closure cannot be affected by the edit is reused as is, including
+   its outgoing transitions, so `closure` and `goto` only run for the states that changed.
+3. States keep their old numbers whenever their kernel survives; new states fill the numbers of
+   removed ones first.
+4. Only the ACTION/GOTO rows of states whose items, transitions or reduce lookaheads changed are
+   recomputed.
+"""
+
+
+class RebuildSummary:
+    """Describes what an incremental rebuild recomputed.
+
+    Attributes:
+        changed_non_terminals (Set[str]): Non-terminals whose productions were added or removed.
+        first_changed (Set[str]): Non-terminals whose FIRST set changed.
+        follow_changed (Set[str]): Non-terminals whose FOLLOW set changed (empty if FOLLOW is not used).
+        reused_states (int): States whose item set and transitions were taken over without recomputation.
+        recomputed_states (int): States whose closure and transitions were recomputed.
+        new_states (List[int]): Numbers of the states that did not exist before the edit.
+        removed_states (int): Number of old states that no longer exist.
+        rebuilt_rows (List[int]): States whose ACTION and GOTO rows were recomputed.
+    """
+
+    def __init__(self, changed_non_terminals, first_changed, follow_changed):
+        self.changed_non_terminals = changed_non_terminals
+        self.first_changed = first_changed
+        self.follow_changed = follow_changed
+        self.reused_states = 0
+        self.recomputed_states = 0
+        self.new_states = []
+        self.removed_states = 0
+        self.rebuilt_rows = []
+
+    def __repr__(self):
+        return (f"RebuildSummary(changed={sorted(self.changed_non_terminals)}, reused_states={self.reused_states}, "
+                f"recomputed_states={self.recomputed_states}, new_states={len(self.new_states)}, "
+                f"removed_states={self.removed_states}, rebuilt_rows={len(self.rebuilt_rows)})")
+
+
+def kernel(parser, I):
+    """Returns the kernel of an item set: the initial item and the items whose dot is not at the start.
+
+    Completed ε-items (`A -> ε •`) are predicted by the closure, so they are not kernel items.
+
+    Args:
+        parser (LRParser): The parser the item set belongs to.
+        I (Set[LR0Item]): The item set.
+
+    Returns:
+        frozenset: The kernel items.
+    """
+    start = parser.grammar.augmented_start_symbol
+    return frozenset(item for item in I if item.lhs == start or (item.dot_position > 0 and item.rhs != ['ε']))
+
+
+def closure_affected(parser, I, changed, first_changed):
+    """Checks whether the closure of a state can differ after the edit.
+
+    The closure changes if it expands a non-terminal whose productions changed. For parsers whose
+    closure computes lookaheads from FIRST sets, it also changes if a lookahead is derived from a
+    symbol whose FIRST set changed.
+
+    Args:
+        parser (LRParser): The parser the state belongs to.
+        I (Set[LR0Item]): The old item set of the state.
+        changed (Set[str]): Non-terminals whose productions changed.
+        first_changed (Set[str]): Non-terminals whose FIRST set changed.
+
+    Returns:
+        bool: True if the state has to be recomputed.
+    """
+    for item in I:
+        if item.dot_position < len(item.rhs):
+            symbol = item.rhs[item.dot_position]
+            if symbol in changed:
+                return True
+            if parser.closure_uses_first and symbol in parser.grammar.non_terminal_set:
+                if any(beta in first_changed for beta in item.rhs[item.dot_position + 1:]):
+                    return True
+    return False
+
+
+def rebuild_collection(parser, changed, first_changed, summary):
+    """Re-explores the canonical collection, reusing every state the edit cannot affect.
+
+    Replaces `parser.C`, `parser.states` and `parser.transitions`.
+
+    Args:
+        parser (LRParser): A parser whose canonical collection was built before the edit.
+        changed (Set[str]): Non-terminals whose productions changed.
+        first_changed (Set[str]): Non-terminals whose FIRST set changed.
+        summary (RebuildSummary): Receives the reuse statistics.
+    """
+    old_C = parser.C
+    old_kernels = {}
+    for old_no, I in enumerate(old_C):
+        old_kernels[kernel(parser, I)] = old_no
+    old_kernel_of = {old_no: K for K, old_no in old_kernels.items()}
+    old_out = {}
+    for (from_state, symbol), to_state in parser.transitions.items():
+        old_out.setdefault(from_state, {})[symbol] = to_state
+
+    # Discover the new states in breadth-first order, with provisional numbers
+    discovered = []
+    provisional = {}
+    edges = []
+
+    def discover(K):
+        if K in provisional:
+            return provisional[K]
+        old_no = old_kernels.get(K)
+        if old_no is not None and not closure_affected(parser, old_C[old_no], changed, first_changed):
+            entry = (K, old_C[old_no], old_no, True)
+            summary.reused_states += 1
+        else:
+            entry = (K, parser.closure(set(K)), old_no, False)
+            summary.recomputed_states += 1
+        provisional[K] = len(discovered)
+        discovered.append(entry)
+        return provisional[K]
+
+    discover(frozenset([parser.initial_item()]))
+    idx = 0
+    while idx < len(discovered):
+        K, I, old_no, reused = discovered[idx]
+        # Successors are visited in symbol order, like `LRParser.expand_state` does
+        if reused:
+            for X, to_state in sorted(old_out.get(old_no, {}).items()):
+                edges.append((idx, X, discover(old_kernel_of[to_state])))
+        else:
+            symbols = set()
+            for item in I:
+                if item.dot_position < len(item.rhs):
+                    symbols.add(item.rhs[item.dot_position])
+            for X in sorted(symbols):
+                goto_kernel = parser.goto_kernel(I, X)
+                if goto_kernel:
+                    edges.append((idx, X, discover(frozenset(goto_kernel))))
+        idx += 1
+
+    # Keep old state numbers where possible; new states fill the gaps left by removed ones
+    n = len(discovered)
+    final = [None] * n
+    taken = set()
+    for idx, (_, _, old_no, _) in enumerate(discovered):
+        if old_no is not None and old_no < n:
+            final[idx] = old_no
+            taken.add(old_no)
+    free = iter(sorted(set(range(n)) - taken))
+    for idx in range(n):
+        if final[idx] is None:
+            final[idx] = next(free)
+            summary.new_states.append(final[idx])
+    summary.removed_states = len(old_C) - len({entry[2] for entry in discovered if entry[2] is not None})
+
+    parser.C = [None] * n
+    for idx, (_, I, _, _) in enumerate(discovered):
+        parser.C[final[idx]] = I
+    parser.states = {frozenset(I): state_no for state_no, I in enumerate(parser.C)}
+    parser.transitions = {(final[from_idx], X): final[to_idx] for from_idx, X, to_idx in edges}
+    summary.new_states.sort()
+
+
+def rebuild_rows(parser, old_C, old_transitions, stale_lhs, summary):
+    """Recomputes the ACTION and GOTO rows of the states affected by the edit.
+
+    A row is kept if its state has the same number, the same item set and the same outgoing
+    transitions as before, and none of its completed items reduces a non-terminal in `stale_lhs`.
+
+    Args:
+        parser (LRParser): The parser with its updated canonical collection.
+        old_C (List[Set[LR0Item]]): The canonical collection before the edit.
+        old_transitions (dict): The transitions before the edit.
+        stale_lhs (Set[str]): Non-terminals whose reduce lookaheads may have changed.
+        summary (RebuildSummary): Receives the numbers of the rebuilt rows.
+    """
+    def outgoing(transitions):
+        by_state = {}
+        for (from_state, symbol), to_state in transitions.items():
+            by_state.setdefault(from_state, {})[symbol] = to_state
+        return by_state
+
+    old_out = outgoing(old_transitions)
+    new_out = outgoing(parser.transitions)
+    columns = parser.grammar.terminals + ['$']
+
+    for state_no in range(len(parser.C), len(old_C)):
+        clear_rows(parser, state_no, columns)
+
+    for state_no, I in enumerate(parser.C):
+        if state_no < len(old_C):
+            same_items = I is old_C[state_no] or frozenset(I) == frozenset(old_C[state_no])
+            if (same_items and old_out.get(state_no) == new_out.get(state_no)
+                    and not any(item.dot_position == len(item.rhs) and item.lhs in stale_lhs for item in I)):
+                continue
+            clear_rows(parser, state_no, columns)
+        parser.construct_state_rows(state_no, I)
+        summary.rebuilt_rows.append(state_no)
+
+
+def clear_rows(parser, state_no, columns):
+    """Removes every ACTION and GOTO entry and every recorded conflict of a state.
+
+    Args:
+        parser (LRParser): The parser whose tables are modified.
+        state_no (int): The state whose rows are removed.
+        columns (List[str]): The ACTION columns (terminals and `$`).
+    """
+    for symbol in columns:
+        parser.action.pop((state_no, symbol), None)
+        parser.conflicts.pop((state_no, symbol), None)
+    for A in parser.grammar.non_terminals:
+        parser.goto_table.pop((state_no, A), None)
@@ -0,0 +1,212 @@
+"""Build-phase instrumentation for LR parsers.
+
+A parser constructed with `instrumentation=BuildInstrumentation()` records the wall time and the
+allocations of each construction phase (augment, FIRST, FOLLOW, `items()`, `merge_states()`, table
+construction) and counts the calls to `closure` and `goto`. Counting works by replacing these methods
+on the parser instance with counting wrappers, so a parser built without instrumentation runs exactly
+the same code as before and pays nothing.
+
+Phase times are exclusive: the time LALR(1) spends in `merge_states()` is reported under
+`merge_states` and not again under `construct_parsing_table`.
+"""
+
+# GLOBAL IMPORTS
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Construction methods that are timed as phases when called on an instrumented parser
+PHASE_METHODS = ('items', 'merge_states', 'construct_parsing_table')
+
+
+class PhaseReport:
+    """Measurements of one construction phase.
+
+    Attributes:
+        name (str): The phase name.
+        seconds (float): Wall time spent in the phase, excluding nested phases.
+        allocated_blocks (int): Change in the number of memory blocks allocated by the interpreter.
+        allocated_bytes (int): Change in traced memory, or None if memory tracing is off.
+        peak_bytes (int): Peak traced memory above the level at the start of the phase, or None.
+    """
+
+    def __init__(self, name, seconds, allocated_blocks, allocated_bytes=None, peak_bytes=None):
+        self.name = name
+        self.seconds = seconds
+        self.allocated_blocks = allocated_blocks
+        self.allocated_bytes = allocated_bytes
+        self.peak_bytes = peak_bytes
+
+    def as_dict(self):
+        """Returns the measurements as a JSON-serialisable dictionary."""
+        return {
+            'name': self.name,
+            'seconds': self.seconds,
+            'allocated_blocks': self.allocated_blocks,
+            'allocated_bytes': self.allocated_bytes,
+            'peak_bytes': self.peak_bytes,
+        }
+
+    def __repr__(self):
+        return f"PhaseReport({self.name!r}, seconds={self.seconds:.6f}, allocated_blocks={self.allocated_blocks})"
+
+
+class BuildReport:
+    """The structured result of an instrumented build.
+
+    Attributes:
+        phases (List[PhaseReport]): The phases in the order they finished.
+        counters (Dict[str, int]): `closure_calls`, `goto_calls`, `items_created`, `states` and `transitions`.
+        snapshots (Dict[str, tracemalloc.Snapshot]): A snapshot taken at the end of each phase, if requested.
+    """
+
+    def __init__(self, phases, counters, snapshots):
+        self.phases = phases
+        self.counters = counters
+        self.snapshots = snapshots
+
+    def phase(self, name):
+        """Returns the report of a phase, or None if it did not run."""
+        for phase in self.phases:
+            if phase.name == name:
+                return phase
+        return None
+
+    @property
+    def total_seconds(self):
+        """float: Wall time spent in all phases."""
+        return sum(phase.seconds for phase in self.phases)
+
+    def as_dict(self):
+        """Returns the report as a JSON-serialisable dictionary (without the snapshots)."""
+        return {
+            'phases': [phase.as_dict() for phase in self.phases],
+            'counters': dict(self.counters),
+            'total_seconds': self.total_seconds,
+        }
+
+    def __str__(self):
+        lines = [f"{'phase':<25} {'ms':>10} {'blocks':>10} {'bytes':>12} {'peak':>12}"]
+        for phase in self.phases:
+            allocated = '' if phase.allocated_bytes is None else phase.allocated_bytes
+            peak = '' if phase.peak_bytes is None else phase.peak_bytes
+            lines.append(f"{phase.name:<25} {phase.seconds * 1000:>10.2f} {phase.allocated_blocks:>10} "
+                         f"{allocated:>12} {peak:>12}")
+        lines.append(', '.join(f"{name}: {value}" for name, value in self.counters.items()))
+        return '\n'.join(lines)
+
+
+class BuildInstrumentation:
+    """Collects phase measurements and operation counts for one parser build.
+
+    Attributes:
+        trace_memory (bool): Measure allocated bytes with `tracemalloc`, starting it if needed.
+        snapshots (bool): Take a `tracemalloc` snapshot at the end of each phase (implies `trace_memory`).
+        counters (Dict[str, int]): The operation counts collected so far.
+        wrapped (List[str]): Names of the parser methods replaced by instrumented wrappers.
+    """
+
+    def __init__(self, trace_memory=False, snapshots=False):
+        """Initializes an empty collector.
+
+        Args:
+            trace_memory (bool, optional): Measure allocated and peak bytes per phase.
+            snapshots (bool, optional): Keep a `tracemalloc` snapshot of every phase.
+        """
+        self.trace_memory = trace_memory or snapshots
+        self.snapshots = snapshots
+        self.counters = {'closure_calls': 0, 'goto_calls': 0, 'items_created': 0, 'states': 0, 'transitions': 0}
+        self.wrapped = []
+        self._phases = []
+        self._snapshots = {}
+        self._stack = []
+        self._started_tracing = False
+
+    @contextmanager
+    def phase(self, name):
+        """Measures the enclosed code as a phase.
+
+        The time of a nested phase is subtracted from the enclosing one, but its peak is not: as
+        `tracemalloc` keeps a single peak, the peak so far is folded into the enclosing phase
+        before a nested phase resets it, and the nested peak is folded in when it ends.
+        """
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        frame = {'nested': 0.0, 'peak': 0}
+        blocks = sys.getallocatedblocks()
+        if self.trace_memory:
+            traced, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+        self._stack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]['nested'] += elapsed
+            report = PhaseReport(name, elapsed - frame['nested'], sys.getallocatedblocks() - blocks)
+            if self.trace_memory:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame['peak'])
+                if self._stack:
+                    self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+                report.allocated_bytes = current - traced
+                report.peak_bytes = peak - traced
+                if self.snapshots:
+                    self._snapshots[name] = tracemalloc.take_snapshot()
+            self._phases.append(report)
+
+    def attach(self, parser):
+        """Replaces the construction methods and `closure`/`goto` of a parser instance with wrappers.
+
+        Args:
+            parser (LRParser): The parser to instrument.
+        """
+        counters = self.counters
+
+        def phase_wrapper(name, method):
+            def wrapper(*args, **kwargs):
+                with self.phase(name):
+                    result = method(*args, **kwargs)
+                counters['states'] = len(parser.C)
+                counters['transitions'] = len(parser.transitions)
+                return result
+            return wrapper
+
+        closure = parser.closure
+        goto = parser.goto
+
+        def counting_closure(items):
+            counters['closure_calls'] += 1
+            result = closure(items)
+            counters['items_created'] += len(result)
+            return result
+
+        def counting_goto(items, symbol):
+            counters['goto_calls'] += 1
+            return goto(items, symbol)
+
+        for name in PHASE_METHODS:
+            if hasattr(parser, name):
+                setattr(parser, name, phase_wrapper(name, getattr(parser, name)))
+                self.wrapped.append(name)
+        parser.closure = counting_closure
+        parser.goto = counting_goto
+        self.wrapped += ['closure', 'goto']
+
+    def report(self):
+        """Returns the measurements collected so far and stops `tracemalloc` if it was started here.
+
+        Returns:
+            BuildReport: The phase measurements, counters and snapshots.
+        """
+        if self._started_tracing and not self._stack:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return BuildReport(list(self._phases), dict(self.counters), dict(self._snapshots))
@@ -1,11 +1,16 @@
 # GLOBAL IMPORTS
-from collections import defaultdict
+from collections import defaultdict, deque
 
 # LOCAL IMPORTS
 from src.items.lr0_item import LR0Item
 from src.items.lr1_item import LR1Item
+from src.parsers.lr0_parser import LR0Parser
 from src.parsers.lr1_parser import LR1Parser
 
+# Stands for "whatever the kernel item's lookaheads are" while finding which lookaheads propagate;
+# the space keeps it apart from any terminal
+PROPAGATED = '# propagated'
+
 
 class LALR1Parser(LR1Parser):
     """Implements the LALR(1) parser for constructing parsing tables and parsing input strings.
@@ -21,14 +26,34 @@ class LALR1Parser(LR1Parser):
         states (dict): A dictionary mapping merged item sets to state numbers.
         transitions (dict): A dictionary storing state transitions for the parser.
         C (list): The canonical collection of merged LR(1) item sets used in constructing the parsing tables.
+        canonical (tuple): The unmerged LR(1) collection as `(C, states, transitions)`, kept for `rebuild`;
+            None until `merge_states` runs and if the collection was derived from the LR(0) automaton.
+        merged (bool): Whether `C` holds the merged states, either from `merge_states` or from
+            `items_from_lr0`.
 
     Methods:
         merge_states():
             Merges states in the canonical collection of LR(1) items that have identical LR(0) cores.
-        construct_parsing_table():
+        items_from_lr0(lr0_parser):
+            Derives the merged collection from an LR(0) automaton by propagating lookaheads.
+        construct_parsing_table(progress):
             Constructs the ACTION and GOTO tables for the LALR(1) parser.
+        check_conflicts(stop_at_first):
+            Finds the conflicts of the merged states without building the tables.
     """
 
+    def __init__(self, context_free_grammar, instrumentation=None, prune=False):
+        """Initializes the LALR1Parser with a context-free grammar and no collection yet.
+
+        Args:
+            context_free_grammar (ContextFreeGrammar): The context-free grammar to be used by the parser.
+            instrumentation (BuildInstrumentation, optional): Records build-phase measurements.
+            prune (bool, optional): First remove useless symbols from the grammar.
+        """
+        super().__init__(context_free_grammar, instrumentation, prune)
+        self.canonical = None
+        self.merged = False
+
     def merge_states(self):
         """Merges states with identical LR(0) items but different lookaheads.
 
@@ -40,7 +65,11 @@ class LALR1Parser(LR1Parser):
         1. States are grouped by their LR(0) cores.
         2. Lookaheads for merged items are computed as the union of the lookaheads from all contributing states.
         3. The state mapping, transitions, and canonical collection (`C`) are updated to reflect the merged states.
+
+        The unmerged LR(1) collection is kept in `canonical` as a `(C, states, transitions)` tuple.
         """
+        # Keep the canonical LR(1) collection so that `rebuild` can update it incrementally
+        self.canonical = (self.C, self.states, self.transitions)
         state_groups = defaultdict(list)
 
         # Group states by their LR(0) core
@@ -83,15 +112,141 @@ class LALR1Parser(LR1Parser):
         self.states = {frozenset(I): idx for idx, I in enumerate(new_C)}
         self.transitions = new_transitions
         self.C = new_C
+        self.merged = True
 
-    def construct_parsing_table(self):
+    def items_from_lr0(self, lr0_parser):
+        """Derives the merged LALR(1) collection from the LR(0) automaton instead of the LR(1) collection.
+
+        The LALR(1) states are the LR(0) states with lookaheads, so they can be computed without
+        building the much larger canonical LR(1) collection first. For every kernel item, the LR(1)
+        closure of the item with the lookahead `PROPAGATED` shows which lookaheads its successor items
+        get spontaneously and to which of them its own lookaheads propagate. The lookaheads are
+        then propagated until nothing changes, and each state is closed over its kernel.
+
+        The tables are the same as those of the merged LR(1) collection, except for the state
+        numbers, which are those of `lr0_parser`.
+
+        Args:
+            lr0_parser (LR0Parser): A parser of the same grammar whose canonical collection is built;
+                it is not modified.
+        """
+        augmented = self.grammar.augmented_start_symbol
+        transitions = lr0_parser.transitions
+        # Kernel items are the initial item and those with the dot moved over a symbol; completed
+        # ε-items are predicted by the closure
+        kernels = [sorted((item.lhs, tuple(item.rhs), item.dot_position) for item in I
+                          if item.lhs == augmented or (item.dot_position and item.rhs != ['ε']))
+                   for I in lr0_parser.C]
+
+        with self.phase('lookaheads'):
+            lookaheads = [{key: set() for key in kernel} for kernel in kernels]
+            lookaheads[0][(augmented, (self.grammar.start_symbol,), 0)].add('$')
+            propagation = {}
+            for state_no, kernel in enumerate(kernels):
+                for lhs, rhs, dot in kernel:
+                    targets = []
+                    for item in self.closure({LR1Item(lhs, list(rhs), dot, [PROPAGATED])}):
+                        if item.dot_position < len(item.rhs):
+                            target = transitions[(state_no, item.rhs[item.dot_position])]
+                            target_key = (item.lhs, tuple(item.rhs), item.dot_position + 1)
+                            for lookahead in item.lookaheads:
+                                if lookahead == PROPAGATED:
+                                    targets.append((target, target_key))
+                                else:
+                                    lookaheads[target][target_key].add(lookahead)
+                    propagation[(state_no, (lhs, rhs, dot))] = targets
+
+            queue = deque((state_no, key) for state_no, kernel in enumerate(kernels) for key in kernel
+                          if lookaheads[state_no][key])
+            while queue:
+                state_no, key = queue.popleft()
+                source = lookaheads[state_no][key]
+                for target, target_key in propagation[(state_no, key)]:
+                    target_lookaheads = lookaheads[target][target_key]
+                    if not source <= target_lookaheads:
+                        target_lookaheads |= source
+                        queue.append((target, target_key))
+
+        self.C = []
+        for state_no, kernel in enumerate(kernels):
+            closure = self.closure({LR1Item(lhs, list(rhs), dot, lookaheads[state_no][(lhs, rhs, dot)])
+                                    for lhs, rhs, dot in kernel})
+            # The closure may hold one core with several lookahead sets; keep one item per core
+            merged = defaultdict(set)
+            for item in closure:
+                merged[(item.lhs, tuple(item.rhs), item.dot_position)].update(item.lookaheads)
+            self.C.append({LR1Item(lhs, list(rhs), dot, item_lookaheads)
+                           for (lhs, rhs, dot), item_lookaheads in merged.items()})
+        self.states = {frozenset(I): state_no for state_no, I in enumerate(self.C)}
+        self.transitions = dict(transitions)
+        self.canonical = None
+        self.merged = True
+
+    def construct_parsing_table(self, progress=None):
         """Constructs the ACTION and GOTO tables for the LALR(1) parser.
 
-        This method first merges states with identical LR(0) cores and then constructs the
-        ACTION and GOTO tables using the merged canonical collection.
+        This method first merges states with identical LR(0) cores, unless the collection is already
+        merged, and then constructs the ACTION and GOTO tables using the merged canonical collection.
 
-        Raises:
-            ValueError: If there is a conflict during the construction of the parsing tables.
+        Args:
+            progress (Callable[[int, int], None], optional): Called with `(0, states)` once the states
+                are merged, then as in `LRParser.construct_parsing_table`.
+        """
+        if not self.merged:
+            self.merge_states()
+        if progress is not None:
+            progress(0, len(self.C))
+        super().construct_parsing_table(progress)
+
+    def check_conflicts(self, stop_at_first=False):
+        """Finds the LALR(1) conflicts of the grammar without building the tables.
+
+        Without a collection, the merged states are derived from the LR(0) automaton with
+        `items_from_lr0`, so the canonical LR(1) collection is never built. Lookaheads propagate
+        across the whole automaton, so every state gets its lookaheads before the check starts; only
+        the check itself can stop early. The states are then numbered like the LR(0) states, as in
+        `build_variants`; an unmerged LR(1) collection built earlier is merged instead.
+
+        Args:
+            stop_at_first (bool, optional): Return as soon as one conflict is found.
+
+        Returns:
+            List[Conflict]: The conflicts not settled by precedence, by state and terminal.
         """
+        if not self.C:
+            lr0_parser = LR0Parser(self.grammar)
+            lr0_parser.items()
+            self.items_from_lr0(lr0_parser)
+        elif not self.merged:
+            self.merge_states()
+        return super().check_conflicts(stop_at_first)
+
+    def rebuild_items(self, changed, first_changed, summary):
+        """Updates the canonical LR(1) collection after a grammar edit and merges it again.
+
+        Args:
+            changed (Set[str]): Non-terminals whose productions changed.
+            first_changed (Set[str]): Non-terminals whose FIRST set changed.
+            summary (RebuildSummary): Receives the reuse statistics of the LR(1) collection.
+        """
+        if self.canonical is None:
+            # Derived from the LR(0) automaton: there is no LR(1) collection to update, so build it
+            self.C, self.states, self.transitions = [], {}, {}
+            self.items()
+            self.merge_states()
+            return
+        self.C, self.states, self.transitions = self.canonical
+        super().rebuild_items(changed, first_changed, summary)
         self.merge_states()
-        super().construct_parsing_table()
+
+    def start_lazy(self):
+        """Lazy construction is not available for LALR(1) parsers.
+
+        A merged state collects the lookaheads of every LR(1) state with the same core, so its
+        rows are only known once the whole canonical collection has been built.
+
+        Raises:
+            NotImplementedError: Always.
+        """
+        raise NotImplementedError("LALR(1) states are merged from the complete LR(1) collection "
+                                  "and cannot be built lazily; use LR(1) or SLR(1) instead")
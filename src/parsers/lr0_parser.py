@@ -1,6 +1,3 @@
-# GLOBAL IMPORTS
-from collections import deque
-
 # LOCAL IMPORTS
 from src.items.lr0_item import LR0Item
 from src.parsers.lr_parser import LRParser
@@ -22,47 +19,23 @@ class LR0Parser(LRParser):
         C (list): The canonical collection of item sets used in constructing the parsing tables.
 
     Methods:
-        items():
-            Constructs the canonical collection of LR(0) items.
+        initial_item():
+            Creates the LR(0) item the canonical collection starts from.
         closure(items):
             Computes the closure of a set of LR(0) items.
-        goto(items, symbol):
-            Computes the GOTO set for a given set of LR(0) items and a grammar symbol.
-        construct_parsing_table():
-            Constructs the ACTION and GOTO tables for the LR(0) parser.
+        goto_kernel(items, symbol):
+            Computes the kernel of the GOTO set for a given set of LR(0) items and a grammar symbol.
+        reduce_lookaheads(item):
+            Returns the terminals on which a completed item is reduced (all terminals for LR(0)).
     """
 
-    def items(self):
-        """Constructs the canonical collection of LR(0) items.
-
-        The canonical collection is built using the closure and goto operations. Each set of
-        items corresponds to a state in the parsing table.
+    def initial_item(self):
+        """Creates the initial LR(0) item `S' -> • S`.
 
-        Raises:
-            ValueError: If there is a conflict during the construction of the canonical collection.
+        Returns:
+            LR0Item: The initial item of the canonical collection.
         """
-        initial_item = LR0Item(self.grammar.augmented_start_symbol, [self.grammar.start_symbol], 0)
-        I0 = self.closure(set([initial_item]))
-        self.C.append(I0)
-        self.states[frozenset(I0)] = 0
-        queue = deque([I0])
-
-        while queue:
-            I = queue.popleft()
-            state_no = self.states[frozenset(I)]
-            symbols = set()
-            for item in I:
-                if item.dot_position < len(item.rhs):
-                    symbols.add(item.rhs[item.dot_position])
-            for X in symbols:
-                goto_I_X = self.goto(I, X)
-                if goto_I_X:
-                    goto_I_X_frozenset = frozenset(goto_I_X)
-                    if goto_I_X_frozenset not in self.states:
-                        self.states[goto_I_X_frozenset] = len(self.C)
-                        self.C.append(goto_I_X)
-                        queue.append(goto_I_X)
-                    self.transitions[(state_no, X)] = self.states[goto_I_X_frozenset]
+        return LR0Item(self.grammar.augmented_start_symbol, [self.grammar.start_symbol], 0)
 
     def closure(self, items):
         """Computes the closure of a set of LR(0) items.
@@ -84,72 +57,53 @@ class LR0Parser(LRParser):
             for item in closure_set:
                 if item.dot_position < len(item.rhs):
                     symbol = item.rhs[item.dot_position]
-                    if symbol in self.grammar.non_terminals:
-                        for prod in self.grammar.productions:
-                            if prod[0] == symbol:
-                                new_item = LR0Item(prod[0], prod[1], 0)
-                                if new_item not in closure_set:
-                                    new_items.add(new_item)
-                                    added = True
+                    for prod in self.grammar.productions_by_lhs.get(symbol, ()):
+                        # An ε-production is complete as soon as it is predicted
+                        new_item = LR0Item(prod[0], prod[1], 1 if prod[1] == ['ε'] else 0)
+                        if new_item not in closure_set:
+                            new_items.add(new_item)
+                            added = True
             closure_set.update(new_items)
         return closure_set
 
-    def goto(self, items, symbol):
-        """Computes the GOTO set for a set of LR(0) items and a grammar symbol.
+    def goto_kernel(self, items, symbol):
+        """Computes the kernel of the GOTO set for a set of LR(0) items and a grammar symbol.
 
         Args:
             items (Set[Item]): A set of LR(0) items.
             symbol (str): The grammar symbol for which to compute the GOTO set.
 
         Returns:
-            Set[Item]: The GOTO set for the given items and symbol.
+            Set[Item]: The items of `items` with the dot moved over `symbol`.
         """
         goto_set = set()
         for item in items:
             if item.dot_position < len(item.rhs) and item.rhs[item.dot_position] == symbol:
                 new_item = LR0Item(item.lhs, item.rhs, item.dot_position + 1)
                 goto_set.add(new_item)
-        return self.closure(goto_set)
+        return goto_set
 
-    def construct_parsing_table(self):
-        """Constructs the ACTION and GOTO tables for the LR(0) parser.
+    def stale_reductions(self, new_terminals, follow_changed):
+        """Returns the non-terminals whose reduce lookaheads may have changed after a grammar edit.
 
-        The ACTION table maps (state, terminal) pairs to parser actions (shift, reduce, or accept).
-        The GOTO table maps (state, non-terminal) pairs to new states.
+        LR(0) reductions apply to every terminal, so they only go stale when terminals are added.
 
-        Raises:
-            ValueError: If there is a conflict during the construction of the parsing tables.
+        Args:
+            new_terminals (bool): Whether the edit introduced new terminals.
+            follow_changed (Set[str]): Non-terminals whose FOLLOW set changed.
+
+        Returns:
+            Set[str]: All non-terminals if new terminals were introduced, otherwise an empty set.
         """
-        for I in self.C:
-            state_no = self.states[frozenset(I)]
-            # Construct ACTION table
-            for item in I:
-                # Shift action
-                if item.dot_position < len(item.rhs):
-                    symbol = item.rhs[item.dot_position]
-                    if symbol in self.grammar.terminals:
-                        next_state = self.transitions.get((state_no, symbol))
-                        if next_state is not None:
-                            action_key = (state_no, symbol)
-                            action_value = ('shift', next_state)
-                            if action_key in self.action and self.action[action_key] != action_value:
-                                print(f"Conflict at state {state_no}, symbol {symbol}")
-                            self.action[action_key] = action_value
-                # Reduce or Accept action
-                else:
-                    # Accept action
-                    if item.lhs == self.grammar.augmented_start_symbol:
-                        self.action[(state_no, '$')] = ('accept',)
-                    # Reduce action
-                    else:
-                        for term_symbol in self.grammar.terminals + ['$']:
-                            action_key = (state_no, term_symbol)
-                            action_value = ('reduce', item.lhs, item.rhs)
-                            if action_key in self.action and self.action[action_key] != action_value:
-                                print(f"Conflict at state {state_no}, symbol {term_symbol}")
-                            self.action[action_key] = action_value
-            # Construct GOTO table
-            for A in self.grammar.non_terminals:
-                next_state = self.transitions.get((state_no, A))
-                if next_state is not None:
-                    self.goto_table[(state_no, A)] = next_state
+        return set(self.grammar.non_terminals) if new_terminals else set()
+
+    def reduce_lookaheads(self, item):
+        """Returns the terminals on which a completed LR(0) item is reduced: all of them.
+
+        Args:
+            item (LR0Item): An item with the dot at the end of its right-hand side.
+
+        Returns:
+            List[str]: Every terminal of the grammar and the end marker `$`.
+        """
+        return self.grammar.terminals + ['$']
@@ -1,6 +1,3 @@
-# GLOBAL IMPORTS
-from collections import deque
-
 # LOCAL IMPORTS
 from src.items.lr1_item import LR1Item
 from src.parsers.lr_parser import LRParser
@@ -22,51 +19,29 @@ class LR1Parser(LRParser):
         C (list): The canonical collection of LR(1) item sets used in constructing the parsing tables.
 
     Methods:
-        items():
-            Constructs the canonical collection of LR(1) items.
+        initial_item():
+            Creates the LR(1) item the canonical collection starts from.
         closure(items):
             Computes the closure of a set of LR(1) items, including propagating lookaheads.
         compute_lookaheads(item):
             Computes the lookahead set for a given LR(1) item.
         compute_first_sequence(symbols):
             Computes the FIRST set for a sequence of grammar symbols.
-        goto(items, symbol):
-            Computes the GOTO set for a set of LR(1) items and a grammar symbol.
-        construct_parsing_table():
-            Constructs the ACTION and GOTO tables for the LR(1) parser.
+        goto_kernel(items, symbol):
+            Computes the kernel of the GOTO set for a set of LR(1) items and a grammar symbol.
+        reduce_lookaheads(item):
+            Returns the terminals on which a completed item is reduced (its lookaheads).
     """
 
-    def items(self):
-        """Constructs the canonical collection of LR(1) items.
+    closure_uses_first = True
 
-        The canonical collection is built using the closure and goto operations.
-        Each set of items corresponds to a state in the parsing table. LR(1) items
-        include lookahead sets to determine valid reductions.
+    def initial_item(self):
+        """Creates the initial LR(1) item `S' -> • S, {$}`.
 
-        Raises:
-            ValueError: If there is a conflict during the construction of the canonical collection.
+        Returns:
+            LR1Item: The initial item of the canonical collection.
         """
-        initial_item = LR1Item(self.grammar.augmented_start_symbol, [self.grammar.start_symbol], 0, ['$'])
-        I0 = self.closure(set([initial_item]))
-        self.C.append(I0)
-        self.states[frozenset(I0)] = 0
-        queue = deque([I0])
-        while queue:
-            I = queue.popleft()
-            state_no = self.states[frozenset(I)]
-            symbols = set()
-            for item in I:
-                if item.dot_position < len(item.rhs):
-                    symbols.add(item.rhs[item.dot_position])
-            for X in symbols:
-                goto_I_X = self.goto(I, X)
-                if goto_I_X:
-                    goto_I_X_frozenset = frozenset(goto_I_X)
-                    if goto_I_X_frozenset not in self.states:
-                        self.states[goto_I_X_frozenset] = len(self.C)
-                        self.C.append(goto_I_X)
-                        queue.append(goto_I_X)
-                    self.transitions[(state_no, X)] = self.states[goto_I_X_frozenset]
+        return LR1Item(self.grammar.augmented_start_symbol, [self.grammar.start_symbol], 0, ['$'])
 
     def closure(self, items):
         """Computes the closure of a set of LR(1) items.
@@ -88,21 +63,21 @@ class LR1Parser(LRParser):
             for item in closure_set:
                 if item.dot_position < len(item.rhs):
                     symbol = item.rhs[item.dot_position]
-                    if symbol in self.grammar.non_terminals:
+                    if symbol in self.grammar.non_terminal_set:
                         lookaheads = self.compute_lookaheads(item)
-                        for prod in self.grammar.productions:
-                            if prod[0] == symbol:
-                                new_item = LR1Item(prod[0], prod[1], 0, lookaheads)
-                                if new_item not in closure_set:
-                                    new_items.add(new_item)
-                                    added = True
-                                else:
-                                    # Merge lookaheads
-                                    for existing_item in closure_set:
-                                        if existing_item == new_item:
-                                            if not lookaheads.issubset(existing_item.lookaheads):
-                                                existing_item.lookaheads.update(lookaheads)
-                                                added = True
+                        for prod in self.grammar.productions_by_lhs.get(symbol, ()):
+                            # An ε-production is complete as soon as it is predicted
+                            new_item = LR1Item(prod[0], prod[1], 1 if prod[1] == ['ε'] else 0, lookaheads)
+                            if new_item not in closure_set:
+                                new_items.add(new_item)
+                                added = True
+                            else:
+                                # Merge lookaheads
+                                for existing_item in closure_set:
+                                    if existing_item == new_item:
+                                        if not lookaheads.issubset(existing_item.lookaheads):
+                                            existing_item.lookaheads.update(lookaheads)
+                                            added = True
             closure_set.update(new_items)
         return closure_set
 
@@ -147,58 +122,30 @@ class LR1Parser(LRParser):
                 first.add('ε')
         return first
 
-    def goto(self, items, symbol):
-        """Computes the GOTO set for a set of LR(1) items and a grammar symbol.
+    def goto_kernel(self, items, symbol):
+        """Computes the kernel of the GOTO set for a set of LR(1) items and a grammar symbol.
 
         Args:
             items (Set[LR1Item]): A set of LR(1) items.
             symbol (str): The grammar symbol for which to compute the GOTO set.
 
         Returns:
-            Set[LR1Item]: The GOTO set for the given items and symbol.
+            Set[LR1Item]: The items of `items` with the dot moved over `symbol`, keeping their lookaheads.
         """
         goto_set = set()
         for item in items:
             if item.dot_position < len(item.rhs) and item.rhs[item.dot_position] == symbol:
                 new_item = LR1Item(item.lhs, item.rhs, item.dot_position + 1, item.lookaheads)
                 goto_set.add(new_item)
-        return self.closure(goto_set)
+        return goto_set
 
-    def construct_parsing_table(self):
-        """Constructs the ACTION and GOTO tables for the LR(1) parser.
+    def reduce_lookaheads(self, item):
+        """Returns the terminals on which a completed LR(1) item is reduced: its own lookaheads.
 
-        The ACTION table maps (state, terminal) pairs to parser actions (shift, reduce, or accept).
-        The GOTO table maps (state, non-terminal) pairs to new states.
+        Args:
+            item (LR1Item): An item with the dot at the end of its right-hand side.
 
-        Raises:
-            ValueError: If there is a conflict during the construction of the parsing tables.
+        Returns:
+            Set[str]: The lookaheads of the item.
         """
-        for I in self.C:
-            state_no = self.states[frozenset(I)]
-            # Construct ACTION table
-            for item in I:
-                if item.dot_position < len(item.rhs):
-                    symbol = item.rhs[item.dot_position]
-                    if symbol in self.grammar.terminals:
-                        next_state = self.transitions.get((state_no, symbol))
-                        if next_state is not None:
-                            action_key = (state_no, symbol)
-                            action_value = ('shift', next_state)
-                            if action_key in self.action and self.action[action_key] != action_value:
-                                print(f"Conflict at state {state_no}, symbol {symbol}")
-                            self.action[action_key] = action_value
-                else:
-                    if item.lhs == self.grammar.augmented_start_symbol:
-                        self.action[(state_no, '$')] = ('accept',)
-                    else:
-                        for a in item.lookaheads:
-                            action_key = (state_no, a)
-                            action_value = ('reduce', item.lhs, item.rhs)
-                            if action_key in self.action and self.action[action_key] != action_value:
-                                print(f"Conflict at state {state_no}, symbol {a}")
-                            self.action[action_key] = action_value
-            # Construct GOTO table
-            for A in self.grammar.non_terminals:
-                next_state = self.transitions.get((state_no, A))
-                if next_state is not None:
-                    self.goto_table[(state_no, A)] = next_state
+        return item.lookaheads
@@ -1,66 +1,611 @@
+# GLOBAL IMPORTS
+import contextlib
+import itertools
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
+
+# LOCAL IMPORTS
+from src.lexer.mapped import parse_file
+from src.parsers.compiled import CompiledParser
+from src.parsers.conflicts import Conflict, conflict_items
+from src.parsers.glr import glr_parse
+from src.parsers.incremental import RebuildSummary, rebuild_collection, rebuild_rows
+from src.parsers.recovery import ErrorRecovery, recover
 
 
 class LRParser(ABC):
     """Abstract base class for all types of LR parsers (e.g., LR(0), SLR(1), LALR(1), LR(1)).
 
     This class provides a common interface and shared methods for different LR parsers. It handles
-    grammar augmentation, the construction of parsing tables, and the parsing of input strings.
-    Specific types of LR parsers (e.g., LR(0), LR(1)) should inherit from this class and implement
-    the abstract methods.
+    grammar augmentation, the construction of the canonical collection and of the parsing tables, and
+    the parsing of input strings. Specific types of LR parsers (e.g., LR(0), LR(1)) inherit from this
+    class and provide the item type (`initial_item`, `closure`, `goto_kernel`) and the lookaheads on
+    which completed items are reduced (`reduce_lookaheads`).
 
     Attributes:
-        grammar (ContextFreeGrammar): The context-free grammar used by the parser.
+        grammar (ContextFreeGrammar): The parser's augmented copy of the grammar it was built from.
         action (dict): The ACTION table used in LR parsing, mapping (state, symbol) pairs to actions.
         goto_table (dict): The GOTO table used in LR parsing, mapping (state, non-terminal) pairs to states.
         states (dict): A dictionary mapping item sets to state numbers.
         transitions (dict): A dictionary storing state transitions for the parser.
         C (list): The canonical collection of item sets used in constructing the parsing tables.
+        conflicts (dict): The conflicts found while filling the ACTION table, as `Conflict` records keyed
+            by (state, terminal) pairs, including those settled by precedence declarations.
+        lazy (bool): Whether states are still being built on demand (see `start_lazy`).
+        built_states (set): In lazy mode, the states whose transitions and table rows have been built.
+        instrumentation (BuildInstrumentation): Collects build-phase measurements, or None.
+        pruned (PruneReport): What was removed from the grammar before augmentation, or None if the
+            grammar was not pruned.
+        unit_shortcuts (dict): Maps `(state, non-terminal, lookahead)` to the state reached after the
+            chain of unit reductions that follows the goto, and the chain itself; None unless
+            `eliminate_unit_productions` was called.
 
     Methods:
         items():
-            Abstract method to generate the canonical collection of item sets for the parser.
-        construct_parsing_table():
-            Abstract method to construct the ACTION and GOTO tables.
+            Generates the canonical collection of item sets for the parser.
+        construct_parsing_table(progress):
+            Constructs the ACTION and GOTO tables.
+        check_conflicts(stop_at_first):
+            Finds the conflicts of the parser type without building the tables.
+        start_lazy():
+            Switches to lazy construction, where states are built the first time `parse` reaches them.
+        finish_build(background):
+            Builds the states a lazy parser has not reached yet.
+        eliminate_unit_productions(keep):
+            Lets the drivers bypass chains of unit reductions.
+        rebuild(added, removed):
+            Incrementally updates the built parser after productions are added or removed.
         parse(input_string):
             Parses an input string using the constructed ACTION and GOTO tables.
+        recognize(tokens):
+            Checks whether a token stream is accepted, without recording configurations.
+        diagnose(tokens, recovery):
+            Reports every syntax error of a token stream, recovering after each one.
+        parse_glr(tokens):
+            Parses a token stream with all actions of conflicting entries, building a parse forest.
+        valid_terminals(state):
+            Returns the terminals a state has actions for.
+        action_for(state, terminal):
+            Returns an ACTION entry, building the state first if it is lazy.
+        compile():
+            Returns an immutable, thread-safe copy of the tables without the construction data.
+        parse_file(path, lexer, contextual):
+            Lexes and parses a memory-mapped file with flat memory use.
     """
 
-    def __init__(self, context_free_grammar):
+    # Whether `closure` derives lookaheads from FIRST sets (LR(1)-based parsers)
+    closure_uses_first = False
+
+    def __init__(self, context_free_grammar, instrumentation=None, prune=False):
         """Initializes the LRParser with a context-free grammar.
 
-        This method augments the given grammar, computes the FIRST sets, and initializes the
-        data structures for the ACTION and GOTO tables.
+        This method augments a copy of the given grammar, computes its FIRST sets, and initializes
+        the data structures for the ACTION and GOTO tables. The given grammar is only read, so one
+        grammar object can be shared by parsers of several types, including ones built concurrently
+        (see `parser_types.build_parsers`).
 
         Args:
-            context_free_grammar (ContextFreeGrammar): The context-free grammar to be used by the parser.
+            context_free_grammar (ContextFreeGrammar): The context-free grammar to be used by the parser;
+                the parser works on its own copy, available as `grammar`.
+            instrumentation (BuildInstrumentation, optional): Records the time and allocations of each
+                construction phase and counts `closure` and `goto` calls; see `src.parsers.instrumentation`.
+            prune (bool, optional): First remove unproductive and unreachable symbols from the grammar
+                (see `ContextFreeGrammar.prune`); the report is kept in `pruned`.
+
+        Raises:
+            ValueError: If `prune` is set and the start symbol derives no terminal string.
         """
-        self.grammar = context_free_grammar
-        self.grammar.augment_grammar()
-        self.grammar.compute_first()
+        self.instrumentation = instrumentation
+        if instrumentation is not None:
+            instrumentation.attach(self)
+        self.grammar = context_free_grammar.copy()
+        self.pruned = None
+        if prune:
+            with self.phase('prune'):
+                self.pruned = self.grammar.prune()
+        with self.phase('augment'):
+            self.grammar.augment_grammar()
+        with self.phase('first'):
+            self.grammar.compute_first()
         self.action = {}
         self.goto_table = {}
         self.states = {}
         self.transitions = {}
         self.C = []
+        self.conflicts = {}
+        self.lazy = False
+        self.built_states = set()
+        self._lazy_lock = threading.RLock()
+        self.unit_shortcuts = None
+        self._kept_unit_productions = ()
+
+    def phase(self, name):
+        """Returns a context manager that measures a construction phase if the parser is instrumented.
+
+        Args:
+            name (str): The phase name.
+
+        Returns:
+            ContextManager: The measuring context, or a no-op context without instrumentation.
+        """
+        if self.instrumentation is None:
+            return contextlib.nullcontext()
+        return self.instrumentation.phase(name)
+
+    def items(self, progress=None, workers=None):
+        """Constructs the canonical collection of item sets.
+
+        The collection is built breadth-first from the closure of the initial item using the
+        `closure` and `goto` operations of the concrete parser type. Each set of items corresponds
+        to a state in the parsing table. Successors are visited in symbol order, so the state numbers
+        do not depend on hashing.
+
+        Args:
+            progress (Callable[[int, int], None], optional): Called after each state is expanded with the
+                number of states discovered so far and the number still waiting in the queue. An exception
+                raised by the callback aborts the construction.
+            workers (int, optional): If greater than 1, expand each breadth-first level in a pool of this
+                many processes (see `src.parsers.parallel`). The result is identical to the serial build;
+                `progress` is then called once per level.
+        """
+        if workers is not None and workers > 1:
+            # Imported here, so that serial builds do not load the process-pool machinery
+            from src.parsers.parallel import build_collection
+            build_collection(self, workers, progress)
+            return
+        self.add_initial_state()
+        queue = deque([0])
+
+        while queue:
+            queue.extend(self.expand_state(queue.popleft()))
+            if progress is not None:
+                progress(len(self.C), len(queue))
+
+    def add_initial_state(self):
+        """Registers state 0, the closure of the initial item."""
+        I0 = self.closure({self.initial_item()})
+        self.C.append(I0)
+        self.states[frozenset(I0)] = 0
+
+    def expand_state(self, state_no):
+        """Computes the outgoing transitions of a state, registering the successor states it discovers.
+
+        Args:
+            state_no (int): The state to expand.
+
+        Returns:
+            List[int]: The numbers of the states discovered by this expansion.
+        """
+        I = self.C[state_no]
+        new_states = []
+        symbols = set()
+        for item in I:
+            if item.dot_position < len(item.rhs):
+                symbols.add(item.rhs[item.dot_position])
+        for X in sorted(symbols):
+            goto_I_X = self.goto(I, X)
+            if goto_I_X:
+                goto_I_X_frozenset = frozenset(goto_I_X)
+                if goto_I_X_frozenset not in self.states:
+                    self.states[goto_I_X_frozenset] = len(self.C)
+                    new_states.append(len(self.C))
+                    self.C.append(goto_I_X)
+                self.transitions[(state_no, X)] = self.states[goto_I_X_frozenset]
+        return new_states
+
+    @abstractmethod
+    def initial_item(self):
+        """Creates the item `S' -> • S` the canonical collection starts from.
+
+        Implemented by subclasses to create the item type of the parser.
+        """
+
+    @abstractmethod
+    def closure(self, items):
+        """Computes the closure of a set of items. Implemented by subclasses."""
 
     @abstractmethod
-    def items(self):
-        """Generates the canonical collection of item sets.
+    def goto_kernel(self, items, symbol):
+        """Computes the kernel of the GOTO set, i.e. the items of `items` with the dot moved over `symbol`.
+
+        Implemented by subclasses.
+        """
 
-        This method should be implemented by subclasses to generate the collection of item sets
-        specific to the type of LR parser (e.g., LR(0), SLR(1), LALR(1), LR(1)).
+    def goto(self, items, symbol):
+        """Computes the GOTO set for a set of items and a grammar symbol.
+
+        Args:
+            items (Set[LR0Item]): A set of items.
+            symbol (str): The grammar symbol for which to compute the GOTO set.
+
+        Returns:
+            Set[LR0Item]: The closure of the kernel returned by `goto_kernel`.
         """
-        pass
+        return self.closure(self.goto_kernel(items, symbol))
 
     @abstractmethod
-    def construct_parsing_table(self):
+    def reduce_lookaheads(self, item):
+        """Returns the terminals on which a completed item is reduced.
+
+        Implemented by subclasses; this is where LR(0), SLR(1) and LR(1)-based tables differ.
+
+        Args:
+            item (LR0Item): An item with the dot at the end of its right-hand side.
+
+        Returns:
+            Iterable[str]: The lookahead terminals (including `$`) that select the reduction.
+        """
+
+    def construct_parsing_table(self, progress=None):
         """Constructs the ACTION and GOTO tables for the parser.
 
-        This method should be implemented by subclasses to construct the ACTION and GOTO tables
-        specific to the type of LR parser.
+        The ACTION table maps (state, terminal) pairs to parser actions (shift, reduce, or accept).
+        The GOTO table maps (state, non-terminal) pairs to new states.
+
+        Args:
+            progress (Callable[[int, int], None], optional): Called after the rows of each state are
+                built with the number of states done and the total. An exception raised by the
+                callback aborts the construction.
+        """
+        for done, I in enumerate(self.C, 1):
+            self.construct_state_rows(self.states[frozenset(I)], I)
+            if progress is not None:
+                progress(done, len(self.C))
+
+    def construct_state_rows(self, state_no, I):
+        """Fills the ACTION and GOTO rows of a single state.
+
+        Args:
+            state_no (int): The state number.
+            I (Set[LR0Item]): The item set of the state.
+        """
+        for symbol, action_value in self.state_actions(state_no, I):
+            self.set_action(state_no, symbol, action_value)
+        # Construct GOTO table
+        for A in self.grammar.non_terminals:
+            next_state = self.transitions.get((state_no, A))
+            if next_state is not None:
+                self.goto_table[(state_no, A)] = next_state
+
+    def state_actions(self, state_no, I):
+        """Generates the ACTION entries of a single state, before conflicts are resolved.
+
+        Args:
+            state_no (int): The state number.
+            I (Set[LR0Item]): The item set of the state.
+
+        Yields:
+            Tuple[str, Tuple]: `(terminal, action)` pairs; a terminal may receive several actions.
+        """
+        for item in I:
+            # Shift action
+            if item.dot_position < len(item.rhs):
+                symbol = item.rhs[item.dot_position]
+                if symbol in self.grammar.terminal_set:
+                    next_state = self.transitions.get((state_no, symbol))
+                    if next_state is not None:
+                        yield symbol, ('shift', next_state)
+            # Accept action
+            elif item.lhs == self.grammar.augmented_start_symbol:
+                yield '$', ('accept',)
+            # Reduce action
+            else:
+                for symbol in self.reduce_lookaheads(item):
+                    yield symbol, ('reduce', item.lhs, item.rhs)
+
+    def check_conflicts(self, stop_at_first=False):
+        """Finds the conflicts of this parser type for the grammar without building the tables.
+
+        Conflicts settled by the precedence declarations of the grammar are not reported.
+
+        If the canonical collection has not been built yet, it is built state by state and each
+        state is checked as soon as its transitions are known, so a check that stops at the first
+        conflict also skips the rest of the construction. After such an early stop the collection is
+        incomplete; use a fresh parser to build the tables.
+
+        Args:
+            stop_at_first (bool, optional): Return as soon as one conflict is found.
+
+        Returns:
+            List[Conflict]: The conflicts, with the resolution the tables would use, by state and
+                terminal; empty if the grammar belongs to the class of this parser type.
+        """
+        expand = not self.C
+        if expand:
+            self.add_initial_state()
+        conflicts = []
+        state_no = 0
+        while state_no < len(self.C):
+            if expand:
+                self.expand_state(state_no)
+            conflicts += self.state_conflicts(state_no, self.C[state_no])
+            if conflicts and stop_at_first:
+                break
+            state_no += 1
+        return conflicts
+
+    def state_conflicts(self, state_no, I):
+        """Returns the conflicts of a single state that precedence does not settle, without touching
+        the ACTION table.
+
+        Args:
+            state_no (int): The state number.
+            I (Set[LR0Item]): The item set of the state.
+
+        Returns:
+            List[Conflict]: The conflicts of the state, sorted by terminal.
+        """
+        row = {}
+        for symbol, action_value in self.state_actions(state_no, I):
+            actions = row.setdefault(symbol, [])
+            if action_value not in actions:
+                actions.append(action_value)
+        conflicts = []
+        for symbol in sorted(row):
+            actions = row[symbol]
+            if len(actions) > 1:
+                actions.sort(key=self.action_rank)
+                items = conflict_items(I, symbol, actions, self.grammar.augmented_start_symbol)
+                conflict = Conflict(state_no, symbol, actions, items)
+                self.resolve_conflict(conflict)
+                if conflict.resolved_by != 'precedence':
+                    conflicts.append(conflict)
+        return conflicts
+
+    def __getstate__(self):
+        # Locks and instrumentation wrappers cannot be pickled; a copy (e.g. in a worker process) gets
+        # its own lock and is not instrumented
+        state = self.__dict__.copy()
+        del state['_lazy_lock']
+        if self.instrumentation is not None:
+            for name in self.instrumentation.wrapped:
+                state.pop(name, None)
+            state['instrumentation'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lazy_lock = threading.RLock()
+
+    def start_lazy(self):
+        """Switches the parser to lazy construction instead of `items()` and `construct_parsing_table()`.
+
+        Only state 0 is created up front. The first time `parse` reaches a state, its transitions and
+        its ACTION/GOTO rows are built and memoised, so the construction cost is proportional to the
+        part of the automaton the parsed inputs exercise. `finish_build` completes the rest.
+        """
+        self.add_initial_state()
+        self.lazy = True
+
+    def build_state(self, state_no):
+        """Builds the transitions and the ACTION/GOTO rows of a state unless they already exist.
+
+        Safe to call from several threads; each state is built once.
+
+        Args:
+            state_no (int): The state to build.
+        """
+        if state_no in self.built_states:
+            return
+        with self._lazy_lock:
+            if state_no in self.built_states:
+                return
+            self.expand_state(state_no)
+            self.construct_state_rows(state_no, self.C[state_no])
+            # Published only once the rows are complete, so readers never see a partial row
+            self.built_states.add(state_no)
+
+    def finish_build(self, background=False):
+        """Builds every state of a lazy parser that has not been reached yet.
+
+        Once it returns (or its thread finishes), the parser holds the same item sets and tables as
+        after `items()` and `construct_parsing_table()` up to renumbering: lazily built states are
+        numbered in the order the input first reached them, not breadth-first. `lazy` is then False.
+        Parsing may continue while the build runs in the background.
+
+        Args:
+            background (bool, optional): Run the build in a daemon thread and return immediately.
+
+        Returns:
+            threading.Thread: The background thread, or None if the build ran synchronously.
+        """
+        if background:
+            thread = threading.Thread(target=self.finish_build, name="finish-build", daemon=True)
+            thread.start()
+            return thread
+        state_no = 0
+        while state_no < len(self.C):
+            self.build_state(state_no)
+            state_no += 1
+        self.lazy = False
+        return None
+
+    def stale_reductions(self, new_terminals, follow_changed):
+        """Returns the non-terminals whose reduce lookaheads may have changed after a grammar edit.
+
+        Args:
+            new_terminals (bool): Whether the edit introduced new terminals.
+            follow_changed (Set[str]): Non-terminals whose FOLLOW set changed.
+
+        Returns:
+            Set[str]: Left-hand sides whose completed items must have their reduce actions recomputed.
+        """
+        return set()
+
+    def rebuild(self, added=(), removed=()):
+        """Incrementally updates a built parser after productions are added or removed.
+
+        Instead of constructing a new parser, only the FIRST/FOLLOW entries, states and ACTION/GOTO rows
+        the edit can affect are recomputed. States that survive the edit keep their numbers.
+        `items()` and `construct_parsing_table()` must have been called before.
+
+        Args:
+            added (Iterable[Tuple[str, List[str]]]): Productions to add.
+            removed (Iterable[Tuple[str, List[str]]]): Productions to remove.
+
+        Returns:
+            RebuildSummary: What was recomputed.
+
+        Raises:
+            ValueError: If the delta is invalid (see `Grammar.apply_delta`).
+        """
+        added = [(lhs, list(rhs)) for lhs, rhs in added]
+        removed = [(lhs, list(rhs)) for lhs, rhs in removed]
+        n_terminals = len(self.grammar.terminals)
+
+        changed = self.grammar.apply_delta(added, removed)
+        first_changed = self.grammar.update_first(changed)
+        follow_changed = set()
+        if self.grammar.follow is not None:
+            follow_changed = self.grammar.update_follow(added + removed, first_changed)
+        summary = RebuildSummary(changed, first_changed, follow_changed)
+
+        old_C, old_transitions = self.C, self.transitions
+        self.rebuild_items(changed, first_changed, summary)
+        stale = self.stale_reductions(len(self.grammar.terminals) != n_terminals, follow_changed)
+        rebuild_rows(self, old_C, old_transitions, stale, summary)
+        if self.unit_shortcuts is not None:
+            self.eliminate_unit_productions(self._kept_unit_productions)
+        return summary
+
+    def rebuild_items(self, changed, first_changed, summary):
+        """Updates the canonical collection after a grammar edit, reusing unaffected states.
+
+        Args:
+            changed (Set[str]): Non-terminals whose productions changed.
+            first_changed (Set[str]): Non-terminals whose FIRST set changed.
+            summary (RebuildSummary): Receives the reuse statistics.
+        """
+        rebuild_collection(self, changed, first_changed, summary)
+
+    def eliminate_unit_productions(self, keep=()):
+        """Lets the drivers bypass chains of unit reductions such as `F -> id`, `T -> F`, `E -> T`.
+
+        After a reduction to `A` exposes state `s`, the parser moves to `goto(s, A)`; if the lookahead
+        then selects a reduction by a unit production `B -> A`, only that state is popped, `s` is
+        exposed again, and so on. The state reached at the end of such a chain depends only on `s`,
+        `A` and the lookahead, so it is precomputed from the finished tables and the drivers go there
+        directly. `parse` still records every bypassed reduction, so traces show the same derivation.
+
+        A lazy parser is built completely first. After `rebuild`, the shortcuts are recomputed.
+
+        Args:
+            keep (Iterable[Tuple[str, List[str]]]): Unit productions that must still be reduced one by
+                one, e.g. because a semantic action is attached to them.
+
+        Returns:
+            int: The number of shortcuts.
+        """
+        if self.lazy:
+            self.finish_build()
+        self._kept_unit_productions = tuple((lhs, list(rhs)) for lhs, rhs in keep)
+        kept = {(lhs, tuple(rhs)) for lhs, rhs in keep}
+        non_terminals = self.grammar.non_terminal_set
+
+        # Per state, the lookaheads that select a reduction by a unit production
+        unit_reductions = {}
+        for (state, symbol), action in self.action.items():
+            if (action[0] == 'reduce' and len(action[2]) == 1 and action[2][0] in non_terminals
+                    and (action[1], tuple(action[2])) not in kept):
+                unit_reductions.setdefault(state, {})[symbol] = action
+
+        shortcuts = {}
+        for (exposed, A), target in self.goto_table.items():
+            for symbol in unit_reductions.get(target, ()):
+                state = target
+                chain = []
+                visited = {target}
+                while True:
+                    reduction = unit_reductions.get(state, {}).get(symbol)
+                    if reduction is None:
+                        break
+                    next_state = self.goto_table.get((exposed, reduction[1]))
+                    # A cycle of unit productions is left to the ordinary driver
+                    if next_state is None or next_state in visited:
+                        break
+                    chain.append((reduction, next_state))
+                    visited.add(next_state)
+                    state = next_state
+                if chain:
+                    shortcuts[(exposed, A, symbol)] = (state, tuple(chain))
+        self.unit_shortcuts = shortcuts
+        return len(shortcuts)
+
+    def set_action(self, state_no, symbol, action_value):
+        """Stores an ACTION entry, recording a conflict if a different action is already present.
+
+        Conflicting entries are collected in `conflicts`; the table keeps the action chosen by
+        `resolve_conflict`.
+
+        Args:
+            state_no (int): The state number.
+            symbol (str): The lookahead terminal.
+            action_value (Tuple): The action to store.
+        """
+        action_key = (state_no, symbol)
+        current = self.action.get(action_key)
+        if current is None and action_key not in self.conflicts:
+            self.action[action_key] = action_value
+            return
+        if current == action_value:
+            return
+
+        conflict = self.conflicts.get(action_key)
+        if conflict is None:
+            conflict = Conflict(state_no, symbol, [current], [])
+            self.conflicts[action_key] = conflict
+        if action_value in conflict.actions:
+            return
+        conflict.actions.append(action_value)
+        conflict.actions.sort(key=self.action_rank)
+        conflict.items = conflict_items(self.C[state_no], symbol, conflict.actions,
+                                        self.grammar.augmented_start_symbol)
+        self.resolve_conflict(conflict)
+        if conflict.resolution is None:
+            self.action.pop(action_key, None)
+        else:
+            self.action[action_key] = conflict.resolution
+
+    def action_rank(self, action_value):
+        """Orders competing actions: shift and accept first, then reductions by production number."""
+        if action_value[0] == 'reduce':
+            return 1 + self.grammar.get_production_number((action_value[1], action_value[2]))
+        return 0
+
+    def resolve_conflict(self, conflict):
+        """Chooses the action kept in the table for a conflict and stores it in `conflict.resolution`.
+
+        A shift/reduce conflict is decided by the grammar's precedence declarations when both the
+        lookahead terminal and the production have a precedence, as in yacc: the higher level wins; at
+        the same level, a left-associative terminal reduces, a right-associative one shifts, and a
+        non-associative one leaves the entry empty so that the input is rejected. Otherwise a shift wins
+        over a reduction, and of several reductions the one by the production listed first wins.
+
+        Args:
+            conflict (Conflict): The conflict, with its actions ordered by `action_rank`.
         """
-        pass
+        reductions = [action for action in conflict.actions if action[0] == 'reduce']
+        shift = conflict.actions[0]
+        conflict.resolution = shift
+        conflict.resolved_by = 'default'
+        if shift[0] != 'shift':
+            return
+
+        token_precedence = self.grammar.precedence.get(conflict.symbol)
+        rule_precedence = self.grammar.get_production_precedence(reductions[0][1:])
+        if token_precedence is None or rule_precedence is None:
+            return
+        if len(reductions) == 1:
+            conflict.resolved_by = 'precedence'
+        if rule_precedence[0] > token_precedence[0]:
+            conflict.resolution = reductions[0]
+        elif rule_precedence[0] == token_precedence[0]:
+            associativity = token_precedence[1]
+            if associativity == 'left':
+                conflict.resolution = reductions[0]
+            elif associativity == 'nonassoc':
+                conflict.resolution = None
 
     def parse(self, input_string):
         """
@@ -82,9 +627,12 @@ class LRParser(ABC):
         stack = [0]
         index = 0
         configurations = []
+        unit_shortcuts = self.unit_shortcuts
 
         while True:
             state = stack[-1]
+            if self.lazy:
+                self.build_state(state)
             token = input_string[index]
             action = self.action.get((state, token))
             configurations.append((stack[:], input_string[index:], action))
@@ -98,15 +646,22 @@ class LRParser(ABC):
             elif action[0] == 'reduce':
                 lhs = action[1]
                 rhs = action[2]
-                # Pop the stack based on the length of the RHS
-                for _ in rhs:
-                    stack.pop()
+                # Pop the stack based on the length of the RHS; an ε-production pops nothing
+                if rhs != ['ε']:
+                    for _ in rhs:
+                        stack.pop()
                 state = stack[-1]
                 goto_state = self.goto_table.get((state, lhs))
                 if goto_state is None:
                     print(f"Error: no goto state for state {state} and non-terminal '{lhs}'")
                     return
                 stack.append(goto_state)
+                shortcut = unit_shortcuts.get((state, lhs, token)) if unit_shortcuts else None
+                if shortcut is not None:
+                    # Record the bypassed unit reductions as if the table had been consulted
+                    for reduction, next_state in shortcut[1]:
+                        configurations.append((stack[:], input_string[index:], reduction))
+                        stack[-1] = next_state
             elif action[0] == 'accept':
                 print("Input string accepted.")
                 break
@@ -115,3 +670,227 @@ class LRParser(ABC):
                 return
 
         return configurations
+
+    def valid_terminals(self, state):
+        """Returns the terminals with a non-error ACTION entry in a state.
+
+        Every terminal the parser can accept next, after the reductions it selects, is among them,
+        so a lexer only needs to try these (see `Lexer.next_token`).
+
+        Args:
+            state (int): The state on top of the stack.
+
+        Returns:
+            FrozenSet[str]: The terminals, including `$` if the state has an action on it.
+        """
+        if self.lazy:
+            self.build_state(state)
+        action = self.action
+        return frozenset(t for t in itertools.chain(self.grammar.terminals, ['$']) if (state, t) in action)
+
+    @property
+    def terminals(self):
+        """List[str]: The grammar terminals followed by the end marker `$`, in grammar order."""
+        return [t for t in self.grammar.terminals if t != '$'] + ['$']
+
+    def action_for(self, state, terminal):
+        """Returns the ACTION entry of a state and terminal, building the state first if it is lazy.
+
+        Args:
+            state (int): The state.
+            terminal (str): The terminal, or `$`.
+
+        Returns:
+            Union[Tuple, None]: The entry, or None for an error entry.
+        """
+        if self.lazy:
+            self.build_state(state)
+        return self.action.get((state, terminal))
+
+    def compile(self):
+        """Copies the tables into an immutable `CompiledParser` (see `src.parsers.compiled`).
+
+        The compiled parser keeps no reference to this parser, its grammar or its item sets, which
+        can be garbage collected once the caller drops them. A lazy parser first builds its
+        remaining states.
+
+        Returns:
+            CompiledParser: The compiled parser, safe to share between threads.
+        """
+        return CompiledParser.from_parser(self)
+
+    def step(self, stack, token):
+        """Advances a parse stack over one input token.
+
+        Applies every reduction the token selects, then shifts it. `stack` is modified in place;
+        after an error its contents are undefined.
+
+        Args:
+            stack (List[int]): The state stack, starting with `[0]`.
+            token (str): The next input token, or `$` at the end of the input.
+
+        Returns:
+            Union[Tuple, None]: The `('shift', state)` or `('accept',)` action that consumed the token,
+                or None if the token is a syntax error.
+        """
+        unit_shortcuts = self.unit_shortcuts
+        while True:
+            state = stack[-1]
+            if self.lazy:
+                self.build_state(state)
+            action = self.action.get((state, token))
+            if action is None or action[0] != 'reduce':
+                break
+            rhs = action[2]
+            if rhs != ['ε']:
+                del stack[len(stack) - len(rhs):]
+            goto_state = self.goto_table.get((stack[-1], action[1]))
+            if goto_state is None:
+                return None
+            if unit_shortcuts:
+                shortcut = unit_shortcuts.get((stack[-1], action[1], token))
+                if shortcut is not None:
+                    goto_state = shortcut[0]
+            stack.append(goto_state)
+        if action is not None and action[0] == 'shift':
+            stack.append(action[1])
+        return action
+
+    def recognize(self, tokens, profile=None):
+        """Checks whether a token stream is accepted.
+
+        Unlike `parse`, tokens are consumed one at a time from any iterable and no configurations are
+        recorded, so memory use depends only on the stack depth. This makes it suitable for very long,
+        generated inputs.
+
+        Args:
+            tokens (Iterable[str]): The input tokens, without the end marker.
+            profile (ParseProfile, optional): Counts state visits, reductions and stack depth; the
+                profiled parse runs a separate copy of the driver.
+
+        Returns:
+            bool: True if the input is accepted.
+        """
+        if profile is not None:
+            return self._recognize_profiled(tokens, profile)
+        stack = [0]
+        for token in itertools.chain(tokens, ['$']):
+            action = self.step(stack, token)
+            if action is None:
+                return False
+            if action[0] == 'accept':
+                return True
+        return False
+
+    def diagnose(self, tokens, recovery=None):
+        """Parses a token sequence and reports every syntax error instead of stopping at the first.
+
+        At each missing ACTION entry a diagnostic with the token position is recorded and parsing
+        resumes with the strategies configured in `recovery` (see `src.parsers.recovery`).
+
+        Args:
+            tokens (Iterable[str]): The input tokens, without the end marker.
+            recovery (ErrorRecovery, optional): The recovery configuration; defaults to all strategies
+                without synchronising terminals and at most 100 errors.
+
+        Returns:
+            RecoveryResult: The diagnostics and whether the parse completed.
+        """
+        return recover(self, tokens, recovery or ErrorRecovery())
+
+    def parse_glr(self, tokens):
+        """Parses a token stream with a generalized LR driver that follows every action of the
+        conflicts the tables recorded, so that grammars that are not LR for this parser type can be
+        parsed and ambiguous input yields all of its derivations (see `src.parsers.glr`).
+
+        Args:
+            tokens (Iterable[str]): The input tokens, without the end marker.
+
+        Returns:
+            GLRResult: Whether the input is accepted and the shared packed parse forest of its
+                derivations.
+        """
+        return glr_parse(self, tokens)
+
+    def parse_file(self, path, lexer, contextual=False):
+        """Parses a file of any size without reading it into memory.
+
+        The file is memory-mapped and lexed in place, and its terminals are fed to the driver one at
+        a time, so neither the text nor a token list is ever held (see `src.lexer.mapped`).
+
+        Args:
+            path (str): The file to parse.
+            lexer (Lexer): The lexer for the grammar's terminals, e.g. `Lexer.for_grammar(grammar)`.
+            contextual (bool, optional): Let the lexer try only the terminals that the state on top of
+                the stack has actions for.
+
+        Returns:
+            FileParseResult: Whether the file is accepted and, if not, the span of the rejected token.
+
+        Raises:
+            LexError: If no terminal matches at some position of the file.
+        """
+        return parse_file(self, lexer, path, contextual)
+
+    def _recognize_profiled(self, tokens, profile):
+        # A rebuild since the profile was created may have added states and productions
+        profile.ensure_states(len(self.C))
+        profile.ensure_productions(len(self.grammar.productions))
+        visits = profile.state_visits
+        reductions = profile.reductions
+        production_numbers = self.grammar.production_numbers
+        unit_shortcuts = self.unit_shortcuts
+        shifts = reduces = consumed = 0
+        max_depth = profile.max_stack_depth
+        accepted = False
+        stack = [0]
+        profile.parses += 1
+        try:
+            for token in itertools.chain(tokens, ['$']):
+                consumed += 1
+                while True:
+                    state = stack[-1]
+                    if self.lazy:
+                        self.build_state(state)
+                        profile.ensure_states(len(self.C))
+                        visits = profile.state_visits
+                    visits[state] += 1
+                    action = self.action.get((state, token))
+                    if action is None or action[0] != 'reduce':
+                        break
+                    reduces += 1
+                    rhs = action[2]
+                    reductions[production_numbers[(action[1], tuple(rhs))]] += 1
+                    if rhs != ['ε']:
+                        del stack[len(stack) - len(rhs):]
+                    goto_state = self.goto_table.get((stack[-1], action[1]))
+                    if goto_state is None:
+                        return False
+                    if unit_shortcuts:
+                        shortcut = unit_shortcuts.get((stack[-1], action[1], token))
+                        if shortcut is not None:
+                            # Bypassed reductions still count towards the derivation
+                            goto_state = shortcut[0]
+                            for reduction, _ in shortcut[1]:
+                                reductions[production_numbers[(reduction[1], tuple(reduction[2]))]] += 1
+                            reduces += len(shortcut[1])
+                    stack.append(goto_state)
+                    # ε-reductions push without popping
+                    if len(stack) > max_depth:
+                        max_depth = len(stack)
+                if action is None:
+                    return False
+                if action[0] == 'accept':
+                    accepted = True
+                    return True
+                shifts += 1
+                stack.append(action[1])
+                if len(stack) > max_depth:
+                    max_depth = len(stack)
+            return False
+        finally:
+            profile.shifts += shifts
+            profile.reduces += reduces
+            profile.tokens += consumed
+            profile.accepted += accepted
+            profile.max_stack_depth = max_depth
@@ -0,0 +1,101 @@
+"""Parallel construction of the canonical collection in a process pool.
+
+`LRParser.items(workers=N)` explores the collection level by level, i.e. one breadth-first frontier
+at a time:
+
+1. The workers compute the GOTO kernels of every frontier state.
+2. The main process deduplicates the kernels in frontier order and symbol order, which is the order
+   in which the serial build discovers states, and numbers the new ones.
+3. The workers compute the closures of the new kernels, which become the next frontier.
+
+Because numbering happens centrally in discovery order, the collection, the transitions and therefore
+the tables are the same as those of the serial build. Each worker receives a copy of the parser when
+the pool starts, so only item sets travel between processes afterwards.
+"""
+
+# GLOBAL IMPORTS
+from concurrent.futures import ProcessPoolExecutor
+
+# Frontiers smaller than this are expanded in the main process; shipping them to the pool costs more
+# than it saves
+MIN_PARALLEL_FRONTIER = 64
+
+# The parser copy of a worker process, set by `_init_worker`
+_worker_parser = None
+
+
+def _init_worker(parser):
+    global _worker_parser
+    _worker_parser = parser
+
+
+def goto_kernels(parser, I):
+    """Computes the non-empty GOTO kernels of an item set, in the symbol order used by `expand_state`.
+
+    Args:
+        parser (LRParser): The parser whose `goto_kernel` is used.
+        I (Set[LR0Item]): The item set.
+
+    Returns:
+        List[Tuple[str, frozenset]]: `(symbol, kernel)` pairs.
+    """
+    symbols = {item.rhs[item.dot_position] for item in I if item.dot_position < len(item.rhs)}
+    kernels = []
+    for X in sorted(symbols):
+        kernel = parser.goto_kernel(I, X)
+        if kernel:
+            kernels.append((X, frozenset(kernel)))
+    return kernels
+
+
+def _worker_goto_kernels(I):
+    return goto_kernels(_worker_parser, I)
+
+
+def _worker_closure(kernel):
+    return _worker_parser.closure(set(kernel))
+
+
+def build_collection(parser, workers, progress=None):
+    """Builds `parser.C`, `parser.states` and `parser.transitions` using a pool of worker processes.
+
+    Args:
+        parser (LRParser): A parser whose canonical collection has not been built yet.
+        workers (int): Number of worker processes.
+        progress (Callable[[int, int], None], optional): Called after each level with the number of
+            states discovered so far and the size of the next frontier.
+    """
+    parser.add_initial_state()
+    kernel_states = {frozenset([parser.initial_item()]): 0}
+    frontier = [0]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(parser,)) as pool:
+        def run(local, remote, args):
+            if len(args) < MIN_PARALLEL_FRONTIER:
+                return [local(arg) for arg in args]
+            chunksize = max(1, len(args) // (workers * 4))
+            return list(pool.map(remote, args, chunksize=chunksize))
+
+        while frontier:
+            kernels = run(lambda I: goto_kernels(parser, I), _worker_goto_kernels,
+                          [parser.C[state_no] for state_no in frontier])
+
+            new_kernels = []
+            for state_no, state_kernels in zip(frontier, kernels):
+                for X, kernel in state_kernels:
+                    target = kernel_states.get(kernel)
+                    if target is None:
+                        target = len(kernel_states)
+                        kernel_states[kernel] = target
+                        new_kernels.append(kernel)
+                    parser.transitions[(state_no, X)] = target
+
+            closures = run(lambda kernel: parser.closure(set(kernel)), _worker_closure, new_kernels)
+            frontier = []
+            for I in closures:
+                parser.states[frozenset(I)] = len(parser.C)
+                frontier.append(len(parser.C))
+                parser.C.append(I)
+
+            if progress is not None:
+                progress(len(parser.C), len(frontier))
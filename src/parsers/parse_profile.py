@@ -0,0 +1,120 @@
+"""Parse-time profiling of states and productions.
+
+`LRParser.recognize(tokens, profile=ParseProfile(parser))` runs a separate, counting copy of the
+parse driver, so the ordinary driver is unchanged and unprofiled parses pay nothing. Counters are
+kept in compact `array` buffers indexed by state and production number and accumulate over any
+number of parses.
+"""
+
+# GLOBAL IMPORTS
+from array import array
+
+
+class ParseProfile:
+    """Per-state and per-production counters collected while parsing.
+
+    Attributes:
+        grammar (ContextFreeGrammar): The augmented grammar whose productions are counted.
+        state_visits (array): How often each state was on top of the stack when an action was looked up.
+        reductions (array): How often each production (by production number) was reduced.
+        shifts (int): Number of shift actions.
+        reduces (int): Number of reduce actions.
+        tokens (int): Number of tokens consumed, including end markers.
+        parses (int): Number of parses profiled.
+        accepted (int): Number of parses that were accepted.
+        max_stack_depth (int): The deepest stack seen.
+    """
+
+    def __init__(self, parser):
+        """Initializes zeroed counters sized for a built parser.
+
+        Args:
+            parser (LRParser): The parser to profile; the counters grow as needed when a lazily built
+                parser adds states or a rebuild adds states and productions.
+        """
+        self.grammar = parser.grammar
+        self.state_visits = array('Q', bytes(8 * len(parser.C)))
+        self.reductions = array('Q', bytes(8 * len(parser.grammar.productions)))
+        self.shifts = 0
+        self.reduces = 0
+        self.tokens = 0
+        self.parses = 0
+        self.accepted = 0
+        self.max_stack_depth = 0
+
+    def ensure_states(self, n_states):
+        """Grows `state_visits` to hold at least `n_states` counters."""
+        if n_states > len(self.state_visits):
+            self.state_visits.extend(array('Q', bytes(8 * (n_states - len(self.state_visits)))))
+
+    def ensure_productions(self, n_productions):
+        """Grows `reductions` to hold at least `n_productions` counters."""
+        if n_productions > len(self.reductions):
+            self.reductions.extend(array('Q', bytes(8 * (n_productions - len(self.reductions)))))
+
+    @property
+    def shift_reduce_ratio(self):
+        """float: Shifts per reduction, or None before the first reduction."""
+        return self.shifts / self.reduces if self.reduces else None
+
+    def hot_states(self, top=10):
+        """Returns the most visited states.
+
+        Args:
+            top (int, optional): Number of states to return.
+
+        Returns:
+            List[Tuple[int, int]]: `(state, visits)` pairs, most visited first.
+        """
+        ranked = sorted(range(len(self.state_visits)), key=lambda state: -self.state_visits[state])
+        return [(state, self.state_visits[state]) for state in ranked[:top] if self.state_visits[state]]
+
+    def hot_productions(self, top=10):
+        """Returns the most reduced productions.
+
+        Args:
+            top (int, optional): Number of productions to return.
+
+        Returns:
+            List[Tuple[str, List[str], int]]: `(lhs, rhs, reductions)` triples, most reduced first.
+        """
+        ranked = sorted(range(len(self.reductions)), key=lambda number: -self.reductions[number])
+        return [(*self.grammar.productions[number], self.reductions[number])
+                for number in ranked[:top] if self.reductions[number]]
+
+    def unit_reductions(self):
+        """Returns the share of reductions by unit productions (`A -> B` with `B` a non-terminal).
+
+        A high share suggests collapsing unit chains in the grammar.
+
+        Returns:
+            float: The share, or None before the first reduction.
+        """
+        if not self.reduces:
+            return None
+        unit = sum(self.reductions[number] for number, (_, rhs) in enumerate(self.grammar.productions)
+                   if len(rhs) == 1 and rhs[0] in self.grammar.non_terminal_set)
+        return unit / self.reduces
+
+    def report(self, top=10):
+        """Returns the profile as a JSON-serialisable dictionary.
+
+        Args:
+            top (int, optional): Number of hot states and productions to include.
+
+        Returns:
+            dict: Totals, ratios, maximum stack depth, hot states and hot productions.
+        """
+        return {
+            'parses': self.parses,
+            'accepted': self.accepted,
+            'tokens': self.tokens,
+            'shifts': self.shifts,
+            'reduces': self.reduces,
+            'shift_reduce_ratio': self.shift_reduce_ratio,
+            'unit_reduction_share': self.unit_reductions(),
+            'max_stack_depth': self.max_stack_depth,
+            'hot_states': [{'state': state, 'visits': visits} for state, visits in self.hot_states(top)],
+            'hot_productions': [{'lhs': lhs, 'rhs': list(rhs), 'reductions': count}
+                                for lhs, rhs, count in self.hot_productions(top)],
+        }
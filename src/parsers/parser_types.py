@@ -0,0 +1,125 @@
+# GLOBAL IMPORTS
+from concurrent.futures import ThreadPoolExecutor
+
+# LOCAL IMPORTS
+from src.parsers.lalr1_parser import LALR1Parser
+from src.parsers.lr0_parser import LR0Parser
+from src.parsers.lr1_parser import LR1Parser
+from src.parsers.slr1_parser import SLR1Parser
+
+# Parser classes keyed by their display name
+PARSER_TYPES = {
+    "LR(0)": LR0Parser,
+    "SLR(1)": SLR1Parser,
+    "LALR(1)": LALR1Parser,
+    "LR(1)": LR1Parser,
+}
+
+# Short, shell-friendly aliases for the display names
+PARSER_ALIASES = {
+    "lr0": "LR(0)",
+    "slr1": "SLR(1)",
+    "lalr1": "LALR(1)",
+    "lr1": "LR(1)",
+}
+
+
+def get_parser_class(parser_type):
+    """Looks up a parser class by its display name (e.g. `"LALR(1)"`) or alias (e.g. `"lalr1"`).
+
+    Args:
+        parser_type (str): The display name or alias of the parser type.
+
+    Returns:
+        Type[LRParser]: The matching parser class.
+
+    Raises:
+        ValueError: If the parser type is unknown.
+    """
+    name = PARSER_ALIASES.get(parser_type.lower(), parser_type)
+    if name not in PARSER_TYPES:
+        raise ValueError(f"Unknown parser type '{parser_type}'. Expected one of: {', '.join(PARSER_TYPES)}")
+    return PARSER_TYPES[name]
+
+
+def build_parser(grammar, parser_type, progress=None, lazy=False, workers=None, instrumentation=None,
+                 unit_shortcuts=False, prune=False):
+    """Constructs a parser of the given type and builds its canonical collection and parsing tables.
+
+    Args:
+        grammar (ContextFreeGrammar): The grammar to build the parser for.
+        parser_type (str): The display name or alias of the parser type.
+        progress (Callable[[int, int], None], optional): Progress callback passed on to `items()`.
+        lazy (bool, optional): Only start a lazy construction (see `LRParser.start_lazy`);
+            `progress` is not used.
+        workers (int, optional): Number of processes used by `items()`; the default builds serially.
+        instrumentation (BuildInstrumentation, optional): Collects build-phase measurements.
+        unit_shortcuts (bool, optional): Let the drivers bypass chains of unit reductions (see
+            `LRParser.eliminate_unit_productions`); ignored for lazy construction.
+        prune (bool, optional): Remove unproductive and unreachable symbols from the grammar first.
+
+    Returns:
+        LRParser: The fully constructed parser, or the lazily constructed one.
+
+    Raises:
+        NotImplementedError: If `lazy` is set for a parser type that cannot be built lazily.
+        ValueError: If `prune` is set and the start symbol derives no terminal string.
+    """
+    parser = get_parser_class(parser_type)(grammar, instrumentation, prune)
+    if lazy:
+        parser.start_lazy()
+        return parser
+    parser.items(progress, workers)
+    parser.construct_parsing_table()
+    if unit_shortcuts:
+        parser.eliminate_unit_productions()
+    return parser
+
+
+def build_parsers(grammar, parser_types=None, max_workers=None, **options):
+    """Builds parsers of several types from one grammar, concurrently in threads.
+
+    Parsers only read the grammar they are given and work on their own augmented copy, so a single
+    grammar object can be shared by all builds. The threads overlap the builds but share the
+    interpreter lock; for CPU parallelism within one large build, pass `workers` (see `build_parser`).
+
+    Args:
+        grammar (ContextFreeGrammar): The grammar; it is not modified.
+        parser_types (List[str], optional): Parser display names or aliases; defaults to all types.
+        max_workers (int, optional): Number of threads; defaults to one per parser type.
+        **options: Further keyword arguments for `build_parser`, applied to every build.
+
+    Returns:
+        Dict[str, LRParser]: The parsers keyed by display name, in the order of `parser_types`.
+
+    Raises:
+        ValueError: If a parser type is unknown, before any build starts.
+    """
+    names = [_display_name(parser_type) for parser_type in parser_types or list(PARSER_TYPES)]
+    with ThreadPoolExecutor(max_workers or len(names) or 1, thread_name_prefix="build") as pool:
+        futures = {name: pool.submit(build_parser, grammar, name, **options) for name in names}
+        return {name: future.result() for name, future in futures.items()}
+
+
+def _display_name(parser_type):
+    parser_class = get_parser_class(parser_type)
+    return next(name for name, cls in PARSER_TYPES.items() if cls is parser_class)
+
+
+def classify(grammar, parser_types=None, stop_at_first=True):
+    """Checks a grammar against several parser types without building tables.
+
+    Args:
+        grammar (ContextFreeGrammar): The grammar to classify.
+        parser_types (List[str], optional): Parser display names or aliases; defaults to all types.
+        stop_at_first (bool, optional): Stop each check at its first conflict.
+
+    Returns:
+        Dict[str, List[Conflict]]: The conflicts found for each parser type, keyed by display name;
+            an empty list means the grammar belongs to that class.
+    """
+    result = {}
+    for parser_type in parser_types or list(PARSER_TYPES):
+        name = _display_name(parser_type)
+        result[name] = PARSER_TYPES[name](grammar).check_conflicts(stop_at_first)
+    return result
@@ -0,0 +1,253 @@
+"""Syntax error recovery, so that a single parse reports every syntax error.
+
+`LRParser.diagnose(tokens, recovery)` parses like `recognize`, but at a missing ACTION entry it
+records a `SyntaxDiagnostic` and tries the strategies of the `ErrorRecovery` configuration in order:
+
+- `'repair'`: delete the offending token, insert a terminal before it, or replace it. Only terminals
+  the parser accepts in its current configuration are tried, and a repair is taken only if the next
+  `window` tokens can then be parsed.
+- `'error_productions'`: as in yacc, pop the stack to a state that shifts the `error` token (from
+  productions such as `stmt -> error ';'`), shift it, and discard input until a token is acceptable.
+- `'panic'`: discard input up to a synchronising terminal, then pop the stack to a state that
+  accepts it, or that accepts the next token if the synchronising terminal is discarded as well.
+
+Parsing stops when the input is accepted, when no strategy applies at the end of the input, or after
+`max_errors` diagnostics.
+"""
+
+# LOCAL IMPORTS
+from src.grammars.loader import ERROR_TOKEN
+
+STRATEGIES = ('repair', 'error_productions', 'panic')
+
+
+class ErrorRecovery:
+    """Configures error recovery.
+
+    Attributes:
+        strategies (Tuple[str, ...]): The strategies to try, in order; a subset of `STRATEGIES`.
+        sync_terminals (Set[str]): Terminals at which panic mode resumes parsing; the end of the input
+            always synchronises.
+        window (int): Number of tokens that must parse after a single-token repair.
+        max_errors (int): Maximum number of diagnostics before parsing stops.
+    """
+
+    def __init__(self, strategies=STRATEGIES, sync_terminals=(), window=3, max_errors=100):
+        """Initializes the configuration.
+
+        Args:
+            strategies (Iterable[str], optional): The strategies to try, in order.
+            sync_terminals (Iterable[str], optional): Synchronising terminals for panic mode.
+            window (int, optional): Tokens that must parse after a repair.
+            max_errors (int, optional): Maximum number of diagnostics.
+
+        Raises:
+            ValueError: If a strategy is unknown.
+        """
+        self.strategies = tuple(strategies)
+        unknown = [strategy for strategy in self.strategies if strategy not in STRATEGIES]
+        if unknown:
+            raise ValueError(f"Unknown recovery strategies: {', '.join(unknown)}. "
+                             f"Expected: {', '.join(STRATEGIES)}")
+        self.sync_terminals = set(sync_terminals)
+        self.window = window
+        self.max_errors = max_errors
+
+
+class SyntaxDiagnostic:
+    """A syntax error found during a recovering parse.
+
+    Attributes:
+        position (int): Index of the offending token in the input; the end of the input is `len(tokens)`.
+        token (str): The offending token, `$` at the end of the input.
+        expected (List[str]): The terminals the parser would have accepted.
+        repair (str): How parsing resumed, or None if it could not.
+    """
+
+    def __init__(self, position, token, expected, repair=None):
+        self.position = position
+        self.token = token
+        self.expected = expected
+        self.repair = repair
+
+    def as_dict(self):
+        """Returns the diagnostic as a JSON-serialisable dictionary."""
+        return {
+            'position': self.position,
+            'token': self.token,
+            'expected': self.expected,
+            'repair': self.repair,
+        }
+
+    def __str__(self):
+        token = 'end of input' if self.token == '$' else f"'{self.token}'"
+        expected = ' '.join(self.expected) or 'nothing'
+        return f"position {self.position}: unexpected {token}, expected {expected} ({self.repair or 'parsing abandoned'})"
+
+    def __repr__(self):
+        return f"SyntaxDiagnostic(position={self.position}, token={self.token!r}, repair={self.repair!r})"
+
+
+class RecoveryResult:
+    """The outcome of a recovering parse.
+
+    Attributes:
+        diagnostics (List[SyntaxDiagnostic]): The syntax errors, in input order.
+        completed (bool): Whether the parse reached the accept action, possibly after repairs.
+        error_limit_reached (bool): Whether parsing stopped after `max_errors` diagnostics.
+    """
+
+    def __init__(self, diagnostics, completed, error_limit_reached):
+        self.diagnostics = diagnostics
+        self.completed = completed
+        self.error_limit_reached = error_limit_reached
+
+    @property
+    def accepted(self):
+        """bool: Whether the input is valid, i.e. the parse completed without any diagnostic."""
+        return self.completed and not self.diagnostics
+
+    def __repr__(self):
+        return (f"RecoveryResult(errors={len(self.diagnostics)}, completed={self.completed}, "
+                f"error_limit_reached={self.error_limit_reached})")
+
+
+def expected_terminals(parser, stack):
+    """Returns the terminals the parser accepts in a configuration, in grammar order.
+
+    Args:
+        parser (Union[LRParser, CompiledParser]): The parser.
+        stack (List[int]): The state stack; it is not modified.
+
+    Returns:
+        List[str]: The acceptable terminals, including `$`.
+    """
+    terminals = [t for t in parser.terminals if t not in ('ε', ERROR_TOKEN)]
+    return [t for t in terminals if parser.step(list(stack), t) is not None]
+
+
+def _parses(parser, stack, tokens):
+    trial = list(stack)
+    for token in tokens:
+        action = parser.step(trial, token)
+        if action is None:
+            return False
+        if action[0] == 'accept':
+            return True
+    return True
+
+
+def _repair(parser, stack, tokens, index, expected, window):
+    """Finds a single-token repair; returns `(description, inserted terminal or None, tokens consumed)`."""
+    token = tokens[index]
+    if token != '$' and _parses(parser, stack, tokens[index + 1:index + 1 + window]):
+        return f"deleted '{token}'", None, 1
+    following = tokens[index:index + window]
+    for terminal in expected:
+        if terminal != '$' and _parses(parser, stack, [terminal] + following):
+            return f"inserted '{terminal}'", terminal, 0
+    if token != '$':
+        following = tokens[index + 1:index + 1 + window]
+        for terminal in expected:
+            if terminal != '$' and _parses(parser, stack, [terminal] + following):
+                return f"replaced '{token}' with '{terminal}'", terminal, 1
+    return None
+
+
+def _error_production(parser, stack, tokens, index):
+    """Recovers with an `error` production; returns `(stack, index)` or None."""
+    for depth in range(len(stack), 0, -1):
+        action = parser.action_for(stack[depth - 1], ERROR_TOKEN)
+        if action is not None and action[0] == 'shift':
+            trial = stack[:depth] + [action[1]]
+            while parser.step(list(trial), tokens[index]) is None:
+                if tokens[index] == '$':
+                    return None
+                index += 1
+            return trial, index
+    return None
+
+
+def _panic(parser, stack, tokens, index, sync_terminals, window):
+    """Skips to a synchronising terminal and pops to a state accepting it, or accepting the token after
+    it if the synchronising terminal itself is discarded; returns `(stack, index)` or None.
+
+    Resumption points after which the next `window` tokens parse are preferred to the deepest one.
+    """
+    while True:
+        token = tokens[index]
+        if token in sync_terminals or token == '$':
+            candidates = [(stack[:depth], resume)
+                          for resume in ((index, index + 1) if token != '$' else (index,))
+                          for depth in range(len(stack), 0, -1)
+                          if parser.step(stack[:depth], tokens[resume]) is not None]
+            for trial, resume in candidates:
+                if _parses(parser, trial, tokens[resume:resume + window]):
+                    return trial, resume
+            if candidates:
+                return candidates[0]
+            if token == '$':
+                return None
+        index += 1
+
+
+def recover(parser, tokens, recovery):
+    """Parses a token sequence, recovering from syntax errors as configured.
+
+    Args:
+        parser (Union[LRParser, CompiledParser]): A parser with built tables (or a lazy one).
+        tokens (Iterable[str]): The input tokens, without the end marker.
+        recovery (ErrorRecovery): The recovery configuration.
+
+    Returns:
+        RecoveryResult: The diagnostics and whether the parse completed.
+    """
+    tokens = list(tokens) + ['$']
+    stack = [0]
+    index = 0
+    diagnostics = []
+    last_error = None
+    while True:
+        token = tokens[index]
+        # After an error, the stack holds the configuration reached by the reductions the token selected
+        action = parser.step(stack, token)
+        if action is not None:
+            if action[0] == 'accept':
+                return RecoveryResult(diagnostics, True, False)
+            index += 1
+            continue
+
+        if len(diagnostics) >= recovery.max_errors:
+            return RecoveryResult(diagnostics, False, True)
+        diagnostic = SyntaxDiagnostic(index, token, expected_terminals(parser, stack))
+        diagnostics.append(diagnostic)
+        # A second error at the same place means the last recovery made no progress
+        repeated = last_error == (index, len(stack))
+        last_error = (index, len(stack))
+
+        for strategy in recovery.strategies:
+            if strategy == 'repair' and not repeated:
+                repair = _repair(parser, stack, tokens, index, diagnostic.expected, recovery.window)
+                if repair is not None:
+                    diagnostic.repair, inserted, consumed = repair
+                    if inserted is not None:
+                        parser.step(stack, inserted)
+                    index += consumed
+                    break
+            elif strategy == 'error_productions':
+                resumed = _error_production(parser, stack, tokens, index)
+                if resumed is not None:
+                    stack, resume_index = resumed
+                    diagnostic.repair = f"error production, skipped {resume_index - index} tokens"
+                    index = resume_index
+                    break
+            elif strategy == 'panic':
+                skip = 1 if repeated and token != '$' else 0
+                resumed = _panic(parser, stack, tokens, index + skip, recovery.sync_terminals, recovery.window)
+                if resumed is not None:
+                    stack, resume_index = resumed
+                    diagnostic.repair = f"skipped {resume_index - index} tokens"
+                    index = resume_index
+                    break
+        if diagnostic.repair is None:
+            return RecoveryResult(diagnostics, False, False)
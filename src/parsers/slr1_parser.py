@@ -18,11 +18,11 @@ class SLR1Parser(LR0Parser):
         C (list): The canonical collection of item sets used in constructing the parsing tables.
 
     Methods:
-        construct_parsing_table():
-            Constructs the ACTION and GOTO tables for the SLR(1) parser, resolving reduce actions using FOLLOW sets.
+        reduce_lookaheads(item):
+            Resolves reduce actions using the FOLLOW set of the item's left-hand side.
     """
 
-    def __init__(self, context_free_grammar):
+    def __init__(self, context_free_grammar, instrumentation=None, prune=False):
         """Initializes the SLRParser with a context-free grammar.
 
         This method computes the FOLLOW sets for all non-terminals in the grammar and
@@ -30,49 +30,32 @@ class SLR1Parser(LR0Parser):
 
         Args:
             context_free_grammar (ContextFreeGrammar): The context-free grammar to be used by the parser.
+            instrumentation (BuildInstrumentation, optional): Records build-phase measurements.
+            prune (bool, optional): First remove useless symbols from the grammar.
         """
-        super().__init__(context_free_grammar)
-        self.grammar.compute_follow()
+        super().__init__(context_free_grammar, instrumentation, prune)
+        with self.phase('follow'):
+            self.grammar.compute_follow()
 
-    def construct_parsing_table(self):
-        """Constructs the ACTION and GOTO tables for the SLR(1) parser.
+    def stale_reductions(self, new_terminals, follow_changed):
+        """Returns the non-terminals whose reduce lookaheads may have changed: those whose FOLLOW set changed.
 
-        The ACTION table maps (state, terminal) pairs to parser actions (shift, reduce, or accept).
-        Reduce actions are determined using FOLLOW sets for the corresponding non-terminal.
+        Args:
+            new_terminals (bool): Whether the edit introduced new terminals.
+            follow_changed (Set[str]): Non-terminals whose FOLLOW set changed.
+
+        Returns:
+            Set[str]: `follow_changed`.
+        """
+        return follow_changed
+
+    def reduce_lookaheads(self, item):
+        """Returns the terminals on which a completed item is reduced: the FOLLOW set of its left-hand side.
+
+        Args:
+            item (LR0Item): An item with the dot at the end of its right-hand side.
 
-        Raises:
-            ValueError: If there is a conflict during the construction of the parsing tables.
+        Returns:
+            Set[str]: FOLLOW(item.lhs).
         """
-        # Construct ACTION table
-        for I in self.C:
-            state_no = self.states[frozenset(I)]
-            for item in I:
-                # Shift action
-                if item.dot_position < len(item.rhs):
-                    symbol = item.rhs[item.dot_position]
-                    if symbol in self.grammar.terminals:
-                        next_state = self.transitions.get((state_no, symbol))
-                        if next_state is not None:
-                            action_key = (state_no, symbol)
-                            action_value = ('shift', next_state)
-                            if action_key in self.action and self.action[action_key] != action_value:
-                                print(f"Conflict at state {state_no}, symbol {symbol}")
-                            self.action[action_key] = action_value
-                # Reduce or Accept action
-                else:
-                    # Accept action
-                    if item.lhs == self.grammar.augmented_start_symbol:
-                        self.action[(state_no, '$')] = ('accept',)
-                    # Reduce action
-                    else:
-                        for follow_symbol in self.grammar.follow[item.lhs]:
-                            action_key = (state_no, follow_symbol)
-                            action_value = ('reduce', item.lhs, item.rhs)
-                            if action_key in self.action and self.action[action_key] != action_value:
-                                print(f"Conflict at state {state_no}, symbol {follow_symbol}")
-                            self.action[action_key] = action_value
-            # Construct GOTO table
-            for A in self.grammar.non_terminals:
-                next_state = self.transitions.get((state_no, A))
-                if next_state is not None:
-                    self.goto_table[(state_no, A)] = next_state
+        return self.grammar.follow[item.lhs]
@@ -0,0 +1,158 @@
+# GLOBAL IMPORTS
+from array import array
+
+# Sentinel codes used in the encoded tables
+ERROR = 0
+NO_GOTO = -1
+END_MARKER = '$'
+
+
+class EncodedTables:
+    """Compact, integer-encoded representation of the ACTION and GOTO tables of an LR parser.
+
+    Every state owns one row per table, stored as a typed `array('i')`, so a table with thousands of
+    states costs a few bytes per cell instead of one Python tuple per entry. Columns are addressed by
+    position in `terminals` (ACTION) and `non_terminals` (GOTO).
+
+    ACTION cells are encoded as follows:
+        - `0` (`ERROR`): no action is defined.
+        - `n > 0`: shift and go to state `n - 1`.
+        - `n < 0`: reduce by production `-n - 1`. Production `0` is the augmented production,
+          so `-1` means accept.
+
+    GOTO cells hold the target state, or `-1` (`NO_GOTO`) when the entry is empty.
+
+    Attributes:
+        terminals (List[str]): ACTION column labels, the grammar terminals followed by the end marker `$`.
+        non_terminals (List[str]): GOTO column labels.
+        productions (List[Tuple[str, List[str]]]): Productions of the augmented grammar, indexed by number.
+        action (List[array]): One encoded ACTION row per state.
+        goto (List[array]): One encoded GOTO row per state.
+    """
+
+    def __init__(self, terminals, non_terminals, productions, action, goto):
+        """Initializes the encoded tables from already encoded rows.
+
+        Args:
+            terminals (List[str]): ACTION column labels.
+            non_terminals (List[str]): GOTO column labels.
+            productions (List[Tuple[str, List[str]]]): Productions of the augmented grammar.
+            action (List[array]): Encoded ACTION rows.
+            goto (List[array]): Encoded GOTO rows.
+        """
+        self.terminals = terminals
+        self.non_terminals = non_terminals
+        self.productions = productions
+        self.action = action
+        self.goto = goto
+        self.terminal_index = {symbol: idx for idx, symbol in enumerate(terminals)}
+        self.non_terminal_index = {symbol: idx for idx, symbol in enumerate(non_terminals)}
+
+    @classmethod
+    def from_parser(cls, parser):
+        """Encodes the ACTION and GOTO tables of a constructed parser.
+
+        Args:
+            parser (LRParser): A parser whose `construct_parsing_table()` has already been called.
+
+        Returns:
+            EncodedTables: The encoded tables.
+        """
+        grammar = parser.grammar
+        terminals = [t for t in grammar.terminals if t != END_MARKER] + [END_MARKER]
+        non_terminals = [A for A in grammar.non_terminals if A != grammar.augmented_start_symbol]
+        terminal_index = {symbol: idx for idx, symbol in enumerate(terminals)}
+        non_terminal_index = {symbol: idx for idx, symbol in enumerate(non_terminals)}
+
+        n_states = len(parser.C)
+        for state, _ in parser.action:
+            n_states = max(n_states, state + 1)
+        for state, _ in parser.goto_table:
+            n_states = max(n_states, state + 1)
+
+        empty_action = array('i', [ERROR]) * len(terminals)
+        empty_goto = array('i', [NO_GOTO]) * len(non_terminals)
+        action = [array('i', empty_action) for _ in range(n_states)]
+        goto = [array('i', empty_goto) for _ in range(n_states)]
+
+        for (state, symbol), entry in parser.action.items():
+            action[state][terminal_index[symbol]] = cls.encode_action(grammar, entry)
+        for (state, non_terminal), target in parser.goto_table.items():
+            if non_terminal in non_terminal_index:
+                goto[state][non_terminal_index[non_terminal]] = target
+
+        return cls(terminals, non_terminals, list(grammar.productions), action, goto)
+
+    @staticmethod
+    def encode_action(grammar, entry):
+        """Encodes a single ACTION entry as an integer.
+
+        Args:
+            grammar (ContextFreeGrammar): The augmented grammar the entry refers to.
+            entry (Tuple): An ACTION entry: `('shift', state)`, `('reduce', lhs, rhs)` or `('accept',)`.
+
+        Returns:
+            int: The encoded action.
+        """
+        if entry[0] == 'shift':
+            return entry[1] + 1
+        if entry[0] == 'reduce':
+            return -grammar.get_production_number((entry[1], entry[2])) - 1
+        return -1
+
+    def decode_action(self, code):
+        """Decodes an integer ACTION cell back into the tuple form used by `LRParser.parse`.
+
+        Args:
+            code (int): The encoded action.
+
+        Returns:
+            Union[Tuple, None]: The decoded action, or None for an error cell.
+        """
+        if code == ERROR:
+            return None
+        if code > 0:
+            return ('shift', code - 1)
+        if code == -1:
+            return ('accept',)
+        lhs, rhs = self.productions[-code - 1]
+        return ('reduce', lhs, rhs)
+
+    def action_label(self, code):
+        """Renders an ACTION cell in the conventional compact notation.
+
+        Args:
+            code (int): The encoded action.
+
+        Returns:
+            str: `s<state>` for shifts, `r<production number>` for reductions, `acc` for acceptance
+            and an empty string for error cells.
+        """
+        if code == ERROR:
+            return ''
+        if code > 0:
+            return f"s{code - 1}"
+        if code == -1:
+            return 'acc'
+        return f"r{-code - 1}"
+
+    @property
+    def n_states(self):
+        """int: Number of states (rows) in the tables."""
+        return len(self.action)
+
+    def action_bytes(self):
+        """Returns the ACTION table as one contiguous, row-major buffer of native `int32` values.
+
+        Returns:
+            bytes: The concatenated ACTION rows, suitable for zero-copy wrapping by array libraries.
+        """
+        return b''.join(row.tobytes() for row in self.action)
+
+    def goto_bytes(self):
+        """Returns the GOTO table as one contiguous, row-major buffer of native `int32` values.
+
+        Returns:
+            bytes: The concatenated GOTO rows.
+        """
+        return b''.join(row.tobytes() for row in self.goto)
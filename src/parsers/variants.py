@@ -0,0 +1,174 @@
+"""Builds the LR(0), SLR(1) and LALR(1) parsers of a grammar from one LR(0) automaton.
+
+The three parser types only differ in the lookaheads of their reductions: LR(0) reduces on every
+terminal, SLR(1) on the FOLLOW set of the left-hand side and LALR(1) on the lookaheads propagated
+through the LR(0) states. `build_variants` therefore constructs the LR(0) collection once, lets the
+SLR(1) parser share it and derives the LALR(1) states from it (see `LALR1Parser.items_from_lr0`)
+instead of merging a canonical LR(1) collection. The canonical LR(1) parser has its own, larger
+collection and is only built on request.
+
+The result compares the state counts, table sizes and conflicts of the parser types, e.g. to show
+them side by side before choosing one.
+"""
+
+# GLOBAL IMPORTS
+import time
+
+# LOCAL IMPORTS
+from src.parsers.lalr1_parser import LALR1Parser
+from src.parsers.lr0_parser import LR0Parser
+from src.parsers.lr1_parser import LR1Parser
+from src.parsers.slr1_parser import SLR1Parser
+
+# Bytes per cell of the integer-encoded tables (see `EncodedTables`)
+CELL_BYTES = 4
+
+
+class VariantSummary:
+    """The size and conflicts of one parser type.
+
+    Attributes:
+        parser_type (str): The display name of the parser type, e.g. `LALR(1)`.
+        states (int): Number of states.
+        action_entries (int): Number of non-error ACTION entries.
+        goto_entries (int): Number of GOTO entries.
+        table_bytes (int): Size of the integer-encoded ACTION and GOTO tables.
+        shift_reduce (int): Shift/reduce conflicts not settled by precedence declarations.
+        reduce_reduce (int): Reduce/reduce conflicts not settled by precedence declarations.
+        precedence (int): Conflicts settled by precedence declarations.
+        seconds (float): Time spent on this parser type, excluding the shared LR(0) collection.
+    """
+
+    def __init__(self, parser_type, parser, seconds):
+        """Summarises a constructed parser.
+
+        Args:
+            parser_type (str): The display name of the parser type.
+            parser (LRParser): The parser, with its tables built.
+            seconds (float): The construction time to report.
+        """
+        grammar = parser.grammar
+        conflicts = list(parser.conflicts.values())
+        unresolved = [conflict for conflict in conflicts if conflict.resolved_by != 'precedence']
+        self.parser_type = parser_type
+        self.states = len(parser.C)
+        self.action_entries = len(parser.action)
+        self.goto_entries = len(parser.goto_table)
+        self.table_bytes = self.states * (len(grammar.terminals) + 1 + len(grammar.non_terminals)) * CELL_BYTES
+        self.shift_reduce = sum(conflict.kind == 'shift/reduce' for conflict in unresolved)
+        self.reduce_reduce = len(unresolved) - self.shift_reduce
+        self.precedence = len(conflicts) - len(unresolved)
+        self.seconds = seconds
+
+    @property
+    def conflict_free(self):
+        """bool: Whether the grammar belongs to the class of this parser type."""
+        return not self.shift_reduce and not self.reduce_reduce
+
+    def as_dict(self):
+        """Returns the summary as a JSON-serialisable dictionary."""
+        return {
+            'parser': self.parser_type,
+            'states': self.states,
+            'action_entries': self.action_entries,
+            'goto_entries': self.goto_entries,
+            'table_bytes': self.table_bytes,
+            'shift_reduce': self.shift_reduce,
+            'reduce_reduce': self.reduce_reduce,
+            'precedence': self.precedence,
+            'seconds': round(self.seconds, 6),
+        }
+
+    def __repr__(self):
+        return (f"VariantSummary({self.parser_type}, states={self.states}, shift_reduce={self.shift_reduce}, "
+                f"reduce_reduce={self.reduce_reduce})")
+
+
+class VariantBuild:
+    """The parsers built by `build_variants` and their comparison.
+
+    Attributes:
+        parsers (Dict[str, LRParser]): The parsers keyed by display name, from the weakest type to the
+            strongest.
+        summaries (List[VariantSummary]): One summary per parser, in the same order.
+        collection_seconds (float): Time spent on the shared LR(0) collection.
+
+    Methods:
+        comparison():
+            Returns the summaries as a list of dictionaries, one row per parser type.
+        weakest_conflict_free():
+            Returns the weakest parser type without conflicts.
+    """
+
+    def __init__(self, parsers, summaries, collection_seconds):
+        self.parsers = parsers
+        self.summaries = summaries
+        self.collection_seconds = collection_seconds
+
+    def comparison(self):
+        """Returns the summaries as a list of dictionaries, one row per parser type.
+
+        Returns:
+            List[dict]: The rows, e.g. for a table or JSON output.
+        """
+        return [summary.as_dict() for summary in self.summaries]
+
+    def weakest_conflict_free(self):
+        """Returns the weakest of the built parser types that has no unresolved conflicts.
+
+        Returns:
+            Union[str, None]: The display name, or None if every built type has conflicts.
+        """
+        return next((summary.parser_type for summary in self.summaries if summary.conflict_free), None)
+
+
+def build_variants(grammar, include_lr1=False, prune=False):
+    """Builds the LR(0), SLR(1) and LALR(1) parsers of a grammar from a single LR(0) collection.
+
+    The tables are the same as those `build_parser` returns for each type; only the LALR(1) states
+    are numbered like the LR(0) states instead of in the order of the LR(1) collection.
+
+    Args:
+        grammar (ContextFreeGrammar): The grammar; it is not modified.
+        include_lr1 (bool, optional): Also build the canonical LR(1) parser, from its own collection.
+        prune (bool, optional): Remove unproductive and unreachable symbols from the grammar first.
+
+    Returns:
+        VariantBuild: The parsers and their comparison.
+
+    Raises:
+        ValueError: If `prune` is set and the start symbol derives no terminal string.
+    """
+    start = time.perf_counter()
+    lr0 = LR0Parser(grammar, prune=prune)
+    lr0.items()
+    collection_seconds = time.perf_counter() - start
+
+    parsers = {}
+    summaries = []
+
+    def add(parser_type, parser, started):
+        parser.construct_parsing_table()
+        parsers[parser_type] = parser
+        summaries.append(VariantSummary(parser_type, parser, time.perf_counter() - started))
+
+    add("LR(0)", lr0, time.perf_counter())
+
+    started = time.perf_counter()
+    slr = SLR1Parser(grammar, prune=prune)
+    # Item sets are not modified once built, so the containers are enough to copy
+    slr.C, slr.states, slr.transitions = list(lr0.C), dict(lr0.states), dict(lr0.transitions)
+    add("SLR(1)", slr, started)
+
+    started = time.perf_counter()
+    lalr = LALR1Parser(grammar, prune=prune)
+    lalr.items_from_lr0(lr0)
+    add("LALR(1)", lalr, started)
+
+    if include_lr1:
+        started = time.perf_counter()
+        lr1 = LR1Parser(grammar, prune=prune)
+        lr1.items()
+        add("LR(1)", lr1, started)
+
+    return VariantBuild(parsers, summaries, collection_seconds)
@@ -0,0 +1,137 @@
+"""Asyncio client for the parse service (see `src.service.server`)."""
+
+# GLOBAL IMPORTS
+import asyncio
+
+# LOCAL IMPORTS
+from src.service.protocol import ProtocolError, read_frame, write_frame
+
+
+class ServiceError(RuntimeError):
+    """Raised when the service answers a request with an error."""
+
+
+class ParseClient:
+    """A connection to the parse service; requests on one connection are answered in order.
+
+    Attributes:
+        reader (asyncio.StreamReader): The incoming side of the connection.
+        writer (asyncio.StreamWriter): The outgoing side of the connection.
+
+    Methods:
+        connect(path, host, port):
+            Opens a connection to a Unix socket or a TCP port.
+        register(grammar_id, grammar, parser_type, patterns):
+            Registers a grammar.
+        parse(grammar_id, tokens, text):
+            Parses tokens or text.
+        parse_stream(grammar_id, chunks, kind):
+            Parses input sent in several frames.
+        grammars():
+            Lists the registered grammars.
+        close():
+            Closes the connection.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    async def connect(cls, path=None, host='127.0.0.1', port=7300):
+        """Opens a connection.
+
+        Args:
+            path (str, optional): Unix socket path; if given, `host` and `port` are ignored.
+            host (str, optional): TCP host.
+            port (int, optional): TCP port.
+
+        Returns:
+            ParseClient: The connected client.
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, *frames):
+        """Sends the frames of one request and waits for the response.
+
+        Args:
+            *frames (dict): The request frame, followed by the input frames of a streamed request.
+
+        Returns:
+            dict: The response, without the `ok` field.
+
+        Raises:
+            ServiceError: If the service reports an error.
+        """
+        async with self._lock:
+            for frame in frames:
+                await write_frame(self.writer, frame)
+            response = await read_frame(self.reader)
+        if response is None:
+            raise ProtocolError("The service closed the connection")
+        if not response.pop('ok', False):
+            raise ServiceError(response.get('error', 'unknown error'))
+        return response
+
+    async def register(self, grammar_id, grammar, parser_type='lalr1', patterns=None):
+        """Registers a grammar under an id.
+
+        Args:
+            grammar_id (str): The id.
+            grammar (str): The grammar text.
+            parser_type (str, optional): The display name or alias of the parser type.
+            patterns (Dict[str, str], optional): Regular expressions for terminals in text requests.
+
+        Returns:
+            dict: The description of the built parser.
+        """
+        return await self.request({'op': 'register', 'grammar_id': grammar_id, 'grammar': grammar,
+                                   'parser': parser_type, 'patterns': patterns})
+
+    async def parse(self, grammar_id, tokens=None, text=None):
+        """Parses tokens or text in one frame.
+
+        Args:
+            grammar_id (str): The id of a registered grammar.
+            tokens (List[str], optional): The input tokens.
+            text (str, optional): The input text.
+
+        Returns:
+            dict: `accepted`, `tokens` and, for rejected input, `diagnostics`.
+        """
+        request = {'op': 'parse', 'grammar_id': grammar_id}
+        if tokens is not None:
+            request['tokens'] = list(tokens)
+        else:
+            request['text'] = text
+        return await self.request(request)
+
+    async def parse_stream(self, grammar_id, chunks, kind='tokens'):
+        """Parses input sent as a sequence of frames.
+
+        Args:
+            grammar_id (str): The id of a registered grammar.
+            chunks (Iterable[Union[List[str], str]]): Token lists or text pieces.
+            kind (str, optional): `'tokens'` or `'text'`.
+
+        Returns:
+            dict: `accepted`, `tokens` and, for rejected input, `diagnostics`.
+        """
+        frames = [{'op': 'parse', 'grammar_id': grammar_id, 'stream': True}]
+        frames += [{kind: list(chunk) if kind == 'tokens' else chunk} for chunk in chunks]
+        frames.append({'end': True})
+        return await self.request(*frames)
+
+    async def grammars(self):
+        """Returns the descriptions of the registered grammars."""
+        return (await self.request({'op': 'grammars'}))['grammars']
+
+    async def close(self):
+        """Closes the connection."""
+        self.writer.close()
+        await self.writer.wait_closed()
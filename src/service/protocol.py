@@ -0,0 +1,88 @@
+"""Wire format of the parse service.
+
+Every message is one frame: a 4-byte big-endian length followed by that many bytes of UTF-8 JSON
+holding an object. A request names an operation in `op`; the response to it carries `ok` and either
+the result fields or an `error` message:
+
+- `{"op": "register", "grammar_id": ..., "grammar": TEXT, "parser": "lalr1", "patterns": {...}}`
+  builds a parser (and a lexer for text requests) and keeps it under the id.
+- `{"op": "parse", "grammar_id": ..., "tokens": [...]}` or `{..., "text": "..."}` parses the input.
+  With `"stream": true` the input follows in further frames, `{"tokens": [...]}` or
+  `{"text": "..."}`, up to a frame `{"end": true}`; only then is the response sent.
+- `{"op": "grammars"}` lists the registered grammars.
+
+A parse result holds `accepted`, the number of `tokens` and, for rejected input, the `diagnostics`
+of an error-recovering parse (see `SyntaxDiagnostic.as_dict`).
+"""
+
+# GLOBAL IMPORTS
+import asyncio
+import json
+import struct
+
+_HEADER = struct.Struct('>I')
+# Frames above this size are refused, so a bad length cannot make the reader allocate unbounded memory
+MAX_FRAME = 64 * 1024 * 1024
+
+
+class ProtocolError(ValueError):
+    """Raised when a frame is malformed or too large."""
+
+
+def encode_frame(message):
+    """Encodes a message as a length-prefixed frame.
+
+    Args:
+        message (dict): A JSON-serialisable object.
+
+    Returns:
+        bytes: The frame.
+    """
+    payload = json.dumps(message, separators=(',', ':')).encode('utf-8')
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader, max_frame=MAX_FRAME):
+    """Reads one frame from a stream.
+
+    Args:
+        reader (asyncio.StreamReader): The stream.
+        max_frame (int, optional): The largest payload accepted, in bytes.
+
+    Returns:
+        Union[dict, None]: The message, or None if the stream ended cleanly before a frame.
+
+    Raises:
+        ProtocolError: If the frame is too large, truncated or not a JSON object.
+    """
+    try:
+        header = await reader.readexactly(_HEADER.size)
+    except asyncio.IncompleteReadError as e:
+        if e.partial:
+            raise ProtocolError("Truncated frame header") from e
+        return None
+    (length,) = _HEADER.unpack(header)
+    if length > max_frame:
+        raise ProtocolError(f"Frame of {length} bytes exceeds the limit of {max_frame}")
+    try:
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError as e:
+        raise ProtocolError("Truncated frame") from e
+    try:
+        message = json.loads(payload)
+    except ValueError as e:
+        raise ProtocolError(f"Frame is not valid JSON: {e}") from e
+    if not isinstance(message, dict):
+        raise ProtocolError("Frame must hold a JSON object")
+    return message
+
+
+async def write_frame(writer, message):
+    """Writes one frame to a stream and waits until it can be buffered.
+
+    Args:
+        writer (asyncio.StreamWriter): The stream.
+        message (dict): A JSON-serialisable object.
+    """
+    writer.write(encode_frame(message))
+    await writer.drain()
@@ -0,0 +1,257 @@
+"""Registry of compiled parsers with atomic hot reload.
+
+Each grammar id points at its current `ParserVersion`. A reload builds a new parser outside the
+registry lock, then replaces the pointer in one assignment under it, so a request sees either the
+old or the new version and never a partially built one. Versions hold immutable `CompiledParser`s,
+so the item sets of a build are freed as soon as it is compiled.
+Requests hold a version for their whole duration through `acquire`, which counts references. A
+version that has been replaced is released when its last reference is returned, so in-flight
+parses finish on the version they started with.
+
+Grammar files can be watched: `reload_changed` compares their modification time and size with
+those of the last build and rebuilds the grammars whose files changed. A failed build keeps the
+current version and records the error.
+"""
+
+# GLOBAL IMPORTS
+import contextlib
+import itertools
+import os
+import threading
+
+# LOCAL IMPORTS
+from src.grammars.loader import parse_grammar
+from src.lexer.lexer import Lexer
+from src.parsers.parser_types import build_parser
+
+
+def compile_grammar(grammar_text, parser_type, patterns=None):
+    """Builds the parser and the lexer of a grammar.
+
+    Args:
+        grammar_text (str): The grammar, in the grammar file format.
+        parser_type (str): The display name or alias of the parser type.
+        patterns (Dict[str, str], optional): Regular expressions for terminals in text requests.
+
+    Returns:
+        Tuple[CompiledParser, Lexer]: The compiled parser, without the construction data, and the lexer.
+
+    Raises:
+        ValueError: If the grammar, the parser type or a pattern is invalid.
+    """
+    grammar = parse_grammar(grammar_text)
+    lexer = Lexer.for_grammar(grammar, patterns)
+    return build_parser(grammar, parser_type).compile(), lexer
+
+
+class ParserVersion:
+    """One build of a grammar.
+
+    Attributes:
+        grammar_id (str): The id clients use.
+        version (int): Increases with every build in the registry.
+        spec (Tuple[str, str, dict]): The grammar text, parser type and patterns it was built from.
+        parser (CompiledParser): The parser, or None once the version is released.
+        lexer (Lexer): The lexer for text requests, or None once the version is released.
+        references (int): Number of requests holding the version.
+        retired (bool): Whether a newer version has replaced this one.
+    """
+
+    def __init__(self, grammar_id, version, spec, parser, lexer):
+        self.grammar_id = grammar_id
+        self.version = version
+        self.spec = spec
+        self.parser = parser
+        self.lexer = lexer
+        self.references = 0
+        self.retired = False
+
+    @property
+    def released(self):
+        """bool: Whether the version's parser has been dropped."""
+        return self.parser is None
+
+    def as_dict(self):
+        """Returns the version's description as a JSON-serialisable dictionary."""
+        return {
+            'grammar_id': self.grammar_id,
+            'version': self.version,
+            'parser': self.spec[1],
+            'states': self.parser.n_states if self.parser is not None else None,
+            'references': self.references,
+        }
+
+    def __repr__(self):
+        return (f"ParserVersion({self.grammar_id!r}, version={self.version}, references={self.references}, "
+                f"retired={self.retired})")
+
+
+class ParserRegistry:
+    """Holds the current parser of every grammar id and swaps in rebuilt ones atomically.
+
+    Attributes:
+        on_release (Callable[[ParserVersion], None]): Called when a replaced version is released.
+        errors (Dict[str, Exception]): The error of the last failed reload of each grammar id.
+
+    Methods:
+        install(grammar_id, grammar_text, parser_type, patterns):
+            Builds a parser and makes it the current version.
+        acquire(grammar_id):
+            Holds the current version for the duration of a `with` block.
+        current(grammar_id):
+            Returns the current version without holding it.
+        watch(grammar_id, path, parser_type, patterns):
+            Builds a parser from a file and rebuilds it when the file changes.
+        reload_changed():
+            Rebuilds the grammars whose files changed.
+    """
+
+    def __init__(self, on_release=None):
+        """Initializes an empty registry.
+
+        Args:
+            on_release (Callable[[ParserVersion], None], optional): Called with each released version.
+        """
+        self.on_release = on_release
+        self.errors = {}
+        self._current = {}
+        self._watched = {}
+        self._versions = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def __contains__(self, grammar_id):
+        return grammar_id in self._current
+
+    def versions(self):
+        """Returns the current versions, in registration order."""
+        return list(self._current.values())
+
+    def current(self, grammar_id):
+        """Returns the current version of a grammar without holding it.
+
+        Raises:
+            ValueError: If the grammar is unknown.
+        """
+        version = self._current.get(grammar_id)
+        if version is None:
+            raise ValueError(f"Unknown grammar '{grammar_id}'")
+        return version
+
+    def install(self, grammar_id, grammar_text, parser_type='lalr1', patterns=None):
+        """Builds a parser and makes it the current version of a grammar id.
+
+        The build runs in the calling thread without holding the lock; only the swap is locked.
+        The replaced version is released at once if no request holds it.
+
+        Args:
+            grammar_id (str): The id.
+            grammar_text (str): The grammar text.
+            parser_type (str, optional): The display name or alias of the parser type.
+            patterns (Dict[str, str], optional): Regular expressions for terminals in text requests.
+
+        Returns:
+            ParserVersion: The new current version.
+
+        Raises:
+            ValueError: If the grammar, the parser type or a pattern is invalid; the current version
+                is kept.
+        """
+        spec = (grammar_text, parser_type, patterns)
+        parser, lexer = compile_grammar(*spec)
+        with self._lock:
+            version = ParserVersion(grammar_id, next(self._versions), spec, parser, lexer)
+            previous = self._current.get(grammar_id)
+            self._current[grammar_id] = version
+            if previous is not None:
+                previous.retired = True
+                released = self._release_if_unused(previous)
+            else:
+                released = None
+        self._notify(released)
+        return version
+
+    @contextlib.contextmanager
+    def acquire(self, grammar_id):
+        """Holds the current version of a grammar for the duration of a `with` block.
+
+        Args:
+            grammar_id (str): The id.
+
+        Yields:
+            ParserVersion: The version, which stays usable until the block ends even if it is replaced.
+
+        Raises:
+            ValueError: If the grammar is unknown.
+        """
+        with self._lock:
+            version = self.current(grammar_id)
+            version.references += 1
+        try:
+            yield version
+        finally:
+            with self._lock:
+                version.references -= 1
+                released = self._release_if_unused(version)
+            self._notify(released)
+
+    def _release_if_unused(self, version):
+        # Called with the lock held; returns the version if it was released now
+        if version.retired and version.references == 0 and not version.released:
+            version.parser = version.lexer = None
+            return version
+        return None
+
+    def _notify(self, released):
+        if released is not None and self.on_release is not None:
+            self.on_release(released)
+
+    @staticmethod
+    def _file_signature(path):
+        status = os.stat(path)
+        return status.st_mtime_ns, status.st_size
+
+    def watch(self, grammar_id, path, parser_type='lalr1', patterns=None):
+        """Builds a parser from a grammar file and rebuilds it whenever `reload_changed` finds the
+        file changed.
+
+        Args:
+            grammar_id (str): The id.
+            path (str): The grammar file.
+            parser_type (str, optional): The display name or alias of the parser type.
+            patterns (Dict[str, str], optional): Regular expressions for terminals in text requests.
+
+        Returns:
+            ParserVersion: The first version.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the grammar is invalid.
+        """
+        signature = self._file_signature(path)
+        with open(path, encoding='utf-8') as file:
+            version = self.install(grammar_id, file.read(), parser_type, patterns)
+        self._watched[grammar_id] = [path, parser_type, patterns, signature]
+        return version
+
+    def reload_changed(self):
+        """Rebuilds the watched grammars whose files changed since their last build.
+
+        Returns:
+            Dict[str, Union[ParserVersion, Exception]]: For each changed grammar id, the new version
+                or the error that kept the previous one.
+        """
+        results = {}
+        for grammar_id, watched in list(self._watched.items()):
+            path, parser_type, patterns, signature = watched
+            try:
+                current = self._file_signature(path)
+                if current == signature:
+                    continue
+                # Record the signature first, so that a broken file is not rebuilt on every check
+                watched[3] = current
+                with open(path, encoding='utf-8') as file:
+                    results[grammar_id] = self.install(grammar_id, file.read(), parser_type, patterns)
+                self.errors.pop(grammar_id, None)
+            except (OSError, ValueError) as e:
+                self.errors[grammar_id] = results[grammar_id] = e
+        return results
@@ -0,0 +1,402 @@
+"""Asyncio parse service that holds compiled parsers keyed by grammar id.
+
+Clients connect over a Unix socket or localhost TCP and exchange length-prefixed JSON frames (see
+`src.service.protocol`). Small inputs are recognized in the event loop, where a table-driven parse
+of a few thousand tokens takes about a millisecond; larger ones, and the recovering parse of rejected
+input, whose cost depends on the errors rather than the size, are sent to a process pool, whose
+workers build their own copy of a parser the first time they see its grammar version. A semaphore
+bounds the number of parses in progress, so a burst of requests queues instead of flooding the pool.
+Malformed requests and failures in the pool are answered with an error; only framing errors close
+the connection.
+
+Parsers live in a `ParserRegistry`. Re-registering a grammar, or changing a watched grammar file,
+builds the new parser in a thread and swaps it in atomically; parses in progress finish on the
+version they started with, which is released when the last of them ends.
+
+    python -m src.service.server --socket /tmp/parse.sock --workers 4 --grammar expr=expr.grammar
+"""
+
+# GLOBAL IMPORTS
+import argparse
+import asyncio
+import contextlib
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# LOCAL IMPORTS
+from src.parsers.recovery import ErrorRecovery
+from src.service.protocol import ProtocolError, read_frame, write_frame
+from src.service.registry import ParserRegistry, compile_grammar
+
+# Inputs of up to this many tokens (or characters of text) are parsed in the event loop
+INLINE_LIMIT = 10000
+MAX_DIAGNOSTICS = 100
+
+# The parsers of a worker process by grammar id, as `(version, parser, lexer)`
+_worker_parsers = {}
+
+
+def run_parse(parser, lexer, tokens=None, text=None, max_errors=MAX_DIAGNOSTICS):
+    """Parses tokens or text and describes the outcome.
+
+    Args:
+        parser (CompiledParser): The parser.
+        lexer (Lexer): The lexer for text input.
+        tokens (List[str], optional): The input tokens.
+        text (str, optional): The input text, used if no tokens are given.
+        max_errors (int, optional): Maximum number of diagnostics for rejected input.
+
+    Returns:
+        dict: `accepted`, the number of `tokens` and, for rejected input, the `diagnostics`.
+
+    Raises:
+        LexError: If the text cannot be lexed.
+    """
+    if tokens is None:
+        tokens = list(lexer.terminals(text or ''))
+    if parser.recognize(tokens):
+        return {'accepted': True, 'tokens': len(tokens)}
+    result = parser.diagnose(tokens, ErrorRecovery(max_errors=max_errors))
+    return {
+        'accepted': False,
+        'tokens': len(tokens),
+        'diagnostics': [diagnostic.as_dict() for diagnostic in result.diagnostics],
+        'error_limit_reached': result.error_limit_reached,
+    }
+
+
+def check_input(tokens, text):
+    """Checks the input fields of a parse request.
+
+    Args:
+        tokens: The `tokens` field, which must be a list of strings if present.
+        text: The `text` field, which must be a string if present.
+
+    Raises:
+        ValueError: If a field has the wrong type.
+    """
+    if tokens is not None and not (isinstance(tokens, list) and all(isinstance(token, str) for token in tokens)):
+        raise ValueError("'tokens' must be a list of strings")
+    if text is not None and not isinstance(text, str):
+        raise ValueError("'text' must be a string")
+
+
+def _worker_parse(grammar_id, version, spec, tokens, text, max_errors):
+    entry = _worker_parsers.get(grammar_id)
+    if entry is None or entry[0] != version:
+        entry = _worker_parsers[grammar_id] = (version, *compile_grammar(*spec))
+    return run_parse(entry[1], entry[2], tokens, text, max_errors)
+
+
+class ParseService:
+    """Serves parse requests for registered grammars.
+
+    Attributes:
+        workers (int): Size of the process pool for large inputs.
+        max_concurrency (int): Maximum number of parses in progress; further requests wait.
+        inline_limit (int): Largest input, in tokens or characters, parsed in the event loop.
+        max_errors (int): Maximum number of diagnostics returned for rejected input.
+        watch_interval (float): Seconds between checks of watched grammar files.
+        registry (ParserRegistry): The parsers by grammar id.
+        parses (int): Number of parse requests completed.
+        offloaded (int): Number of those that ran in the process pool.
+
+    Methods:
+        start(path, host, port):
+            Starts listening on a Unix socket or a TCP port.
+        serve_forever():
+            Serves until cancelled.
+        close():
+            Stops listening and shuts the process pool down.
+        register(grammar_id, grammar, parser_type, patterns):
+            Builds and keeps a parser under an id.
+        watch(grammar_id, path, parser_type, patterns):
+            Builds a parser from a grammar file and reloads it when the file changes.
+        parse(grammar_id, tokens, text):
+            Parses input for a registered grammar.
+    """
+
+    def __init__(self, workers=None, max_concurrency=None, inline_limit=INLINE_LIMIT, max_errors=MAX_DIAGNOSTICS,
+                 watch_interval=1.0):
+        """Initializes the service without starting it.
+
+        Args:
+            workers (int, optional): Size of the process pool; defaults to the number of CPUs.
+            max_concurrency (int, optional): Maximum parses in progress; defaults to twice `workers`.
+            inline_limit (int, optional): Largest input parsed in the event loop.
+            max_errors (int, optional): Maximum number of diagnostics per response.
+            watch_interval (float, optional): Seconds between checks of watched grammar files.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or 2 * self.workers
+        self.inline_limit = inline_limit
+        self.max_errors = max_errors
+        self.watch_interval = watch_interval
+        self.registry = ParserRegistry()
+        self.parses = 0
+        self.offloaded = 0
+        self._watcher = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._pool = None
+        self._server = None
+        # The writers of open connections by handler task, so that `close` can end them
+        self._connections = {}
+
+    async def start(self, path=None, host='127.0.0.1', port=0):
+        """Starts listening.
+
+        Args:
+            path (str, optional): Unix socket path; if given, `host` and `port` are ignored.
+            host (str, optional): TCP host, localhost by default.
+            port (int, optional): TCP port; 0 picks a free one (see `address`).
+
+        Returns:
+            ParseService: The service itself, for chaining.
+        """
+        self._pool = ProcessPoolExecutor(self.workers)
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host, port)
+        self._watcher = asyncio.create_task(self._watch_files())
+        return self
+
+    @property
+    def address(self):
+        """Union[str, Tuple[str, int]]: The socket path or `(host, port)` the service listens on."""
+        return self._server.sockets[0].getsockname()
+
+    async def serve_forever(self):
+        """Serves requests until the task is cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stops listening, closes open connections once their current request is answered and shuts
+        the process pool down."""
+        if self._watcher is not None:
+            self._watcher.cancel()
+            await asyncio.gather(self._watcher, return_exceptions=True)
+        if self._server is not None:
+            self._server.close()
+            for writer in self._connections.values():
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self._server.wait_closed()
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+
+    async def register(self, grammar_id, grammar, parser_type='lalr1', patterns=None):
+        """Builds a parser and makes it the current version of a grammar id.
+
+        The build runs in a thread, so the event loop keeps serving other requests meanwhile,
+        including parses with the previous version of the grammar.
+
+        Args:
+            grammar_id (str): The id.
+            grammar (str): The grammar text.
+            parser_type (str, optional): The display name or alias of the parser type.
+            patterns (Dict[str, str], optional): Regular expressions for terminals in text requests.
+
+        Returns:
+            ParserVersion: The new version.
+
+        Raises:
+            ValueError: If the grammar, the parser type or a pattern is invalid.
+        """
+        return await asyncio.to_thread(self.registry.install, grammar_id, grammar, parser_type, patterns)
+
+    async def watch(self, grammar_id, path, parser_type='lalr1', patterns=None):
+        """Builds a parser from a grammar file, which is checked for changes every `watch_interval`.
+
+        Args:
+            grammar_id (str): The id.
+            path (str): The grammar file.
+            parser_type (str, optional): The display name or alias of the parser type.
+            patterns (Dict[str, str], optional): Regular expressions for terminals in text requests.
+
+        Returns:
+            ParserVersion: The first version.
+
+        Raises:
+            OSError: If the file cannot be read.
+            ValueError: If the grammar is invalid.
+        """
+        return await asyncio.to_thread(self.registry.watch, grammar_id, path, parser_type, patterns)
+
+    async def _watch_files(self):
+        while True:
+            await asyncio.sleep(self.watch_interval)
+            await asyncio.to_thread(self.registry.reload_changed)
+
+    async def parse(self, grammar_id, tokens=None, text=None):
+        """Parses input for a registered grammar, in the event loop or in the process pool.
+
+        Inputs of up to `inline_limit` tokens or characters are recognized in the event loop; larger
+        ones, and the recovering parse of rejected input, run in the pool. The current version of the
+        grammar is held until the parse ends, so a reload meanwhile does not affect it.
+
+        Args:
+            grammar_id (str): The id of the grammar.
+            tokens (List[str], optional): The input tokens.
+            text (str, optional): The input text, lexed with the grammar's lexer.
+
+        Returns:
+            dict: The outcome, as described in `run_parse`, and the `version` that produced it.
+
+        Raises:
+            ValueError: If the grammar is unknown, the input has the wrong type or the text cannot be
+                lexed.
+            BrokenProcessPool: If a worker died; the pool is replaced for later requests.
+        """
+        check_input(tokens, text)
+        size = len(tokens) if tokens is not None else len(text or '')
+        async with self._semaphore:
+            with self.registry.acquire(grammar_id) as version:
+                result = None
+                if size <= self.inline_limit:
+                    if tokens is None:
+                        tokens, text = list(version.lexer.terminals(text or '')), None
+                    if version.parser.recognize(tokens):
+                        result = {'accepted': True, 'tokens': len(tokens)}
+                if result is None:
+                    self.offloaded += 1
+                    result = await self._run_in_pool(grammar_id, version, tokens, text)
+        self.parses += 1
+        return {**result, 'version': version.version}
+
+    async def _run_in_pool(self, grammar_id, version, tokens, text):
+        pool = self._pool
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                pool, _worker_parse, grammar_id, version.version, version.spec, tokens, text, self.max_errors)
+        except BrokenProcessPool:
+            # A broken pool refuses all further work; the first request to notice replaces it
+            if self._pool is pool:
+                self._pool = ProcessPoolExecutor(self.workers)
+                pool.shutdown(wait=False)
+            raise
+
+    async def _handle(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                message = await read_frame(reader)
+                if message is None:
+                    break
+                await write_frame(writer, await self._dispatch(message, reader))
+        except ProtocolError as e:
+            with contextlib.suppress(ConnectionError):
+                await write_frame(writer, {'ok': False, 'error': str(e)})
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            with contextlib.suppress(ConnectionError):
+                await writer.wait_closed()
+
+    async def _dispatch(self, message, reader):
+        op = message.get('op')
+        try:
+            if op == 'register':
+                version = await self.register(message['grammar_id'], message['grammar'],
+                                              message.get('parser', 'lalr1'), message.get('patterns'))
+                return {'ok': True, **version.as_dict()}
+            if op == 'parse':
+                tokens, text = message.get('tokens'), message.get('text')
+                if message.get('stream'):
+                    tokens, text = await self._read_stream(reader, tokens, text)
+                return {'ok': True, **await self.parse(message['grammar_id'], tokens, text)}
+            if op == 'grammars':
+                return {'ok': True, 'grammars': [version.as_dict() for version in self.registry.versions()]}
+            raise ValueError(f"Unknown operation '{op}'")
+        except KeyError as e:
+            return {'ok': False, 'error': f"Missing field {e}"}
+        except ProtocolError:
+            # Framing errors close the connection wherever they occur (see `_handle`)
+            raise
+        except ValueError as e:
+            return {'ok': False, 'error': str(e)}
+        except ConnectionError:
+            raise
+        except Exception as e:
+            # E.g. a broken process pool or an error raised in a worker: the request fails, the
+            # connection stays usable
+            return {'ok': False, 'error': f"{type(e).__name__}: {e}"}
+
+    @staticmethod
+    async def _read_stream(reader, tokens, text):
+        # Checked once the end frame is read, so that a rejected request leaves no frames behind
+        token_chunks = [tokens] if tokens is not None else []
+        parts = [text] if text is not None else []
+        while True:
+            frame = await read_frame(reader)
+            if frame is None:
+                raise ProtocolError("Connection closed inside a streamed request")
+            if frame.get('end'):
+                break
+            if 'tokens' in frame:
+                token_chunks.append(frame['tokens'])
+            if 'text' in frame:
+                parts.append(frame['text'])
+        for chunk in token_chunks:
+            check_input(chunk, None)
+        for part in parts:
+            check_input(None, part)
+        if token_chunks and parts:
+            raise ValueError("A streamed request cannot mix tokens and text")
+        tokens = [token for chunk in token_chunks for token in chunk] if token_chunks else None
+        return tokens, ''.join(parts) if parts else None
+
+
+def main(argv=None):
+    """Runs the parse service from the command line.
+
+    Args:
+        argv (List[str], optional): Command-line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit status.
+    """
+    arg_parser = argparse.ArgumentParser(prog="python -m src.service.server", description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--socket", help="listen on this Unix socket path")
+    arg_parser.add_argument("--host", default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    arg_parser.add_argument("--port", type=int, default=7300, help="TCP port (default: 7300)")
+    arg_parser.add_argument("--workers", type=int, help="process pool size (default: number of CPUs)")
+    arg_parser.add_argument("--max-concurrency", type=int, help="parses in progress (default: 2 x workers)")
+    arg_parser.add_argument("--grammar", action="append", metavar="ID=PATH",
+                            help="serve a grammar file under an id and reload it when it changes; repeatable")
+    arg_parser.add_argument("--parser", default="lalr1", help="parser type of the --grammar files")
+    arg_parser.add_argument("--pattern", action="append", metavar="TERMINAL=REGEX",
+                            help="regular expression for a terminal of the --grammar files; repeatable")
+    arg_parser.add_argument("--watch-interval", type=float, default=1.0,
+                            help="seconds between checks of the --grammar files (default: 1)")
+    arg_parser.add_argument("--inline-limit", type=int, default=INLINE_LIMIT,
+                            help=f"largest input parsed without the pool (default: {INLINE_LIMIT})")
+    args = arg_parser.parse_args(argv)
+
+    patterns = dict(definition.partition("=")[::2] for definition in args.pattern or ())
+
+    async def serve():
+        service = ParseService(args.workers, args.max_concurrency, args.inline_limit,
+                               watch_interval=args.watch_interval)
+        for definition in args.grammar or ():
+            grammar_id, _, path = definition.partition("=")
+            await service.watch(grammar_id, path, args.parser, patterns or None)
+        await service.start(args.socket, args.host, args.port)
+        print(f"listening on {service.address}", file=sys.stderr)
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    with contextlib.suppress(KeyboardInterrupt):
+        asyncio.run(serve())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,13 +1,20 @@
 # GLOBAL IMPORTS
+import time
+
 import streamlit as st
 import pandas as pd
 
 # LOCAL IMPORTS
-from src.grammars.context_free_grammar import ContextFreeGrammar
-from src.parsers.lalr1_parser import LALR1Parser
-from src.parsers.lr0_parser import LR0Parser
-from src.parsers.lr1_parser import LR1Parser
-from src.parsers.slr1_parser import SLR1Parser
+from src.grammars.loader import GrammarSyntaxError, parse_grammar
+from src.parsers.build_job import BuildJob
+from src.parsers.conflicts import format_action
+from src.parsers.parser_types import PARSER_TYPES
+from src.parsers.tables import EncodedTables
+from src.parsers.variants import build_variants
+from src.ui.tables import action_dataframe, export_csv, export_parquet, goto_dataframe
+
+# Seconds between refreshes of the build progress bar
+BUILD_POLL_INTERVAL = 0.25
 
 
 def run_ui() -> None:
@@ -16,8 +23,11 @@ def run_ui() -> None:
 
     Features:
         - Collects user input for grammar definition, including non-terminals, terminals, productions, and the start symbol.
-        - Validates the grammar input and constructs a context-free grammar object.
+        - Validates the grammar input with the shared grammar loader and constructs a context-free grammar object.
         - Allows the user to select and build one of the following LR parsers: LR(0), SLR(1), LALR(1), or LR(1).
+          Builds run in a background thread with a progress bar, a cancel button and a configurable timeout.
+        - Compares the state counts, table sizes and conflicts of the parser types side by side, building
+          LR(0), SLR(1) and LALR(1) from one LR(0) collection.
         - Displays various parser internal structures, including:
             - Augmented Grammar
             - FIRST Sets
@@ -36,52 +46,49 @@ def run_ui() -> None:
     start_symbol = st.sidebar.text_input("Enter the start symbol:", "")
 
     st.sidebar.subheader("Productions")
-    st.sidebar.write("Use '->' to separate LHS and RHS, and '|' for alternatives.")
+    st.sidebar.write("Use '->' to separate LHS and RHS, '|' for alternatives and '#' for comments.")
     productions = st.sidebar.text_area("Enter productions (one per line):", "")
 
     if st.sidebar.button("Define Grammar"):
-        if not all([non_terminals, terminals, start_symbol, productions]):
-            st.error("Please complete all grammar fields.")
+        if not productions.strip():
+            st.error("Please enter at least one production.")
         else:
-            non_terminals_list = non_terminals.split()
-            terminals_list = terminals.split()
-            productions_list = []
-            for line in productions.splitlines():
-                if '->' in line:
-                    lhs, rhs = line.split('->')
-                    lhs = lhs.strip()
-                    rhs = rhs.strip()
-                    alternatives = rhs.split('|')
-                    for alt in alternatives:
-                        prod_rhs = alt.strip().split()
-                        productions_list.append((lhs, prod_rhs))
-                else:
-                    st.error(f"Invalid production format: {line}")
-                    return
+            try:
+                grammar = parse_grammar(productions, terminals.split() or None, non_terminals.split() or None,
+                                        start_symbol.strip() or None)
+            except GrammarSyntaxError as e:
+                for line, message in e.errors:
+                    st.error(f"Line {line}: {message}" if line else message)
+                return
 
-            grammar = ContextFreeGrammar(terminals_list, non_terminals_list, productions_list, start_symbol)
             st.session_state['grammar'] = grammar
+            st.session_state.pop('build_job', None)
+            st.session_state.pop('variant_comparison', None)
             st.success("Grammar defined successfully!")
 
     if 'grammar' in st.session_state:
         grammar = st.session_state['grammar']
         st.subheader("Select Parser Type")
-        parser_type = st.selectbox("Choose a parser type:", ["LR(0)", "SLR(1)", "LALR(1)", "LR(1)"])
-
-        if st.button("Build Parser"):
-            if parser_type == "LR(0)":
-                parser = LR0Parser(grammar)
-            elif parser_type == "SLR(1)":
-                parser = SLR1Parser(grammar)
-            elif parser_type == "LALR(1)":
-                parser = LALR1Parser(grammar)
-            elif parser_type == "LR(1)":
-                parser = LR1Parser(grammar)
-
-            parser.items()
-            parser.construct_parsing_table()
-            st.session_state['parser'] = parser
-            st.success(f"{parser_type} Parser built successfully!")
+        parser_type = st.selectbox("Choose a parser type:", list(PARSER_TYPES))
+
+        compare_column, lr1_column = st.columns(2)
+        with lr1_column:
+            include_lr1 = st.checkbox("Include LR(1) (builds its own, larger collection)")
+        with compare_column:
+            if st.button("Compare Parser Types"):
+                st.session_state['variant_comparison'] = build_variants(grammar, include_lr1=include_lr1)
+        if 'variant_comparison' in st.session_state:
+            _render_variant_comparison(st.session_state['variant_comparison'])
+
+        timeout = st.number_input("Build timeout (seconds, 0 for none):", min_value=0, value=60, step=10)
+
+        job = st.session_state.get('build_job')
+        if st.button("Build Parser", disabled=job is not None and not job.finished):
+            job = BuildJob(grammar, parser_type, timeout=timeout or None).start()
+            st.session_state['build_job'] = job
+
+        if job is not None and not _render_build_job(job):
+            return
 
         if 'parser' in st.session_state:
             parser = st.session_state['parser']
@@ -93,6 +100,7 @@ def run_ui() -> None:
                 "Canonical Collection of Items",
                 "ACTION Table",
                 "GOTO Table",
+                "Conflicts",
                 "Parse Input String",
             ])
 
@@ -125,25 +133,37 @@ def run_ui() -> None:
 
             elif feature == "ACTION Table":
                 st.write("**ACTION Table:**")
-                action_data = {}
-                for (state, symbol), action in parser.action.items():
-                    if state not in action_data:
-                        action_data[state] = {}
-                    action_data[state][symbol] = str(action)
-                action_table = pd.DataFrame(action_data).T
-                action_table.index.name = "State"
-                st.dataframe(action_table, use_container_width=True)
+                tables = _encoded_tables(parser)
+                st.dataframe(action_dataframe(tables), use_container_width=True)
+                _render_export_buttons(tables, "action")
 
             elif feature == "GOTO Table":
                 st.write("**GOTO Table:**")
-                goto_data = {}
-                for (state, non_terminal), goto in parser.goto_table.items():
-                    if state not in goto_data:
-                        goto_data[state] = {}
-                    goto_data[state][non_terminal] = str(goto)
-                goto_table = pd.DataFrame(goto_data).T
-                goto_table.index.name = "State"
-                st.dataframe(goto_table, use_container_width=True)
+                tables = _encoded_tables(parser)
+                st.dataframe(goto_dataframe(tables), use_container_width=True)
+                _render_export_buttons(tables, "goto")
+
+            elif feature == "Conflicts":
+                unresolved = [c for c in parser.conflicts.values() if c.resolved_by != 'precedence']
+                if not parser.conflicts:
+                    st.success("The ACTION table has no conflicts.")
+                elif not unresolved:
+                    st.success("Every conflict is resolved by the precedence declarations.")
+                else:
+                    st.warning(f"{len(unresolved)} conflicting ACTION entries are not covered by precedence "
+                               f"declarations; each keeps the shift, or the reduction by the production "
+                               f"listed first.")
+                if parser.conflicts:
+                    conflicts_df = pd.DataFrame([{
+                        "State": conflict.state,
+                        "Symbol": conflict.symbol,
+                        "Kind": conflict.kind,
+                        "Actions": ' vs '.join(format_action(action) for action in conflict.actions),
+                        "Items": '; '.join(map(str, conflict.items)),
+                        "Resolution": format_action(conflict.resolution),
+                        "Resolved By": conflict.resolved_by,
+                    } for conflict in parser.conflicts.values()])
+                    st.dataframe(conflicts_df, use_container_width=True)
 
             elif feature == "Parse Input String":
                 input_string = st.text_input("Enter the input string (tokens separated by spaces):")
@@ -173,3 +193,99 @@ def run_ui() -> None:
 
                     except ValueError as e:
                         st.error(f"Error during parsing: {e}")
+
+
+def _render_variant_comparison(build):
+    """Shows the state counts, table sizes and conflicts of the parser types side by side.
+
+    Args:
+        build (VariantBuild): The parsers built from the shared LR(0) collection.
+    """
+    comparison = pd.DataFrame(build.comparison()).set_index('parser')
+    comparison['ms'] = comparison.pop('seconds') * 1000
+    st.dataframe(comparison.drop(columns='precedence'), use_container_width=True)
+    weakest = build.weakest_conflict_free()
+    st.caption(f"Shared LR(0) collection built in {build.collection_seconds * 1000:.1f} ms. "
+               + (f"{weakest} is the weakest parser type without conflicts." if weakest
+                  else "Every compared parser type has conflicts."))
+
+
+def _render_build_job(job):
+    """Shows the state of a background parser build.
+
+    While the build runs, renders a progress bar and a cancel button and schedules a rerun of the
+    script to refresh them. Once the build succeeds, installs the parser in the session state.
+
+    Args:
+        job (BuildJob): The build job to display.
+
+    Returns:
+        bool: True if the rest of the page may be rendered, False while the build is still running.
+    """
+    if not job.finished:
+        phase = "Building ACTION/GOTO tables" if job.phase == 'table' else "Constructing canonical collection"
+        st.progress(job.fraction_done, text=f"{phase}: {job.states_discovered} states discovered, "
+                                            f"{job.queue_length} queued ({job.elapsed:.1f} s)")
+        if st.button("Cancel Build"):
+            job.cancel()
+        time.sleep(BUILD_POLL_INTERVAL)
+        st.rerun()
+        return False
+
+    if job.status == 'done':
+        if st.session_state.get('parser') is not job.parser:
+            st.session_state['parser'] = job.parser
+            st.session_state.pop('encoded_tables', None)
+            st.session_state.pop('table_exports', None)
+            st.success(f"{job.parser_type} Parser built successfully in {job.elapsed:.2f} s!")
+    elif job.status == 'failed':
+        st.error(f"Build failed: {job.error}")
+    else:
+        st.warning(f"Build {job.status} after {job.elapsed:.1f} s ({job.states_discovered} states discovered).")
+    return True
+
+
+def _encoded_tables(parser):
+    """Returns the integer-encoded tables of the current parser, encoding them once per build."""
+    if 'encoded_tables' not in st.session_state:
+        st.session_state['encoded_tables'] = EncodedTables.from_parser(parser)
+    return st.session_state['encoded_tables']
+
+
+def _render_export_buttons(tables, table):
+    """Renders the CSV and Parquet download buttons for a full ACTION or GOTO table.
+
+    The files are only produced after "Prepare Export" is clicked and are then kept until the next
+    build, so other interactions do not pay for exporting a large table on every rerun.
+    """
+    exports = st.session_state.setdefault('table_exports', {})
+    if table not in exports:
+        if not st.button("Prepare Export", key=f"prepare_{table}_export"):
+            return
+        try:
+            parquet_data = export_parquet(tables, table)
+        except ImportError:
+            parquet_data = None
+        exports[table] = (export_csv(tables, table), parquet_data)
+    csv_data, parquet_data = exports[table]
+
+    csv_column, parquet_column = st.columns(2)
+    with csv_column:
+        st.download_button(
+            "Export CSV",
+            data=csv_data,
+            file_name=f"{table}_table.csv",
+            mime="text/csv",
+            key=f"export_{table}_csv",
+        )
+    with parquet_column:
+        if parquet_data is None:
+            st.caption("Install `pyarrow` to enable Parquet export.")
+        else:
+            st.download_button(
+                "Export Parquet",
+                data=parquet_data,
+                file_name=f"{table}_table.parquet",
+                mime="application/octet-stream",
+                key=f"export_{table}_parquet",
+            )
@@ -0,0 +1,160 @@
+# GLOBAL IMPORTS
+import csv
+import io
+
+import numpy as np
+import pandas as pd
+
+# LOCAL IMPORTS
+from src.parsers.tables import NO_GOTO
+
+# Number of table rows decoded at once while exporting
+EXPORT_CHUNK_ROWS = 4096
+
+
+def _action_matrix(tables):
+    """Wraps the encoded ACTION rows as a 2-D `int32` matrix without copying them cell by cell."""
+    matrix = np.frombuffer(tables.action_bytes(), dtype=np.int32)
+    return matrix.reshape(tables.n_states, len(tables.terminals))
+
+
+def _goto_matrix(tables):
+    """Wraps the encoded GOTO rows as a 2-D `int32` matrix without copying them cell by cell."""
+    matrix = np.frombuffer(tables.goto_bytes(), dtype=np.int32)
+    return matrix.reshape(tables.n_states, len(tables.non_terminals))
+
+
+def _action_labels(tables):
+    """Builds the label vocabulary for ACTION codes.
+
+    A code `c` is rendered as `labels[c + offset]`, so the whole table is decoded with a single
+    fancy-indexing operation instead of one `str()` call per entry.
+
+    Returns:
+        Tuple[np.ndarray, int]: The label vocabulary and the offset to add to a code.
+    """
+    n_productions = len(tables.productions)
+    codes = range(-n_productions, tables.n_states + 1)
+    labels = np.array([tables.action_label(code) for code in codes], dtype=object)
+    return labels, n_productions
+
+
+def _decode_action(tables, matrix):
+    labels, offset = _action_labels(tables)
+    return labels[matrix + offset]
+
+
+def _decode_goto(matrix):
+    decoded = matrix.astype(str).astype(object)
+    decoded[matrix == NO_GOTO] = ''
+    return decoded
+
+
+def action_dataframe(tables):
+    """Builds the ACTION table view as a DataFrame.
+
+    Shifts are rendered as `s<state>`, reductions as `r<production number>` (matching the numbering
+    of the augmented grammar), acceptance as `acc` and errors as empty cells.
+
+    Args:
+        tables (EncodedTables): The encoded parser tables.
+
+    Returns:
+        pd.DataFrame: The decoded ACTION table, indexed by state.
+    """
+    frame = pd.DataFrame(_decode_action(tables, _action_matrix(tables)), columns=tables.terminals)
+    frame.index.name = "State"
+    return frame
+
+
+def goto_dataframe(tables):
+    """Builds the GOTO table view as a DataFrame.
+
+    Args:
+        tables (EncodedTables): The encoded parser tables.
+
+    Returns:
+        pd.DataFrame: The decoded GOTO table, indexed by state, with empty cells for missing entries.
+    """
+    frame = pd.DataFrame(_decode_goto(_goto_matrix(tables)), columns=tables.non_terminals)
+    frame.index.name = "State"
+    return frame
+
+
+def _decoded_chunks(tables, table):
+    """Yields `(first_state, decoded_rows)` pairs for a table, `EXPORT_CHUNK_ROWS` states at a time."""
+    if table == "action":
+        matrix = _action_matrix(tables)
+        labels, offset = _action_labels(tables)
+
+        def decode(rows):
+            return labels[rows + offset]
+    else:
+        matrix = _goto_matrix(tables)
+        decode = _decode_goto
+
+    for start in range(0, tables.n_states, EXPORT_CHUNK_ROWS):
+        yield start, decode(matrix[start:start + EXPORT_CHUNK_ROWS])
+
+
+def _columns(tables, table):
+    return tables.terminals if table == "action" else tables.non_terminals
+
+
+def export_csv(tables, table, output=None):
+    """Exports a full table as CSV.
+
+    Rows are decoded and written chunk by chunk, so the decoded strings of the whole table never
+    exist at the same time. Without `output` the document is collected in memory and returned,
+    which holds the whole file at once (Streamlit's download button needs it that way); pass a
+    binary file to keep memory bounded by one chunk for large tables.
+
+    Args:
+        tables (EncodedTables): The encoded parser tables.
+        table (str): Either `"action"` or `"goto"`.
+        output (BinaryIO, optional): A binary file to write the document to.
+
+    Returns:
+        Union[bytes, None]: The UTF-8 encoded CSV document, or None if it was written to `output`.
+    """
+    target = io.BytesIO() if output is None else output
+    text = io.TextIOWrapper(target, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(["State"] + _columns(tables, table))
+    for start, rows in _decoded_chunks(tables, table):
+        writer.writerows([state, *row] for state, row in enumerate(rows.tolist(), start))
+    text.flush()
+    text.detach()
+    return target.getvalue() if output is None else None
+
+
+def export_parquet(tables, table, output=None):
+    """Exports a full table as Parquet.
+
+    Each chunk of decoded rows is written as its own row group, so only one chunk of strings is
+    held in memory at a time. As with `export_csv`, the file itself is only kept in memory when no
+    `output` is given.
+
+    Args:
+        tables (EncodedTables): The encoded parser tables.
+        table (str): Either `"action"` or `"goto"`.
+        output (Union[str, BinaryIO], optional): A path or binary file to write the file to.
+
+    Returns:
+        Union[bytes, None]: The Parquet file contents, or None if they were written to `output`.
+
+    Raises:
+        ImportError: If `pyarrow` is not installed.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = _columns(tables, table)
+    schema = pa.schema([("State", pa.int32())] + [(str(column), pa.string()) for column in columns])
+    target = io.BytesIO() if output is None else output
+    with pq.ParquetWriter(target, schema) as writer:
+        for start, rows in _decoded_chunks(tables, table):
+            arrays = [pa.array(np.arange(start, start + len(rows), dtype=np.int32))]
+            arrays.extend(pa.array(rows[:, idx], type=pa.string()) for idx in range(len(columns)))
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+    return target.getvalue() if output is None else None
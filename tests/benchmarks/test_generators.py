@@ -0,0 +1,43 @@
+import pytest
+from benchmarks.generators import (GENERATORS, QUICK_CASES, epsilon_chains, lalr_stressors, layered_expressions,
+                                   precedence_expressions)
+from src.parsers.parser_types import build_parser
+from src.parsers.tables import EncodedTables
+
+
+@pytest.mark.parametrize("generator, params", QUICK_CASES)
+def test_generated_grammars_are_consistent(generator, params):
+    grammar = GENERATORS[generator](**params)
+    assert grammar.start_symbol in grammar.non_terminals
+    for lhs, rhs in grammar.productions:
+        assert lhs in grammar.non_terminal_set
+        assert all(symbol in grammar.terminal_set or symbol in grammar.non_terminal_set or symbol == 'ε'
+                   for symbol in rhs)
+
+
+def test_layered_expressions_are_lr1():
+    parser = build_parser(layered_expressions(3), "LR(1)")
+    assert parser.conflicts == {}
+    assert parser.parse(["id", "op0", "id", "op2", "(", "id", ")"]) is not None
+
+
+def test_precedence_expressions_need_fewer_states():
+    layered = build_parser(layered_expressions(4), "LALR(1)")
+    ambiguous = build_parser(precedence_expressions(4), "LALR(1)")
+    assert all(conflict.resolved_by == "precedence" for conflict in ambiguous.conflicts.values())
+    assert len(ambiguous.C) < len(layered.C)
+    tokens = ["id", "op0", "id", "op3", "(", "id", "op1", "id", ")"]
+    assert ambiguous.recognize(tokens) and layered.recognize(tokens)
+
+
+def test_lalr_stressors_split_lr1_states():
+    lalr = build_parser(lalr_stressors(3), "LALR(1)")
+    assert lalr.conflicts
+    lr1 = build_parser(lalr_stressors(3), "LR(1)")
+    assert lr1.conflicts == {}
+    assert EncodedTables.from_parser(lr1).n_states > EncodedTables.from_parser(lalr).n_states
+
+
+def test_epsilon_chains_are_nullable():
+    grammar = epsilon_chains(2, 3)
+    assert grammar.nullable_non_terminals() == set(grammar.non_terminals)
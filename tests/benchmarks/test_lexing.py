@@ -0,0 +1,14 @@
+from benchmarks.lexing import measure, render
+
+
+def test_render():
+    text = render(["kw0", "id", "=", "num", ";", "}"], seed=1)
+    assert text.split() == ["kw0", "v137", "=", "9325", ";", "}"]
+    assert text.count("\n") == 2
+
+
+def test_measure_both_modes():
+    result = measure("statement_language", {"kinds": 4}, "LALR(1)", 500)
+    assert result["plain"]["accepted"] and result["contextual"]["accepted"]
+    assert result["tokens"] >= 500
+    assert result["contextual"]["alternatives_per_token"] < result["plain"]["alternatives_per_token"]
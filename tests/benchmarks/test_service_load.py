@@ -0,0 +1,20 @@
+from benchmarks.generators import statement_language
+from benchmarks.service_load import grammar_text, main, percentile
+from src.grammars.loader import parse_grammar
+
+
+def test_grammar_text_round_trip():
+    grammar = statement_language(2)
+    loaded = parse_grammar(grammar_text(grammar))
+    assert loaded.productions == grammar.productions
+    assert loaded.terminals == grammar.terminals
+
+
+def test_percentile():
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 50 and percentile(values, 0.99) == 99
+
+
+def test_load_run(capsys):
+    assert main(["--clients", "2", "--requests", "5", "--length", "50", "--workers", "1"]) == 0
+    assert "p99" in capsys.readouterr().err
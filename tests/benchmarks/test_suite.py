@@ -0,0 +1,25 @@
+import json
+from benchmarks.suite import PHASES, compare, main, run_suite
+
+
+def test_run_suite_reports_all_phases():
+    report = run_suite([("lalr_stressors", {"copies": 1})], repeat=1)
+    assert report["metadata"]["repeat"] == 1
+    assert [result["parser"] for result in report["results"]] == ["LR(0)", "SLR(1)", "LALR(1)", "LR(1)"]
+    for result in report["results"]:
+        assert result["states"] > 0
+        assert result["peak_memory_bytes"] > 0
+        expected = set(PHASES) if result["parser"] == "LALR(1)" else set(PHASES) - {"merge_states"}
+        assert set(result["best_ms"]) == expected
+
+
+def test_compare_matches_cases(tmp_path, capsys):
+    before = run_suite([("layered_expressions", {"levels": 1})], ["SLR(1)"], repeat=1)
+    rows = compare(before, before)
+    assert {phase for _, phase, _, _ in rows} == set(before["results"][0]["best_ms"]) | {"peak_memory_bytes"}
+    assert all(old == new for _, _, old, new in rows)
+
+    path = tmp_path / "run.json"
+    path.write_text(json.dumps(before))
+    assert main(["--compare", str(path), str(path)]) == 0
+    assert "1.00x" in capsys.readouterr().out
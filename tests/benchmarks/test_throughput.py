@@ -0,0 +1,13 @@
+from benchmarks.throughput import measure
+
+
+def test_measure_recognizes_generated_sentences():
+    result = measure("statement_language", {"kinds": 4}, "LALR(1)", 500)
+    assert result["accepted"]
+    assert result["tokens"] >= 500
+    assert result["tokens_per_second"] > 0
+
+
+def test_measure_near_miss():
+    result = measure("layered_expressions", {"levels": 2}, "LR(1)", 200, seed=3, near_miss=True)
+    assert not result["accepted"]
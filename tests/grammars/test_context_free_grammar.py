@@ -108,6 +108,39 @@ class TestContextFreeGrammar(unittest.TestCase):
 
         self.assertEqual(self.arithmetic_grammar.follow, expected_follow)
 
+    def test_compute_follow_keeps_first_sets(self):
+        """Test that computing FOLLOW sets does not modify the FIRST sets."""
+        grammar = ContextFreeGrammar(['a', 'b', 'c'], ['S', 'A', 'B'],
+                                     [('S', ['A', 'B', 'c']), ('A', ['a']), ('B', ['b']), ('B', ['ε'])], 'S')
+        grammar.compute_first()
+        first_before = {symbol: set(first) for symbol, first in grammar.first.items()}
+        grammar.compute_follow()
+
+        self.assertEqual(grammar.first, first_before)
+        self.assertEqual(grammar.follow['A'], {'b', 'c'})
+
+    def test_update_first_and_follow(self):
+        """Test that incremental FIRST/FOLLOW updates match a full recomputation."""
+        self.arithmetic_grammar.compute_first()
+        self.arithmetic_grammar.compute_follow()
+        added = [('F', ['-', 'F'])]
+        removed = [('T2', ['ε'])]
+        changed = self.arithmetic_grammar.apply_delta(added, removed)
+        first_changed = self.arithmetic_grammar.update_first(changed)
+        follow_changed = self.arithmetic_grammar.update_follow(added + removed, first_changed)
+
+        expected = ContextFreeGrammar(list(self.arithmetic_grammar.terminals),
+                                      list(self.arithmetic_grammar.non_terminals),
+                                      list(self.arithmetic_grammar.productions), 'E')
+        expected.compute_first()
+        expected.compute_follow()
+
+        self.assertEqual(changed, {'F', 'T2'})
+        self.assertEqual(first_changed, {'F', 'T', 'E', 'T2'})
+        self.assertEqual(self.arithmetic_grammar.first, expected.first)
+        self.assertEqual(self.arithmetic_grammar.follow, expected.follow)
+        self.assertNotIn('E2', follow_changed)
+
     def test_augment_grammar(self):
         """Test augmentation of a grammar."""
         self.simple_grammar.augment_grammar()
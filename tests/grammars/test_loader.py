@@ -0,0 +1,140 @@
+import pytest
+from src.grammars.loader import GrammarSyntaxError, load_grammar, parse_grammar
+
+
+EXPRESSIONS = """
+# Arithmetic expressions
+%start E
+%token + * ( ) id
+E -> E + T     # left recursive
+   | T
+T -> T * F | F ;
+F -> ( E ) | id
+"""
+
+
+def test_parse_declared_grammar():
+    grammar = parse_grammar(EXPRESSIONS)
+    assert grammar.start_symbol == "E"
+    assert grammar.terminals == ["+", "*", "(", ")", "id"]
+    assert grammar.non_terminals == ["E", "T", "F"]
+    assert grammar.productions == [
+        ("E", ["E", "+", "T"]),
+        ("E", ["T"]),
+        ("T", ["T", "*", "F"]),
+        ("T", ["F"]),
+        ("F", ["(", "E", ")"]),
+        ("F", ["id"]),
+    ]
+
+
+def test_infer_terminals_and_start_symbol():
+    grammar = parse_grammar("S -> A b\nA -> a | ε | %empty b")
+    assert grammar.start_symbol == "S"
+    assert grammar.terminals == ["b", "a"]
+    assert grammar.productions == [
+        ("S", ["A", "b"]),
+        ("A", ["a"]),
+        ("A", ["ε"]),
+        ("A", ["b"]),
+    ]
+    assert ("A", ["ε"]) in grammar.productions_by_lhs["A"]
+
+
+def test_quoted_symbols():
+    grammar = parse_grammar("L -> L '|' x | x")
+    assert grammar.terminals == ["|", "x"]
+    assert grammar.productions[0] == ("L", ["L", "|", "x"])
+
+
+def test_declarations_as_arguments():
+    grammar = parse_grammar("E -> E + T | T\nT -> id", terminals=["+", "id"], start_symbol="E")
+    assert grammar.terminal_set == {"+", "id"}
+    assert grammar.non_terminal_set == {"E", "T"}
+
+
+def test_error_token_needs_no_declaration():
+    grammar = parse_grammar("%token id ';'\nS -> id ';' | error ';'")
+    assert "error" in grammar.terminal_set
+
+
+def test_quoted_semicolon_after_error():
+    grammar = parse_grammar("%token id ';'\nS -> id ';'\nS -> error ';'\n")
+    assert ("S", ["error", ";"]) in grammar.productions
+    # A bare `;` ends the rule
+    assert ("S", ["error"]) in parse_grammar("%token id\nS -> id | error ;\n").productions
+
+
+def test_errors_reported_with_line_numbers():
+    text = "%token a\nS -> a b\n| a\nbogus line\n%frobnicate\nS -> a b\n"
+    with pytest.raises(GrammarSyntaxError) as excinfo:
+        parse_grammar(text, source="bad.grammar")
+    assert excinfo.value.errors == [
+        (2, "undefined symbol 'b'"),
+        (4, "expected a rule of the form 'A -> ...', an alternative '| ...' or a directive"),
+        (5, "unknown directive '%frobnicate'"),
+        (6, "duplicate production S -> a b"),
+    ]
+    assert str(excinfo.value).startswith("bad.grammar:2: undefined symbol 'b'")
+
+
+def test_missing_productions_and_bad_start():
+    with pytest.raises(GrammarSyntaxError) as excinfo:
+        parse_grammar("%nonterminal S A\n%start B\nS -> A")
+    assert (1, "non-terminal 'A' has no productions") in excinfo.value.errors
+    assert (2, "start symbol 'B' is not a non-terminal") in excinfo.value.errors
+
+
+def test_load_text_and_json_files(tmp_path):
+    text_path = tmp_path / "expr.grammar"
+    text_path.write_text(EXPRESSIONS, encoding="utf-8")
+    json_path = tmp_path / "expr.json"
+    json_path.write_text(
+        '{"terminals": ["+", "id"], "non_terminals": ["E"], "start_symbol": "E",'
+        ' "productions": ["E -> E + id", ["E", ["id"]]]}',
+        encoding="utf-8",
+    )
+    assert len(load_grammar(str(text_path)).productions) == 6
+    assert load_grammar(str(json_path)).productions == [("E", ["E", "+", "id"]), ("E", ["id"])]
+
+
+def test_precedence_declarations():
+    grammar = parse_grammar(
+        "%left + -\n%left *\n%right ^\n%nonassoc UMINUS\n"
+        "E -> E + E | E - E | E * E | E ^ E | - E %prec UMINUS | id\n"
+    )
+    assert grammar.precedence["+"] == grammar.precedence["-"] == (1, "left")
+    assert grammar.precedence["^"] == (3, "right")
+    assert grammar.production_precedence == {("E", ("-", "E")): "UMINUS"}
+    assert grammar.get_production_precedence(("E", ["E", "*", "E"])) == (2, "left")
+    assert grammar.get_production_precedence(("E", ["-", "E"])) == (4, "nonassoc")
+    assert grammar.get_production_precedence(("E", ["id"])) is None
+
+
+def test_precedence_errors():
+    text = "%left +\n%right +\nE -> E + E %prec X | id\n| E %prec\n| E %prec + E\n"
+    with pytest.raises(GrammarSyntaxError) as excinfo:
+        parse_grammar(text)
+    assert excinfo.value.errors == [
+        (2, "precedence of '+' already declared on line 1"),
+        (3, "%prec X: no precedence declared for 'X'"),
+        (4, "%prec expects a symbol"),
+        (5, "%prec must end the alternative"),
+    ]
+
+
+def test_json_precedence(tmp_path):
+    path = tmp_path / "expr.json"
+    path.write_text(
+        '{"terminals": ["+", "*", "id"], "non_terminals": ["E"], "start_symbol": "E",'
+        ' "precedence": [["left", "+"], ["left", "*"]], "productions": ["E -> E + E | E * E | id"]}',
+        encoding="utf-8",
+    )
+    assert load_grammar(str(path)).precedence == {"+": (1, "left"), "*": (2, "left")}
+
+
+def test_large_grammar_loads():
+    lines = [f"N{i} -> t{i} N{i + 1} | t{i}" for i in range(5000)] + ["N5000 -> end"]
+    grammar = parse_grammar("\n".join(lines))
+    assert len(grammar.productions) == 10001
+    assert len(grammar.non_terminals) == 5001
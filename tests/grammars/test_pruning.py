@@ -0,0 +1,59 @@
+import pytest
+from benchmarks.generators import layered_expressions
+from src.grammars.loader import parse_grammar
+from src.grammars.pruning import productive_non_terminals
+from src.parsers.parser_types import build_parser
+
+DEAD = """
+%token a b c d unused
+S -> A a | B b | ε
+A -> a A | c
+B -> b B          # unproductive: never terminates
+C -> d S          # unreachable
+D -> B d | a      # productive, only reachable through B
+"""
+
+
+def test_productive_non_terminals():
+    grammar = parse_grammar(DEAD)
+    assert productive_non_terminals(grammar) == {"S", "A", "C", "D"}
+
+
+def test_prune_removes_useless_symbols():
+    grammar = parse_grammar(DEAD)
+    report = grammar.prune()
+
+    assert report.unproductive == ["B"]
+    assert report.unreachable == ["C", "D"]
+    assert report.terminals == ["b", "d", "unused"]
+    assert report.productions == [("S", ["B", "b"]), ("B", ["b", "B"]), ("C", ["d", "S"]),
+                                  ("D", ["B", "d"]), ("D", ["a"])]
+    assert report.removed_share == pytest.approx(5 / 9)
+    assert grammar.productions == [("S", ["A", "a"]), ("S", ["ε"]), ("A", ["a", "A"]), ("A", ["c"])]
+    assert grammar.non_terminals == ["S", "A"]
+    assert grammar.terminals == ["a", "c"]
+    assert grammar.productions_by_lhs.keys() == {"S", "A"}
+
+
+def test_prune_keeps_useful_grammar():
+    grammar = layered_expressions(3)
+    productions = list(grammar.productions)
+    report = grammar.prune()
+    assert not report
+    assert grammar.productions == productions
+    assert "removed 0 of" in str(report)
+
+
+def test_empty_language_is_rejected():
+    with pytest.raises(ValueError, match="derives no terminal string"):
+        parse_grammar("S -> a S").prune()
+
+
+def test_pruned_parser_is_smaller_and_equivalent():
+    full = build_parser(parse_grammar(DEAD), "LALR(1)")
+    pruned = build_parser(parse_grammar(DEAD), "LALR(1)", prune=True)
+
+    assert full.pruned is None and pruned.pruned.unproductive == ["B"]
+    assert len(pruned.C) < len(full.C)
+    for tokens in (["a", "c", "a"], ["a"], [], ["b", "b"], ["c", "a", "a"]):
+        assert pruned.recognize(tokens) == full.recognize(tokens)
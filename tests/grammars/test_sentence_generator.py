@@ -0,0 +1,67 @@
+import pytest
+from src.grammars.context_free_grammar import ContextFreeGrammar
+from src.grammars.loader import parse_grammar
+from src.grammars.sentence_generator import SentenceGenerator
+from src.parsers.parser_types import build_parser
+
+EXPRESSIONS = """
+E -> T E2
+E2 -> + T E2 | ε
+T -> F T2
+T2 -> * F T2 | ε
+F -> ( E ) | id
+"""
+
+
+def test_sentences_are_accepted():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+    generator = SentenceGenerator(parse_grammar(EXPRESSIONS), seed=1)
+    for _ in range(20):
+        sentence = generator.sentence(50)
+        assert 50 <= len(sentence) < 60
+        assert parser.recognize(sentence)
+
+
+def test_closing_lengths_and_heights():
+    generator = SentenceGenerator(parse_grammar(EXPRESSIONS))
+    assert generator.closing_length == {"E": 1, "E2": 0, "T": 1, "T2": 0, "F": 1}
+    assert generator.height["F"] == 1
+    assert generator.height["E"] == 3
+
+
+def test_seed_makes_output_reproducible():
+    first = SentenceGenerator(parse_grammar(EXPRESSIONS), seed=7).sentence(30)
+    second = SentenceGenerator(parse_grammar(EXPRESSIONS), seed=7).sentence(30)
+    assert first == second
+
+
+def test_weights_select_productions():
+    weights = {("F", ("(", "E", ")")): 0}
+    sentence = SentenceGenerator(parse_grammar(EXPRESSIONS), weights=weights, seed=3).sentence(40)
+    assert "(" not in sentence
+
+
+def test_max_depth_bounds_derivation():
+    grammar = parse_grammar("S -> ( S ) | x")
+    sentence = SentenceGenerator(grammar, max_depth=5, growth=1.0, seed=0).sentence(1000)
+    assert sentence == ["("] * 5 + ["x"] + [")"] * 5
+
+
+def test_tokens_stream_long_sentences():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "SLR(1)")
+    generator = SentenceGenerator(parse_grammar(EXPRESSIONS), seed=2)
+    assert parser.recognize(generator.tokens(20000))
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_near_miss_is_rejected(seed):
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LR(1)")
+    generator = SentenceGenerator(parse_grammar(EXPRESSIONS), seed=seed)
+    near_miss = list(generator.near_miss(30, parser))
+    assert not parser.recognize(near_miss)
+
+
+def test_unproductive_start_symbol():
+    grammar = ContextFreeGrammar(["a"], ["S"], [("S", ["a", "S"])], "S")
+    with pytest.raises(ValueError):
+        SentenceGenerator(grammar)
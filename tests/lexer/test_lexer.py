@@ -0,0 +1,60 @@
+import io
+
+import pytest
+from src.grammars.loader import parse_grammar
+from src.lexer.lexer import LexError, Lexer, Token
+from src.parsers.parser_types import build_parser
+from tests.parsers.test_incremental import EXPRESSIONS
+
+TEXT = "if iffy == x = 3.14 # comment\nelse"
+
+
+@pytest.fixture
+def lexer():
+    return Lexer(["if", "else", "==", "="], {"id": r"[A-Za-z_]\w*", "num": r"\d+(\.\d+)?"},
+                 ignore=r"\s+|#[^\n]*")
+
+
+def test_longest_match_and_keywords(lexer):
+    assert list(lexer.tokens(TEXT)) == [
+        Token("if", 0, 2, "if"), Token("id", 3, 7, "iffy"), Token("==", 8, 10, "=="), Token("id", 11, 12, "x"),
+        Token("=", 13, 14, "="), Token("num", 15, 19, "3.14"), Token("else", 30, 34, "else"),
+    ]
+
+
+def test_priority_breaks_ties():
+    lexer = Lexer(["if"], {"id": r"[a-z]+"}, priorities={"id": 1})
+    assert list(lexer.terminals("if iffy")) == ["id", "id"]
+
+
+def test_bytes_and_chunked_files(lexer):
+    expected = list(lexer.terminals(TEXT))
+    assert list(lexer.terminals(TEXT.encode())) == expected
+    for chunk_size in (1, 2, 5):
+        assert list(lexer.tokens(io.StringIO(TEXT), chunk_size)) == list(lexer.tokens(TEXT))
+        assert list(lexer.tokens(io.BytesIO(TEXT.encode()), chunk_size)) == list(lexer.tokens(TEXT.encode()))
+
+
+def test_lex_error_position(lexer):
+    with pytest.raises(LexError, match="2:3: no terminal matches '\\$ x'") as excinfo:
+        list(lexer.terminals(io.StringIO("x =\n  $ x"), chunk_size=2))
+    assert excinfo.value.position == 6
+
+
+def test_invalid_definitions():
+    with pytest.raises(ValueError, match="defined more than once: id"):
+        Lexer(["id"], {"id": "[a-z]+"})
+    with pytest.raises(ValueError, match="matches the empty string"):
+        Lexer(patterns={"id": "[a-z]*"})
+    with pytest.raises(ValueError, match="Invalid pattern for 'id'"):
+        Lexer(patterns={"id": "[a-z"})
+
+
+def test_feeds_streaming_parser():
+    grammar = parse_grammar(EXPRESSIONS)
+    lexer = Lexer.for_grammar(grammar, {"id": r"[a-z]\w*"})
+    parser = build_parser(grammar, "LALR(1)")
+    assert parser.recognize(lexer.terminals(io.StringIO("(a+b1)*c +\n" * 3 + "d"), chunk_size=4))
+    assert not parser.recognize(lexer.terminals("a+*b"))
+    with pytest.raises(ValueError, match="not terminals: E"):
+        Lexer.for_grammar(grammar, {"E": "x"})
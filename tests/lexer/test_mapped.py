@@ -0,0 +1,77 @@
+import pytest
+from src.grammars.loader import parse_grammar
+from src.lexer.lexer import LexError, Lexer
+from src.lexer.mapped import map_file
+from src.parsers.parser_types import build_parser
+from tests.parsers.test_incremental import EXPRESSIONS
+
+
+@pytest.fixture
+def setup():
+    grammar = parse_grammar(EXPRESSIONS)
+    return build_parser(grammar, "LALR(1)"), Lexer.for_grammar(grammar, {"id": r"[a-z]\w*"})
+
+
+def test_spans_over_map(tmp_path, setup):
+    _, lexer = setup
+    path = tmp_path / "input.txt"
+    path.write_text("ab + c1\n* (d)")
+    with map_file(path) as buffer:
+        spans = list(lexer.spans(buffer))
+        assert [buffer[offset:offset + length] for _, offset, length in spans] == \
+            [b"ab", b"+", b"c1", b"*", b"(", b"d", b")"]
+    assert spans[:3] == [("id", 0, 2), ("+", 3, 1), ("id", 5, 2)]
+
+
+def test_parse_file(tmp_path, setup):
+    parser, lexer = setup
+    path = tmp_path / "input.txt"
+    path.write_text("(a + b) * c +\n" * 1000 + "d\n")
+    result = parser.parse_file(str(path), lexer)
+    assert result and result.tokens == 8001 and result.error is None
+
+    path.write_text("a + b\n+ * c")
+    result = parser.parse_file(str(path), lexer)
+    assert not result.accepted and result.error == (8, 1) and result.tokens == 4
+
+    path.write_text("a +")
+    assert parser.parse_file(str(path), lexer).error == (3, 0)
+    path.write_text("")
+    assert not parser.parse_file(str(path), lexer)
+
+
+def test_lex_error_in_mapped_file(tmp_path, setup):
+    parser, lexer = setup
+    path = tmp_path / "input.txt"
+    path.write_text("a +\nb $")
+    with pytest.raises(LexError, match="2:3"):
+        parser.parse_file(str(path), lexer)
+
+
+def test_contextual_keywords_as_identifiers(tmp_path):
+    grammar = parse_grammar("%token if then id\nS -> if E then E | E\nE -> id")
+    parser = build_parser(grammar, "LALR(1)")
+    lexer = Lexer.for_grammar(grammar, {"id": r"[a-z]+"})
+    path = tmp_path / "input.txt"
+    path.write_text("if then then if")
+    assert not parser.parse_file(str(path), lexer)
+    result = parser.parse_file(str(path), lexer, contextual=True)
+    assert result.accepted and result.tokens == 4
+
+
+def test_contextual_agrees_and_tries_fewer_alternatives(tmp_path, setup):
+    parser, lexer = setup
+    path = tmp_path / "input.txt"
+    path.write_text("(a + b) * c +\n" * 100 + "d\n")
+    plain = parser.parse_file(str(path), lexer)
+    contextual = parser.parse_file(str(path), lexer, contextual=True)
+    assert plain.accepted and contextual.accepted and plain.tokens == contextual.tokens
+    assert contextual.alternatives < plain.alternatives
+
+    path.write_text("a + b\n+ * c")
+    assert parser.parse_file(str(path), lexer, contextual=True).error == (8, 1)
+
+
+def test_valid_terminals(setup):
+    parser, _ = setup
+    assert parser.valid_terminals(0) == {"(", "id"}
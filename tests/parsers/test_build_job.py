@@ -0,0 +1,89 @@
+import time
+
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.build_job import BuildJob
+from src.parsers.lalr1_parser import LALR1Parser
+from src.parsers.lr_parser import LRParser
+
+
+def chain_grammar(length):
+    lines = [f"N{i} -> t{i} N{i + 1} | N{i + 1} u{i}" for i in range(length)] + [f"N{length} -> end"]
+    return parse_grammar("\n".join(lines))
+
+
+@pytest.fixture
+def grammar():
+    return parse_grammar("E -> E + T | T\nT -> ( E ) | id")
+
+
+def test_build_completes_with_progress(grammar):
+    job = BuildJob(grammar, "LR(1)").start()
+    assert job.wait(10)
+    assert job.status == "done"
+    assert job.parser is not None
+    assert job.states_discovered == len(job.parser.C)
+    assert job.queue_length == 0
+    assert job.fraction_done == 1.0
+
+
+def test_progress_callback_reports_queue(grammar):
+    reports = []
+    from src.parsers.lr0_parser import LR0Parser
+    parser = LR0Parser(grammar)
+    parser.items(lambda discovered, queued: reports.append((discovered, queued)))
+    assert reports[-1] == (len(parser.C), 0)
+    assert all(discovered >= queued for discovered, queued in reports)
+
+
+def test_cancel():
+    job = BuildJob(chain_grammar(25), "LR(1)")
+    job.start()
+    job.cancel()
+    assert job.wait(10)
+    assert job.status == "cancelled"
+    assert job.parser is None
+
+
+def test_timeout():
+    job = BuildJob(chain_grammar(25), "LR(1)", timeout=0.0)
+    job.start()
+    assert job.wait(10)
+    assert job.status == "timed out"
+
+
+def test_failure_is_reported(grammar):
+    job = BuildJob(grammar, "LL(1)").start()
+    assert job.wait(10)
+    assert job.status == "failed"
+    assert isinstance(job.error, ValueError)
+
+
+def test_cancel_during_table_construction(grammar, monkeypatch):
+    job = BuildJob(grammar, "LR(1)")
+    built = []
+    construct_state_rows = LRParser.construct_state_rows
+
+    def cancel_after_first_row(parser, state_no, I):
+        construct_state_rows(parser, state_no, I)
+        built.append(state_no)
+        job.cancel()
+
+    monkeypatch.setattr(LRParser, "construct_state_rows", cancel_after_first_row)
+    assert job.start().wait(10)
+    assert job.status == "cancelled" and job.phase == "table"
+    assert job.parser is None and len(built) == 1
+
+
+def test_cancel_after_lalr_merge(grammar, monkeypatch):
+    job = BuildJob(grammar, "LALR(1)")
+    merge_states = LALR1Parser.merge_states
+
+    def merge_then_cancel(parser):
+        merge_states(parser)
+        job.cancel()
+
+    monkeypatch.setattr(LALR1Parser, "merge_states", merge_then_cancel)
+    monkeypatch.setattr(LRParser, "construct_state_rows", lambda *args: pytest.fail("rows built after cancel"))
+    assert job.start().wait(10)
+    assert job.status == "cancelled"
@@ -0,0 +1,75 @@
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from benchmarks.generators import GENERATORS
+from src.grammars.loader import parse_grammar
+from src.grammars.sentence_generator import SentenceGenerator
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+from tests.parsers.test_recovery import STATEMENTS
+
+
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+def test_compiled_parser_matches_builder(parser_type):
+    grammar = GENERATORS["statement_language"](kinds=4)
+    parser = build_parser(grammar.copy(), parser_type)
+    compiled = parser.compile()
+    assert compiled.n_states == len(parser.C) and compiled.terminals[-1] == "$"
+    for state in range(compiled.n_states):
+        assert compiled.valid_terminals(state) == parser.valid_terminals(state)
+        for terminal in compiled.terminals:
+            assert compiled.action_for(state, terminal) == parser.action.get((state, terminal))
+        for non_terminal in compiled.non_terminals:
+            assert compiled.goto(state, non_terminal) == parser.goto_table.get((state, non_terminal))
+
+    generator = SentenceGenerator(grammar, seed=3)
+    for length in (1, 50, 500):
+        tokens = generator.sentence(length)
+        assert compiled.recognize(tokens) and parser.recognize(tokens)
+        near_miss = generator.near_miss(length, parser)
+        assert not compiled.recognize(near_miss)
+    assert not compiled.recognize(["no-such-terminal"])
+
+
+def test_diagnose_and_lazy_compilation():
+    parser = build_parser(parse_grammar(STATEMENTS), "LR(1)", lazy=True)
+    compiled = parser.compile()
+    assert not parser.lazy
+    tokens = "id = id + ; id = id id ; id id id ; id = id ;".split()
+    expected = [d.as_dict() for d in parser.diagnose(tokens).diagnostics]
+    assert [d.as_dict() for d in compiled.diagnose(tokens).diagnostics] == expected
+
+
+def test_compiled_parser_is_immutable():
+    compiled = build_parser(parse_grammar(STATEMENTS), "LALR(1)").compile()
+    with pytest.raises(AttributeError, match="immutable"):
+        compiled.n_states = 0
+    with pytest.raises(AttributeError, match="immutable"):
+        del compiled.terminals
+    with pytest.raises(TypeError):
+        compiled._action[0] = 1
+    with pytest.raises(TypeError):
+        compiled._terminal_index["id"] = 0
+
+
+def test_builder_is_released():
+    parser = build_parser(GENERATORS["layered_expressions"](levels=3), "LR(1)")
+    builder, grammar = weakref.ref(parser), weakref.ref(parser.grammar)
+    compiled = parser.compile()
+    del parser
+    gc.collect()
+    assert builder() is None and grammar() is None
+    assert compiled.recognize(["id"])
+
+
+def test_shared_between_threads():
+    grammar = GENERATORS["statement_language"](kinds=8)
+    compiled = build_parser(grammar.copy(), "LALR(1)").compile()
+    generator = SentenceGenerator(grammar, seed=5)
+    inputs = [generator.sentence(300) for _ in range(8)]
+    inputs += [list(generator.near_miss(300, compiled)) for _ in range(8)]
+    expected = [True] * 8 + [False] * 8
+    with ThreadPoolExecutor(8) as pool:
+        for _ in range(5):
+            assert list(pool.map(compiled.recognize, inputs)) == expected
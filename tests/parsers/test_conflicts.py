@@ -0,0 +1,142 @@
+import pytest
+from benchmarks.generators import lalr_stressors
+from src.grammars.loader import parse_grammar
+from src.parsers.lalr1_parser import LALR1Parser
+from src.parsers.lr1_parser import LR1Parser
+from src.parsers.parser_types import PARSER_TYPES, build_parser, classify
+from src.parsers.slr1_parser import SLR1Parser
+from src.parsers.variants import build_variants
+from tests.parsers.test_incremental import EXPRESSIONS
+
+DANGLING_ELSE = """
+%token if then else a b
+S -> if E then S | if E then S else S | a
+E -> b
+"""
+
+REDUCE_REDUCE = """
+S -> A | B
+A -> a
+B -> a
+"""
+
+AMBIGUOUS_EXPRESSIONS = """
+%left + -
+%left *
+%right ^
+%nonassoc <
+%left UMINUS
+E -> E + E | E - E | E * E | E ^ E | E < E | - E %prec UMINUS | ( E ) | id
+"""
+
+
+def _tree(parser, tokens):
+    """Rebuilds the parse tree of an accepted input from the reductions, as nested lists."""
+    stack = []
+    for _, remaining, action in parser.parse(tokens):
+        if action[0] == 'shift':
+            stack.append(remaining[0])
+        elif action[0] == 'reduce' and len(action[2]) > 1:
+            children = stack[-len(action[2]):]
+            del stack[-len(action[2]):]
+            stack.append(children)
+    return stack[0]
+
+
+def test_shift_reduce_conflict_is_recorded_and_resolved_as_shift():
+    parser = build_parser(parse_grammar(DANGLING_ELSE), "SLR(1)")
+    assert len(parser.conflicts) == 1
+    conflict = next(iter(parser.conflicts.values()))
+    assert conflict.symbol == "else"
+
+    assert conflict.kind == "shift/reduce"
+    assert conflict.actions[0][0] == "shift"
+    assert conflict.actions[1] == ("reduce", "S", ["if", "E", "then", "S"])
+    assert conflict.resolution == conflict.actions[0]
+    assert parser.action[(conflict.state, "else")] == conflict.resolution
+    assert [str(item) for item in conflict.items] == ["S -> if E then S •", "S -> if E then S • else S"]
+    assert "shift/reduce conflict" in str(conflict)
+    assert conflict.as_dict()["resolution"].startswith("shift")
+
+
+def test_reduce_reduce_conflict_prefers_first_production():
+    parser = build_parser(parse_grammar(REDUCE_REDUCE), "LR(1)")
+    conflict = next(iter(parser.conflicts.values()))
+
+    assert conflict.kind == "reduce/reduce"
+    assert conflict.resolution == ("reduce", "A", ["a"])
+    assert parser.parse(["a"]) is not None
+
+
+def test_check_conflicts_matches_build():
+    built = build_parser(parse_grammar(DANGLING_ELSE), "SLR(1)")
+    checked = SLR1Parser(parse_grammar(DANGLING_ELSE)).check_conflicts()
+
+    assert [(c.state, c.symbol, c.actions, c.resolution) for c in checked] == \
+        [(c.state, c.symbol, c.actions, c.resolution) for c in built.conflicts.values()]
+
+
+def test_check_conflicts_stops_at_first():
+    parser = LR1Parser(lalr_stressors(2).copy())
+    assert parser.check_conflicts(stop_at_first=True) == []
+
+    parser = SLR1Parser(parse_grammar(DANGLING_ELSE))
+    assert len(parser.check_conflicts(stop_at_first=True)) == 1
+    assert not parser.action
+
+
+def test_lalr_check_conflicts_uses_lr0_automaton():
+    grammar = lalr_stressors(3)
+    parser = LALR1Parser(grammar)
+    assert not parser.merged
+    checked = parser.check_conflicts()
+    built = build_variants(grammar).parsers["LALR(1)"]
+
+    assert parser.merged and parser.canonical is None
+    assert len(parser.C) == len(built.C)
+    assert checked and sorted((c.state, c.symbol) for c in checked) == \
+        sorted((c.state, c.symbol) for c in built.conflicts.values() if c.resolved_by != "precedence")
+
+
+def test_classify():
+    classes = classify(lalr_stressors(3))
+    assert classes["LR(1)"] == []
+    assert classes["LALR(1)"] and classes["SLR(1)"] and classes["LR(0)"]
+
+    grammar = parse_grammar(EXPRESSIONS)
+    classes = classify(grammar, ["slr1", "lr0"], stop_at_first=False)
+    assert list(classes) == ["SLR(1)", "LR(0)"]
+    assert classes["SLR(1)"] == []
+    assert {conflict.kind for conflict in classes["LR(0)"]} == {"shift/reduce"}
+    # Each check works on a copy, so the grammar is left unaugmented
+    assert grammar.augmented_start_symbol is None
+
+
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+def test_precedence_resolves_conflicts(parser_type, capsys):
+    parser = build_parser(parse_grammar(AMBIGUOUS_EXPRESSIONS), parser_type)
+    assert parser.conflicts
+    assert all(conflict.resolved_by == "precedence" for conflict in parser.conflicts.values())
+
+    assert _tree(parser, ["id", "+", "id", "*", "id"]) == ["id", "+", ["id", "*", "id"]]
+    assert _tree(parser, ["id", "-", "id", "-", "id"]) == [["id", "-", "id"], "-", "id"]
+    assert _tree(parser, ["id", "^", "id", "^", "id"]) == ["id", "^", ["id", "^", "id"]]
+    assert _tree(parser, ["-", "id", "*", "id"]) == [["-", "id"], "*", "id"]
+    capsys.readouterr()
+    # A non-associative operator cannot be chained
+    configurations = parser.parse(["id", "<", "id", "<", "id"])
+    assert configurations is None or configurations[-1][2] != ("accept",)
+
+
+def test_precedence_conflicts_are_not_reported_by_check():
+    grammar = parse_grammar(AMBIGUOUS_EXPRESSIONS)
+    assert SLR1Parser(grammar).check_conflicts() == []
+    classes = classify(parse_grammar(DANGLING_ELSE + "%nonassoc then\n%nonassoc else\n"), ["slr1"])
+    assert classes["SLR(1)"] == []
+
+
+def test_undeclared_operator_falls_back_to_shift():
+    parser = build_parser(parse_grammar("%left +\nE -> E + E | E * E | id\n"), "LALR(1)")
+    defaults = [conflict for conflict in parser.conflicts.values() if conflict.resolved_by == "default"]
+    assert {conflict.symbol for conflict in defaults} == {"*", "+"}
+    assert all(conflict.resolution[0] == "shift" for conflict in defaults)
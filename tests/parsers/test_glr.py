@@ -0,0 +1,102 @@
+import gc
+import math
+
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.glr import paused_gc
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+from tests.parsers.test_incremental import EXPRESSIONS
+
+AMBIGUOUS = "E -> E + E | E * E | id\n"
+
+
+def build(text, parser_type="LALR(1)", **options):
+    return build_parser(parse_grammar(text), parser_type, **options)
+
+
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+def test_ambiguous_input_yields_every_derivation(parser_type):
+    parser = build(AMBIGUOUS, parser_type)
+    # The number of ways to bracket n operands is the Catalan number C(n - 1)
+    for operands, expected in [(1, 1), (2, 1), (3, 2), (4, 5), (6, 42)]:
+        tokens = ["id"] + ["+", "id"] * (operands - 1)
+        result = parser.parse_glr(tokens)
+        assert result.accepted and result.derivations() == expected
+        assert result.root.symbol == "E" and (result.root.start, result.root.end) == (0, len(tokens))
+
+
+def test_forest_shares_nodes():
+    result = build(AMBIGUOUS).parse_glr("id + id * id".split())
+    assert sorted(result.root.trees(), key=str) == [
+        ("E", [("E", ["id"]), "+", ("E", [("E", ["id"]), "*", ("E", ["id"])])]),
+        ("E", [("E", [("E", ["id"]), "+", ("E", ["id"])]), "*", ("E", ["id"])]),
+    ]
+    assert result.ambiguous_nodes() == [result.root]
+    (_, (first, _, right)), (_, (left, _, last)) = sorted(result.root.families, key=lambda f: f[1][0].end)
+    # Both derivations use the very same nodes for the first and the last operand
+    assert left.families[0][1][0] is first and right.families[0][1][2] is last
+
+
+def test_deterministic_input_runs_without_the_stack_graph():
+    result = build(EXPRESSIONS).parse_glr("id * ( id + id ) + id".split())
+    assert result.accepted and result.derivations() == 1
+    assert result.forked_tokens == 0 and result.max_stacks == 1
+    declared = build("%left +\n%left *\n" + AMBIGUOUS).parse_glr("id + id * id".split())
+    assert declared.forked_tokens == 0
+    assert list(declared.root.trees()) == [("E", [("E", ["id"]), "+", ("E", [("E", ["id"]), "*", ("E", ["id"])])])]
+
+
+def test_grammar_needing_more_lookahead():
+    parser = build("S -> A c d | B c e\nA -> a\nB -> a\n")
+    assert parser.conflicts
+    for text, reduced in [("a c d", "A"), ("a c e", "B")]:
+        result = parser.parse_glr(text.split())
+        assert result.derivations() == 1
+        assert next(result.root.trees())[1][0] == (reduced, ["a"])
+    rejected = parser.parse_glr("a c c".split())
+    assert not rejected and rejected.error_position == 2 and rejected.derivations() == 0
+
+
+def test_empty_productions_and_cycles():
+    parser = build("S -> A S b | ε\nA -> ε | a\n")
+    for text, expected in [("", 1), ("b", 1), ("a b b", 2), ("a a b b b", 3), ("a b a b", 0)]:
+        assert parser.parse_glr(text.split()).derivations() == expected
+    cyclic = build("S -> S | a\n").parse_glr(["a"])
+    assert cyclic.derivations() == math.inf and list(cyclic.root.trees()) == [("S", ["a"])]
+
+
+def test_lazy_parser():
+    parser = build(AMBIGUOUS, "LR(1)", lazy=True)
+    assert parser.parse_glr("id * id * id".split()).derivations() == 2
+    assert not parser.parse_glr(["*"])
+
+
+def test_cycle_through_a_deterministic_entry():
+    # With LR(0) tables the `$` entry of the cycle is a plain reduction by `A -> A`
+    parser = build("S -> A b b\nA -> A | a | b a\nB -> A\n", "LR(0)")
+    result = parser.parse_glr(["a"])
+    assert not result and result.error_position == 1
+    accepted = parser.parse_glr("b a b b".split())
+    assert accepted.derivations() == math.inf and ("S", [("A", ["b", "a"]), "b", "b"]) in accepted.root.trees()
+    # A nullable recursion pushes `S -> ε` reductions without end on a single stack
+    assert not build("S -> A S S\nA -> ε | A B b\nB -> a S | a a B\n", "LR(0)").parse_glr([])
+
+
+def test_paused_gc_nests():
+    parser = build(AMBIGUOUS)
+    assert gc.isenabled()
+    assert parser.parse_glr(["id", "+", "id"]).accepted and gc.isenabled()
+    with paused_gc():
+        with paused_gc():
+            assert not gc.isenabled()
+        assert not gc.isenabled()
+        assert parser.parse_glr(["id", "+", "id"]).accepted and not gc.isenabled()
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with paused_gc():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
@@ -0,0 +1,130 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+
+EXPRESSIONS = """
+S -> E
+E -> E + T | T
+T -> T * F | F
+F -> ( E ) | id
+"""
+
+NULLABLE = """
+S -> a | c A C
+A -> ε | A c c
+B -> S
+C -> ε
+"""
+
+DELTAS = [
+    # Add a new terminal and operator
+    (EXPRESSIONS, [("F", ["-", "F"])], []),
+    # Remove a production
+    (EXPRESSIONS, [], [("T", ["T", "*", "F"])]),
+    # Add a nullable non-terminal, changing FIRST and FOLLOW sets
+    (EXPRESSIONS, [("F", ["id", "A"]), ("A", ["[", "E", "]"]), ("A", ["ε"])], [("F", ["id"])]),
+    # Replace the start production
+    (EXPRESSIONS, [("S", ["E", ";"])], [("S", ["E"])]),
+    # Remove an ε-production, dropping its completed items
+    (NULLABLE, [], [("A", ["ε"])]),
+    # Remove the production that predicts an ε-production
+    (NULLABLE, [("S", ["c", "A"])], [("S", ["c", "A", "C"])]),
+]
+
+
+def canonical(parser):
+    """Describes the tables independently of state numbering."""
+    name = {state_no: frozenset(I) for state_no, I in enumerate(parser.C)}
+    action = {}
+    for (state_no, symbol), entry in parser.action.items():
+        if entry[0] == "shift":
+            entry = ("shift", name[entry[1]])
+        elif entry[0] == "reduce":
+            entry = ("reduce", entry[1], tuple(entry[2]))
+        action[(name[state_no], symbol)] = entry
+    goto = {(name[state_no], A): name[target] for (state_no, A), target in parser.goto_table.items()}
+    transitions = {(name[state_no], X): name[target] for (state_no, X), target in parser.transitions.items()}
+    return set(name.values()), action, goto, transitions
+
+
+def apply_to_text(text, added, removed):
+    """Applies a delta to a grammar text, keeping the start symbol and unused terminals like `rebuild` does."""
+    grammar = parse_grammar(text)
+    productions = [prod for prod in grammar.productions if prod not in [(lhs, list(rhs)) for lhs, rhs in removed]]
+    productions += added
+    lhs_symbols = {lhs for lhs, _ in productions}
+    terminals = grammar.terminals + [symbol for _, rhs in added for symbol in rhs
+                                     if symbol not in lhs_symbols | {"ε"} and symbol not in grammar.terminals]
+    lines = [f"%start {grammar.start_symbol}", "%token " + " ".join(f"'{t}'" for t in terminals)]
+    rules = [f"{lhs} -> " + " ".join(f"'{symbol}'" for symbol in rhs) for lhs, rhs in productions]
+    return "\n".join(lines + rules)
+
+
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+@pytest.mark.parametrize("text, added, removed", DELTAS)
+def test_rebuild_matches_fresh_build(parser_type, text, added, removed, capsys):
+    parser = build_parser(parse_grammar(text), parser_type)
+    parser.rebuild(added, removed)
+    fresh = build_parser(parse_grammar(apply_to_text(text, added, removed)), parser_type)
+
+    assert canonical(parser) == canonical(fresh)
+    assert parser.grammar.first == fresh.grammar.first
+    assert parser.grammar.follow == fresh.grammar.follow
+    assert len(parser.C) == len(fresh.C)
+
+
+@pytest.mark.parametrize("parser_type", ["LR(0)", "SLR(1)", "LR(1)"])
+def test_rebuild_keeps_unaffected_states(parser_type, capsys):
+    parser = build_parser(parse_grammar(EXPRESSIONS), parser_type)
+    before = {frozenset(I): state_no for state_no, I in enumerate(parser.C)}
+
+    summary = parser.rebuild([("F", ["-", "F"])])
+
+    assert summary.changed_non_terminals == {"F"}
+    assert summary.reused_states > 0
+    assert summary.removed_states == 0
+    assert summary.new_states == list(range(len(before), len(parser.C)))
+    kept = [state_no for state_no, I in enumerate(parser.C) if before.get(frozenset(I)) == state_no]
+    assert len(kept) == summary.reused_states
+    assert len(summary.rebuilt_rows) < len(parser.C)
+
+
+def test_rebuild_then_parse():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+    parser.rebuild([("F", ["-", "F"])])
+    assert parser.parse(["-", "id", "+", "id"])[-1][2] == ("accept",)
+    parser.rebuild(removed=[("F", ["-", "F"])])
+    assert parser.parse(["-", "id"]) is None
+    assert parser.parse(["id", "*", "id"])[-1][2] == ("accept",)
+
+
+def test_rebuild_rejects_invalid_delta():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "SLR(1)")
+    with pytest.raises(ValueError):
+        parser.rebuild(removed=[("F", ["num"])])
+    with pytest.raises(ValueError):
+        parser.rebuild(added=[("F", ["id"])])
+    with pytest.raises(ValueError):
+        parser.rebuild(added=[("id", ["F"])])
+
+
+def test_rebuild_numbering_does_not_depend_on_hashing():
+    code = (
+        "from src.grammars.loader import parse_grammar\n"
+        "from src.parsers.parser_types import build_parser\n"
+        "from tests.parsers.test_incremental import DELTAS\n"
+        "for text, added, removed in DELTAS:\n"
+        "    parser = build_parser(parse_grammar(text), 'LR(1)')\n"
+        "    parser.rebuild(added, removed)\n"
+        "    print(sorted(parser.transitions.items()))\n"
+    )
+    root = Path(__file__).resolve().parents[2]
+    outputs = {subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True,
+                              env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+               for seed in ("1", "2", "3")}
+    assert len(outputs) == 1
@@ -0,0 +1,75 @@
+import json
+
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers import parallel
+from src.parsers.instrumentation import BuildInstrumentation
+from src.parsers.lr1_parser import LR1Parser
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+from tests.parsers.test_incremental import EXPRESSIONS, canonical
+
+
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+def test_report_phases_and_counters(parser_type):
+    instrumentation = BuildInstrumentation()
+    parser = build_parser(parse_grammar(EXPRESSIONS), parser_type, instrumentation=instrumentation)
+    report = instrumentation.report()
+
+    expected = ["augment", "first", "items", "construct_parsing_table"]
+    if parser_type == "SLR(1)":
+        expected.insert(2, "follow")
+    if parser_type == "LALR(1)":
+        expected.insert(3, "merge_states")
+    assert sorted(phase.name for phase in report.phases) == sorted(expected)
+    assert all(phase.seconds >= 0 and phase.allocated_bytes is None for phase in report.phases)
+
+    assert report.counters["states"] == len(parser.C)
+    assert report.counters["transitions"] == len(parser.transitions)
+    # One closure for the initial state and one per goto
+    assert report.counters["closure_calls"] == report.counters["goto_calls"] + 1
+    assert report.counters["items_created"] >= sum(len(I) for I in parser.C)
+    json.dumps(report.as_dict())
+
+
+def test_instrumented_build_matches_plain_build():
+    instrumented = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)", instrumentation=BuildInstrumentation())
+    plain = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+    assert canonical(instrumented) == canonical(plain)
+
+
+def test_uninstrumented_parser_has_no_wrappers():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LR(1)")
+    assert parser.instrumentation is None
+    assert "closure" not in vars(parser) and "items" not in vars(parser)
+    assert parser.closure.__func__ is LR1Parser.closure
+
+
+def test_trace_memory_and_snapshots():
+    instrumentation = BuildInstrumentation(snapshots=True)
+    build_parser(parse_grammar(EXPRESSIONS), "LR(1)", instrumentation=instrumentation)
+    report = instrumentation.report()
+    items = report.phase("items")
+    assert items.allocated_bytes is not None and items.peak_bytes >= items.allocated_bytes
+    assert set(report.snapshots) == {phase.name for phase in report.phases}
+    assert "items" in str(report)
+
+
+def test_nested_phase_keeps_outer_peak():
+    instrumentation = BuildInstrumentation(trace_memory=True)
+    with instrumentation.phase("outer"):
+        buffer = bytearray(4 << 20)
+        del buffer
+        with instrumentation.phase("inner"):
+            small = bytearray(1 << 10)
+        del small
+    report = instrumentation.report()
+    assert report.phase("outer").peak_bytes >= 4 << 20
+    assert report.phase("inner").peak_bytes < 4 << 20
+
+
+def test_parallel_build_with_instrumentation(monkeypatch):
+    # Workers receive an uninstrumented copy of the parser
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_FRONTIER", 1)
+    instrumentation = BuildInstrumentation()
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LR(1)", workers=2, instrumentation=instrumentation)
+    assert instrumentation.report().counters["states"] == len(parser.C)
@@ -1,6 +1,7 @@
 import pytest
 from src.grammars.context_free_grammar import ContextFreeGrammar
 from src.parsers.lalr1_parser import LALR1Parser
+from src.parsers.lr0_parser import LR0Parser
 from src.parsers.lr1_parser import LR1Parser
 
 
@@ -103,3 +104,22 @@ def test_invalid_parsing_behavior(grammar1, lalr1_parser1):
 
     assert configurations is None or configurations[-1][2] != (
         "accept",), "LALR(1) parser should reject invalid input."
+
+
+def test_items_from_lr0_rebuild(grammar2, lalr1_parser2):
+    lr0 = LR0Parser(grammar2)
+    lr0.items()
+    parser = LALR1Parser(grammar2)
+    parser.items_from_lr0(lr0)
+    parser.construct_parsing_table()
+    assert parser.canonical is None and len(parser.C) == len(lalr1_parser2.C) == len(lr0.C)
+    configurations = parser.parse(["if", "i", "then", "i", ":=", "i", "+", "i", "else", "i", ":=", "i"])
+    assert configurations[-1][2] == ("accept",)
+    # The first rebuild has no LR(1) collection to update and builds it
+    parser.rebuild(added=[("P", ["(", ")"])])
+    edited = LALR1Parser(ContextFreeGrammar(grammar2.terminals, grammar2.non_terminals,
+                                            grammar2.productions + [("P", ["(", ")"])], "S"))
+    edited.items()
+    edited.construct_parsing_table()
+    assert parser.canonical is not None
+    assert (parser.action, parser.goto_table) == (edited.action, edited.goto_table)
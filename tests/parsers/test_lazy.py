@@ -0,0 +1,51 @@
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.parser_types import build_parser
+from tests.parsers.test_incremental import EXPRESSIONS, canonical
+
+LAZY_TYPES = ["LR(0)", "SLR(1)", "LR(1)"]
+
+
+# The expression grammar has LR(0) conflicts, whose outcome depends on the construction order
+@pytest.mark.parametrize("parser_type", ["SLR(1)", "LR(1)"])
+def test_lazy_parse_matches_eager(parser_type, capsys):
+    eager = build_parser(parse_grammar(EXPRESSIONS), parser_type)
+    lazy = build_parser(parse_grammar(EXPRESSIONS), parser_type, lazy=True)
+    for tokens in (["id"], ["id", "+", "id", "*", "id"], ["(", "id", ")"], ["id", "+"], ["(", "id"]):
+        assert (lazy.parse(tokens) is None) == (eager.parse(tokens) is None)
+
+
+def test_lazy_builds_only_reached_states(capsys):
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LR(1)", lazy=True)
+    assert len(parser.C) == 1 and not parser.action
+
+    assert parser.parse(["id"]) is not None
+    reached = len(parser.built_states)
+    full = build_parser(parse_grammar(EXPRESSIONS), "LR(1)")
+    assert reached < len(parser.C) < len(full.C)
+
+    # Parsing the same input again reuses the memoised states
+    parser.parse(["id"])
+    assert len(parser.built_states) == reached
+
+
+@pytest.mark.parametrize("background", [False, True])
+@pytest.mark.parametrize("parser_type", LAZY_TYPES)
+def test_finish_build_matches_eager(parser_type, background, capsys):
+    parser = build_parser(parse_grammar(EXPRESSIONS), parser_type, lazy=True)
+    parser.parse(["id", "*", "id"])
+    thread = parser.finish_build(background=background)
+    if background:
+        thread.join(timeout=30)
+        assert not thread.is_alive()
+    else:
+        assert thread is None
+
+    assert not parser.lazy
+    assert len(parser.built_states) == len(parser.C)
+    assert canonical(parser) == canonical(build_parser(parse_grammar(EXPRESSIONS), parser_type))
+
+
+def test_lalr1_cannot_be_lazy():
+    with pytest.raises(NotImplementedError):
+        build_parser(parse_grammar(EXPRESSIONS), "LALR(1)", lazy=True)
@@ -110,6 +110,15 @@ def test_parse_valid_input_second_grammar(parser2):
     assert configurations[-1][2] == ("accept",), "Input should be accepted."
 
 
+def test_parse_epsilon_production(parser2):
+    # L -> ε: a conditional without an else branch
+    input_string = ["if", "i", "then", "i", ":=", "i"]
+    configurations = parser2.parse(input_string)
+    assert configurations is not None, "Parsing should produce configurations."
+    assert configurations[-1][2] == ("accept",), "Input should be accepted."
+    assert parser2.recognize(input_string)
+
+
 def test_parse_invalid_input_second_grammar(parser2):
     input_string = ["if", "i", "then", "i", "+", "else"]  # Invalid input
     configurations = parser2.parse(input_string)
@@ -1,8 +1,17 @@
 import unittest
 from unittest.mock import Mock
+from src.parsers.lr0_parser import LR0Parser
 from src.parsers.lr_parser import LRParser
 
 
+class ConcreteLRParser(LRParser):
+    """An LRParser with the construction hooks of the LR(0) parser, to test the shared driver code."""
+    initial_item = LR0Parser.initial_item
+    closure = LR0Parser.closure
+    goto_kernel = LR0Parser.goto_kernel
+    reduce_lookaheads = LR0Parser.reduce_lookaheads
+
+
 class TestLRParser(unittest.TestCase):
 
     def setUp(self):
@@ -12,23 +21,19 @@ class TestLRParser(unittest.TestCase):
         self.mock_grammar.compute_first = Mock()
 
     def test_initialization(self):
-        """Test that LRParser initializes properly and calls augment_grammar and compute_first."""
-
-        class ConcreteLRParser(LRParser):
-            def items(self):
-                pass
-
-            def construct_parsing_table(self):
-                pass
+        """Test that LRParser initializes properly and augments a copy of the grammar."""
 
         parser = ConcreteLRParser(context_free_grammar=self.mock_grammar)
 
-        # Ensure grammar augmentation and FIRST set computation were called
-        self.mock_grammar.augment_grammar.assert_called_once()
-        self.mock_grammar.compute_first.assert_called_once()
+        # Ensure a copy of the grammar was augmented and its FIRST sets computed
+        grammar_copy = self.mock_grammar.copy.return_value
+        self.mock_grammar.copy.assert_called_once()
+        grammar_copy.augment_grammar.assert_called_once()
+        grammar_copy.compute_first.assert_called_once()
+        self.mock_grammar.augment_grammar.assert_not_called()
 
         # Check initial attributes
-        self.assertEqual(parser.grammar, self.mock_grammar)
+        self.assertEqual(parser.grammar, grammar_copy)
         self.assertEqual(parser.action, {})
         self.assertEqual(parser.goto_table, {})
         self.assertEqual(parser.states, {})
@@ -38,13 +43,6 @@ class TestLRParser(unittest.TestCase):
     def test_parse_method(self):
         """Test the parse method with a simple mocked parser setup."""
 
-        class ConcreteLRParser(LRParser):
-            def items(self):
-                pass
-
-            def construct_parsing_table(self):
-                pass
-
         parser = ConcreteLRParser(context_free_grammar=self.mock_grammar)
         parser.action = {
             (0, 'a'): ('shift', 1),
@@ -66,13 +64,6 @@ class TestLRParser(unittest.TestCase):
     def test_parse_complex_grammar(self):
         """Test the parse method with a more complex grammar setup."""
 
-        class ConcreteLRParser(LRParser):
-            def items(self):
-                pass
-
-            def construct_parsing_table(self):
-                pass
-
         parser = ConcreteLRParser(context_free_grammar=self.mock_grammar)
         parser.action = {
             (0, 'id'): ('shift', 1),
@@ -105,6 +96,34 @@ class TestLRParser(unittest.TestCase):
         # Fifth configuration (acceptance)
         self.assertEqual(configurations[4], ([0, 4], ['$'], ('accept',)))
 
+    def test_recognize_method(self):
+        """Test that recognize consumes an iterator and reports acceptance without configurations."""
+
+        parser = ConcreteLRParser(context_free_grammar=self.mock_grammar)
+        parser.action = {
+            (0, 'id'): ('shift', 1),
+            (1, '$'): ('reduce', 'E', ['id']),
+            (2, '$'): ('accept',),
+        }
+        parser.goto_table = {
+            (0, 'E'): 2
+        }
+
+        self.assertTrue(parser.recognize(iter(['id'])))
+        self.assertFalse(parser.recognize(iter(['id', 'id'])))
+        self.assertFalse(parser.recognize(iter([])))
+
+    def test_construction_hooks_are_abstract(self):
+        """Test that LRParser and subclasses missing a construction hook cannot be instantiated."""
+
+        class IncompleteLRParser(LRParser):
+            closure = LR0Parser.closure
+
+        with self.assertRaises(TypeError):
+            LRParser(context_free_grammar=self.mock_grammar)
+        with self.assertRaisesRegex(TypeError, "initial_item"):
+            IncompleteLRParser(context_free_grammar=self.mock_grammar)
+
 
 if __name__ == "__main__":
     unittest.main()
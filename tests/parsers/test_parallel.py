@@ -0,0 +1,45 @@
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers import parallel
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+from src.parsers.tables import EncodedTables
+from tests.parsers.test_incremental import EXPRESSIONS
+
+STATEMENTS = """
+program -> stmts
+stmts -> stmts stmt | stmt
+stmt -> id = expr ';' | if ( expr ) stmt else stmt | while ( expr ) stmt | { stmts } | print expr ';'
+expr -> expr + term | term
+term -> term * factor | factor
+factor -> ( expr ) | id | num
+"""
+
+
+@pytest.fixture(autouse=True)
+def always_use_pool(monkeypatch):
+    # Ship every frontier to the pool, however small
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_FRONTIER", 1)
+
+
+@pytest.mark.parametrize("text", [EXPRESSIONS, STATEMENTS])
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+def test_parallel_build_matches_serial(parser_type, text, capsys):
+    serial = build_parser(parse_grammar(text), parser_type)
+    parallel_parser = build_parser(parse_grammar(text), parser_type, workers=2)
+
+    assert [frozenset(I) for I in parallel_parser.C] == [frozenset(I) for I in serial.C]
+    assert parallel_parser.transitions == serial.transitions
+    if parser_type != "LR(0)":
+        # Conflict-free tables are byte-identical
+        serial_tables = EncodedTables.from_parser(serial)
+        parallel_tables = EncodedTables.from_parser(parallel_parser)
+        assert parallel_tables.action_bytes() == serial_tables.action_bytes()
+        assert parallel_tables.goto_bytes() == serial_tables.goto_bytes()
+
+
+def test_parallel_progress_reports_levels(capsys):
+    levels = []
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LR(1)", progress=lambda n, q: levels.append((n, q)),
+                          workers=2)
+    assert levels[-1] == (len(parser.C), 0)
+    assert [n for n, _ in levels] == sorted(n for n, _ in levels)
@@ -0,0 +1,69 @@
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.parse_profile import ParseProfile
+from src.parsers.parser_types import build_parser
+from tests.parsers.test_incremental import EXPRESSIONS
+
+
+@pytest.fixture
+def parser():
+    return build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+
+
+def test_profile_counts(parser):
+    profile = ParseProfile(parser)
+    tokens = ["id", "+", "id", "*", "id"]
+    assert parser.recognize(tokens, profile)
+
+    assert profile.parses == 1 and profile.accepted == 1
+    assert profile.tokens == len(tokens) + 1
+    assert profile.shifts == len(tokens)
+    # F -> id three times, T -> F twice, T -> T * F, E -> T, E -> E + T and S -> E
+    assert profile.reduces == 9
+    assert profile.reductions[parser.grammar.get_production_number(("F", ["id"]))] == 3
+    assert sum(profile.state_visits) == profile.shifts + profile.reduces + 1
+    # 0 E + T * id
+    assert profile.max_stack_depth == 6
+    assert profile.shift_reduce_ratio == pytest.approx(5 / 9)
+    assert profile.hot_productions(1) == [("F", ["id"], 3)]
+
+
+def test_profile_accumulates_and_reports(parser):
+    profile = ParseProfile(parser)
+    assert parser.recognize(["id"], profile)
+    assert not parser.recognize(["id", "id"], profile)
+    report = profile.report(top=3)
+
+    assert report["parses"] == 2 and report["accepted"] == 1
+    assert len(report["hot_states"]) == 3
+    assert report["hot_states"][0]["visits"] >= report["hot_states"][-1]["visits"]
+    # The second input fails before any reduction; S -> E, E -> T and T -> F are unit productions
+    assert report["unit_reduction_share"] == pytest.approx(3 / 4)
+
+
+def test_profile_matches_plain_recognize(parser):
+    for tokens in (["(", "id", ")"], ["id", "+"], ["*"], []):
+        assert parser.recognize(tokens, ParseProfile(parser)) == parser.recognize(tokens)
+
+
+def test_profile_lazy_parser():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LR(1)", lazy=True)
+    profile = ParseProfile(parser)
+    assert parser.recognize(["id", "*", "(", "id", ")"], profile)
+    assert len(profile.state_visits) == len(parser.C)
+
+
+def test_profile_depth_counts_gotos():
+    parser = build_parser(parse_grammar("S -> a A\nA -> ε\n"), "LALR(1)")
+    profile = ParseProfile(parser)
+    assert parser.recognize(["a"], profile)
+    # 0 a A: the ε-reduction pushes A's state without popping
+    assert profile.max_stack_depth == 3
+
+
+def test_profile_after_rebuild(parser):
+    profile = ParseProfile(parser)
+    parser.rebuild(added=[("F", ["[", "E", "]"])])
+    assert parser.recognize(["[", "id", "]", "+", "id"], profile)
+    assert len(profile.state_visits) == len(parser.C)
+    assert profile.reductions[parser.grammar.get_production_number(("F", ["[", "E", "]"]))] == 1
@@ -0,0 +1,43 @@
+import pytest
+from benchmarks.generators import GENERATORS
+from src.grammars.loader import parse_grammar
+from src.parsers.parser_types import PARSER_TYPES, build_parser, build_parsers
+from src.parsers.tables import EncodedTables
+
+
+def snapshot(grammar):
+    return (list(grammar.terminals), list(grammar.non_terminals),
+            [(lhs, list(rhs)) for lhs, rhs in grammar.productions], grammar.augmented_start_symbol)
+
+
+def test_construction_leaves_the_grammar_unchanged():
+    grammar = parse_grammar("S -> A b | c\nA -> a\nB -> d\n")
+    before = snapshot(grammar)
+    first = build_parser(grammar, "LALR(1)")
+    second = build_parser(grammar, "LALR(1)", prune=True)
+    assert snapshot(grammar) == before
+    assert first.grammar is not grammar and first.grammar.augmented_start_symbol == "S'"
+    assert "B" in first.grammar.non_terminals and "B" not in second.grammar.non_terminals
+    assert first.recognize(["a", "b"]) and second.recognize(["c"])
+
+
+def test_build_parsers_shares_one_grammar():
+    grammar = GENERATORS["lalr_stressors"](copies=2)
+    before = snapshot(grammar)
+    parsers = build_parsers(grammar)
+    assert list(parsers) == list(PARSER_TYPES)
+    assert snapshot(grammar) == before
+    for name, parser in parsers.items():
+        expected = EncodedTables.from_parser(build_parser(grammar, name))
+        tables = EncodedTables.from_parser(parser)
+        assert (tables.action, tables.goto) == (expected.action, expected.goto)
+    assert len(parsers["LR(1)"].C) > len(parsers["LALR(1)"].C)
+
+
+def test_build_parsers_options_and_errors():
+    grammar = GENERATORS["layered_expressions"](levels=3)
+    parsers = build_parsers(grammar, ["slr1", "lr1"], max_workers=1, unit_shortcuts=True)
+    assert list(parsers) == ["SLR(1)", "LR(1)"]
+    assert all(parser.unit_shortcuts is not None for parser in parsers.values())
+    with pytest.raises(ValueError, match="Unknown parser type 'glr'"):
+        build_parsers(grammar, ["lalr1", "glr"])
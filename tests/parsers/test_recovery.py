@@ -0,0 +1,67 @@
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.parser_types import build_parser
+from src.parsers.recovery import ErrorRecovery, expected_terminals
+
+STATEMENTS = """
+%token id = + ';' ( )
+prog -> stmts
+stmts -> stmts stmt | stmt
+stmt -> id = E ';' | error ';'
+E -> E + id | id | ( E )
+"""
+
+
+@pytest.fixture
+def parser():
+    return build_parser(parse_grammar(STATEMENTS), "LALR(1)")
+
+
+def test_valid_input_is_accepted(parser):
+    result = parser.diagnose("id = id + id ; id = ( id ) ;".split())
+    assert result.accepted and result.completed and not result.diagnostics
+
+
+def test_expected_terminals(parser):
+    assert expected_terminals(parser, [0]) == ["id"]
+
+
+def test_repair_reports_every_error(parser):
+    result = parser.diagnose("id = id + ; id = id id ; id = id ;".split(), ErrorRecovery(strategies=["repair"]))
+    assert result.completed and not result.accepted
+    assert [(d.position, d.token, d.repair) for d in result.diagnostics] == [
+        (4, ";", "inserted 'id'"), (8, "id", "deleted 'id'")]
+    assert str(result.diagnostics[0]) == "position 4: unexpected ';', expected id (inserted 'id')"
+
+
+def test_error_productions(parser):
+    result = parser.diagnose("id = id ; id id id ; id = id ;".split(), ErrorRecovery(strategies=["error_productions"]))
+    assert result.completed
+    assert [d.position for d in result.diagnostics] == [5]
+    assert result.diagnostics[0].repair == "error production, skipped 2 tokens"
+
+
+def test_panic_resumes_after_sync_terminal(parser):
+    recovery = ErrorRecovery(strategies=["panic"], sync_terminals=[";"])
+    result = parser.diagnose("id = id ; id id id ; id = ; id = id ;".split(), recovery)
+    assert result.completed
+    assert [(d.position, d.token) for d in result.diagnostics] == [(5, "id"), (10, ";")]
+
+
+def test_panic_without_sync_terminal_abandons(parser):
+    result = parser.diagnose("= = =".split(), ErrorRecovery(strategies=["panic"]))
+    assert not result.completed and not result.error_limit_reached
+    assert result.diagnostics[-1].repair is None
+    assert "parsing abandoned" in str(result.diagnostics[-1])
+
+
+def test_max_errors(parser):
+    tokens = "id = id id ;".split() * 5
+    result = parser.diagnose(tokens, ErrorRecovery(strategies=["repair"], max_errors=3))
+    assert result.error_limit_reached and not result.completed
+    assert len(result.diagnostics) == 3
+
+
+def test_unknown_strategy():
+    with pytest.raises(ValueError, match="Unknown recovery strategies: guess"):
+        ErrorRecovery(strategies=["repair", "guess"])
@@ -0,0 +1,58 @@
+import pytest
+from src.grammars.context_free_grammar import ContextFreeGrammar
+from src.parsers.slr1_parser import SLR1Parser
+from src.parsers.tables import EncodedTables, ERROR, NO_GOTO
+
+
+@pytest.fixture
+def parser():
+    terminals = ["+", "a", "(", ")"]
+    non_terminals = ["S", "E", "T"]
+    productions = [
+        ("S", ["E"]),
+        ("E", ["E", "+", "T"]),
+        ("E", ["T"]),
+        ("T", ["a"]),
+        ("T", ["(", "E", ")"]),
+    ]
+    parser = SLR1Parser(ContextFreeGrammar(terminals, non_terminals, productions, "S"))
+    parser.items()
+    parser.construct_parsing_table()
+    return parser
+
+
+@pytest.fixture
+def tables(parser):
+    return EncodedTables.from_parser(parser)
+
+
+def test_columns(tables):
+    assert tables.terminals == ["+", "a", "(", ")", "$"]
+    assert tables.non_terminals == ["S", "E", "T"]
+    assert tables.n_states == 10
+
+
+def test_round_trip_action(parser, tables):
+    for state, row in enumerate(tables.action):
+        for idx, code in enumerate(row):
+            symbol = tables.terminals[idx]
+            assert tables.decode_action(code) == parser.action.get((state, symbol))
+
+
+def test_round_trip_goto(parser, tables):
+    for state, row in enumerate(tables.goto):
+        for idx, target in enumerate(row):
+            expected = parser.goto_table.get((state, tables.non_terminals[idx]))
+            assert target == (NO_GOTO if expected is None else expected)
+
+
+def test_encoding(tables):
+    assert tables.decode_action(ERROR) is None
+    assert tables.decode_action(-1) == ("accept",)
+    assert tables.decode_action(4) == ("shift", 3)
+    assert tables.decode_action(-3) == ("reduce", "E", ["E", "+", "T"])
+
+
+def test_contiguous_buffers(tables):
+    assert len(tables.action_bytes()) == tables.n_states * len(tables.terminals) * tables.action[0].itemsize
+    assert len(tables.goto_bytes()) == tables.n_states * len(tables.non_terminals) * tables.goto[0].itemsize
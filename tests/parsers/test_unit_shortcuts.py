@@ -0,0 +1,65 @@
+import pytest
+from benchmarks.generators import layered_expressions
+from src.grammars.loader import parse_grammar
+from src.grammars.sentence_generator import SentenceGenerator
+from src.parsers.parse_profile import ParseProfile
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+from tests.parsers.test_incremental import EXPRESSIONS
+
+TOKENS = ["id", "+", "id", "*", "(", "id", "+", "id", ")"]
+
+
+@pytest.mark.parametrize("parser_type", ["SLR(1)", "LALR(1)", "LR(1)"])
+def test_trace_is_unchanged(parser_type, capsys):
+    plain = build_parser(parse_grammar(EXPRESSIONS), parser_type)
+    shortcut = build_parser(parse_grammar(EXPRESSIONS), parser_type, unit_shortcuts=True)
+    assert shortcut.unit_shortcuts
+    assert shortcut.parse(TOKENS) == plain.parse(TOKENS)
+    assert shortcut.parse(["id", "+"]) == plain.parse(["id", "+"])
+
+
+def test_shortcut_skips_chain():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+    parser.eliminate_unit_productions()
+    state = parser.goto_table[(0, "F")]
+    target, chain = parser.unit_shortcuts[(0, "F", "$")]
+    # At the end of the input, F -> id is followed by T -> F, E -> T and S -> E
+    assert [reduction[1:] for reduction, _ in chain] == [("T", ["F"]), ("E", ["T"]), ("S", ["E"])]
+    assert target == parser.goto_table[(0, "S")] != state
+
+
+def test_kept_productions_are_reduced():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+    parser.eliminate_unit_productions(keep=[("T", ["F"])])
+    assert all(reduction[1:] != ("T", ["F"])
+               for _, chain in parser.unit_shortcuts.values() for reduction, _ in chain)
+
+
+@pytest.mark.parametrize("parser_type", list(PARSER_TYPES))
+def test_recognize_agrees_on_generated_input(parser_type):
+    grammar = layered_expressions(4)
+    plain = build_parser(grammar.copy(), parser_type)
+    shortcut = build_parser(grammar.copy(), parser_type, unit_shortcuts=True)
+    generator = SentenceGenerator(grammar.copy(), seed=3)
+    for _ in range(5):
+        tokens = generator.sentence(60)
+        assert shortcut.recognize(tokens) == plain.recognize(tokens)
+        assert shortcut.recognize(tokens[:-1]) == plain.recognize(tokens[:-1])
+
+
+def test_profile_counts_bypassed_reductions():
+    plain = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)")
+    shortcut = build_parser(parse_grammar(EXPRESSIONS), "LALR(1)", unit_shortcuts=True)
+    plain_profile, shortcut_profile = ParseProfile(plain), ParseProfile(shortcut)
+    assert plain.recognize(TOKENS, plain_profile) and shortcut.recognize(TOKENS, shortcut_profile)
+
+    assert list(shortcut_profile.reductions) == list(plain_profile.reductions)
+    assert sum(shortcut_profile.state_visits) < sum(plain_profile.state_visits)
+
+
+def test_rebuild_recomputes_shortcuts():
+    parser = build_parser(parse_grammar(EXPRESSIONS), "SLR(1)", unit_shortcuts=True)
+    parser.rebuild(added=[("F", ["-", "F"])])
+    fresh = build_parser(parse_grammar(EXPRESSIONS + "F -> - F\n"), "SLR(1)", unit_shortcuts=True)
+    assert len(parser.unit_shortcuts) == len(fresh.unit_shortcuts)
+    assert parser.recognize(["-", "id", "*", "id"])
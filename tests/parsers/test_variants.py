@@ -0,0 +1,84 @@
+import pytest
+from benchmarks.generators import GENERATORS
+from src.grammars.loader import parse_grammar
+from src.parsers.parser_types import PARSER_TYPES, build_parser
+from src.parsers.tables import EncodedTables
+from src.parsers.variants import build_variants
+from tests.parsers.test_glr import AMBIGUOUS
+
+POINTERS = "S -> L = R | R\nL -> * R | id\nR -> L\n"
+
+
+def renumbered(parser):
+    """Returns the ACTION and GOTO tables with the states numbered breadth-first in symbol order."""
+    outgoing = {}
+    for (state, symbol), target in parser.transitions.items():
+        outgoing.setdefault(state, {})[symbol] = target
+    number = {0: 0}
+    order = [0]
+    for state in order:
+        for symbol in sorted(outgoing.get(state, {})):
+            target = outgoing[state][symbol]
+            if target not in number:
+                number[target] = len(order)
+                order.append(target)
+
+    def action(value):
+        return ('shift', number[value[1]]) if value[0] == 'shift' else value
+
+    return ({(number[state], t): action(value) for (state, t), value in parser.action.items()},
+            {(number[state], A): number[target] for (state, A), target in parser.goto_table.items()})
+
+
+@pytest.mark.parametrize("grammar", [
+    parse_grammar(POINTERS),
+    parse_grammar("S -> a A d | b B d | a B e | b A e\nA -> c\nB -> c\n"),
+    parse_grammar("S -> A S b | ε\nA -> ε | a\n"),
+    parse_grammar("%left +\n%left *\n" + AMBIGUOUS),
+    GENERATORS["layered_expressions"](levels=4),
+    GENERATORS["lalr_stressors"](copies=2),
+    GENERATORS["epsilon_chains"](width=2, depth=3),
+])
+def test_variants_match_separate_builds(grammar):
+    build = build_variants(grammar, include_lr1=True)
+    assert list(build.parsers) == list(PARSER_TYPES)
+    for name, parser in build.parsers.items():
+        expected = build_parser(grammar, name)
+        if name == "LALR(1)":
+            assert renumbered(parser) == renumbered(expected)
+        else:
+            tables, expected_tables = EncodedTables.from_parser(parser), EncodedTables.from_parser(expected)
+            assert (tables.action, tables.goto) == (expected_tables.action, expected_tables.goto)
+        assert len(parser.conflicts) == len(expected.conflicts)
+    # One LR(0) automaton for the first three types
+    lr0, slr, lalr = (build.parsers[name] for name in ("LR(0)", "SLR(1)", "LALR(1)"))
+    assert slr.C[0] is lr0.C[0] and slr.transitions == lr0.transitions == lalr.transitions
+
+
+def test_comparison():
+    build = build_variants(parse_grammar(POINTERS))
+    assert "LR(1)" not in build.parsers
+    rows = {row["parser"]: row for row in build.comparison()}
+    assert [row["states"] for row in rows.values()] == [10, 10, 10]
+    assert rows["LR(0)"]["shift_reduce"] == rows["SLR(1)"]["shift_reduce"] == 1
+    assert rows["LALR(1)"]["shift_reduce"] == rows["LALR(1)"]["reduce_reduce"] == 0
+    assert rows["LR(0)"]["action_entries"] > rows["SLR(1)"]["action_entries"]
+    assert rows["SLR(1)"]["table_bytes"] == 10 * (4 + 1 + 3) * 4
+    assert build.weakest_conflict_free() == "LALR(1)"
+
+    declared = build_variants(parse_grammar("%left +\n%left *\n" + AMBIGUOUS), include_lr1=True)
+    # Precedence settles the conflicts of every type, even those of LR(0)
+    assert all(summary.precedence and summary.conflict_free for summary in declared.summaries)
+    assert declared.weakest_conflict_free() == "LR(0)"
+    assert build_variants(parse_grammar("S -> A c d | B c e\nA -> a\nB -> a\n")).weakest_conflict_free() is None
+
+
+def test_grammar_is_not_modified_and_parsers_are_usable():
+    grammar = parse_grammar("S -> A b | c\nA -> a\nB -> d\n")
+    productions = list(grammar.productions)
+    build = build_variants(grammar, prune=True)
+    assert grammar.productions == productions and grammar.augmented_start_symbol is None
+    for parser in build.parsers.values():
+        assert "B" not in parser.grammar.non_terminals
+        assert parser.recognize(["a", "b"]) and not parser.recognize(["a"])
+        assert parser.compile().recognize(["c"])
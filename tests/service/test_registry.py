@@ -0,0 +1,60 @@
+import os
+
+import pytest
+from src.service.registry import ParserRegistry
+from tests.parsers.test_incremental import EXPRESSIONS
+
+
+def test_swap_keeps_held_version_until_released():
+    released = []
+    registry = ParserRegistry(on_release=released.append)
+    first = registry.install("expr", EXPRESSIONS, "slr1")
+    with registry.acquire("expr") as held:
+        second = registry.install("expr", EXPRESSIONS, "lalr1")
+        assert held is first and registry.current("expr") is second
+        assert first.retired and not first.released and first.references == 1
+        assert held.parser.recognize(["id", "+", "id"])
+        assert released == []
+    assert released == [first] and first.released and first.parser is None
+    assert second.version == first.version + 1 and not second.retired
+
+
+def test_unused_version_is_released_on_swap():
+    released = []
+    registry = ParserRegistry(on_release=released.append)
+    first = registry.install("expr", EXPRESSIONS, "slr1")
+    registry.install("expr", EXPRESSIONS, "slr1")
+    assert released == [first]
+    assert [version.grammar_id for version in registry.versions()] == ["expr"]
+    with pytest.raises(ValueError, match="Unknown grammar 'nope'"):
+        with registry.acquire("nope"):
+            pass
+
+
+def test_failed_build_keeps_current_version():
+    registry = ParserRegistry()
+    first = registry.install("expr", EXPRESSIONS, "slr1")
+    with pytest.raises(ValueError):
+        registry.install("expr", EXPRESSIONS, "no-such-parser")
+    assert registry.current("expr") is first and not first.retired
+
+
+def test_reload_changed_rebuilds_changed_files(tmp_path):
+    path = tmp_path / "expr.grammar"
+    path.write_text(EXPRESSIONS)
+    registry = ParserRegistry()
+    first = registry.watch("expr", str(path), "slr1")
+    assert registry.reload_changed() == {}
+
+    path.write_text(EXPRESSIONS + "F -> num\n")
+    os.utime(path, ns=(0, 0))
+    reloaded = registry.reload_changed()
+    assert reloaded["expr"].version == first.version + 1 and first.released
+    assert registry.current("expr").parser.recognize(["num", "*", "id"])
+
+    path.write_text("S ->\n-> nonsense\n")
+    os.utime(path, ns=(1, 1))
+    error = registry.reload_changed()["expr"]
+    assert isinstance(error, ValueError) and registry.errors["expr"] is error
+    assert registry.current("expr") is reloaded["expr"]
+    assert registry.reload_changed() == {}
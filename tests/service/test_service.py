@@ -0,0 +1,157 @@
+import asyncio
+import os
+import struct
+
+import pytest
+from src.service.client import ParseClient, ServiceError
+from src.service.protocol import MAX_FRAME, encode_frame, read_frame
+from src.service.server import ParseService
+from tests.parsers.test_incremental import EXPRESSIONS
+
+
+def serve(test, tmp_path, **options):
+    """Runs `test(service, client)` against a service on a temporary Unix socket."""
+    async def run():
+        path = str(tmp_path / "parse.sock")
+        service = await ParseService(workers=1, **options).start(path)
+        client = await ParseClient.connect(path)
+        try:
+            await client.register("expr", EXPRESSIONS, "slr1", {"id": "[a-z]+"})
+            return await test(service, client)
+        finally:
+            await client.close()
+            await service.close()
+    return asyncio.run(run())
+
+
+def test_frame_round_trip():
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(encode_frame({"op": "grammars"}) + struct.pack(">I", MAX_FRAME + 1))
+        reader.feed_eof()
+        assert await read_frame(reader) == {"op": "grammars"}
+        with pytest.raises(ValueError, match="exceeds the limit"):
+            await read_frame(reader)
+    asyncio.run(run())
+
+
+def test_parse_tokens_and_text(tmp_path):
+    async def test(service, client):
+        assert (await client.grammars())[0]["grammar_id"] == "expr"
+        assert await client.parse("expr", ["id", "+", "id"]) == {"accepted": True, "tokens": 3, "version": 1}
+        result = await client.parse("expr", text="a + * b")
+        assert not result["accepted"]
+        assert result["diagnostics"][0]["position"] == 2
+        with pytest.raises(ServiceError, match="no terminal matches"):
+            await client.parse("expr", text="a $ b")
+        with pytest.raises(ServiceError, match="Unknown grammar 'nope'"):
+            await client.parse("nope", ["id"])
+    serve(test, tmp_path)
+
+
+def test_streamed_request(tmp_path):
+    async def test(service, client):
+        result = await client.parse_stream("expr", [["id", "*"], ["(", "id", ")"]])
+        assert result == {"accepted": True, "tokens": 5, "version": 1}
+        result = await client.parse_stream("expr", ["a +", " b * c"], kind="text")
+        assert result["accepted"]
+    serve(test, tmp_path)
+
+
+def test_framing_error_in_streamed_request_closes_connection(tmp_path):
+    async def test(service, client):
+        reader, writer = await asyncio.open_unix_connection(str(tmp_path / "parse.sock"))
+        writer.write(encode_frame({"op": "parse", "grammar_id": "expr", "stream": True})
+                     + struct.pack(">I", MAX_FRAME + 1))
+        await writer.drain()
+        response = await read_frame(reader)
+        assert not response["ok"] and "exceeds the limit" in response["error"]
+        assert await read_frame(reader) is None
+        writer.close()
+        assert (await client.parse("expr", ["id"]))["accepted"]
+    serve(test, tmp_path)
+
+
+def test_large_inputs_are_offloaded(tmp_path):
+    async def test(service, client):
+        tokens = ["id"] + ["+", "id"] * 50
+        results = await asyncio.gather(*(client.parse("expr", tokens) for _ in range(3)),
+                                       client.parse("expr", text="a + b"))
+        assert all(result["accepted"] for result in results)
+        assert service.offloaded == 3 and service.parses == 4
+        result = await client.parse("expr", tokens + ["+"])
+        assert not result["accepted"] and result["diagnostics"]
+    serve(test, tmp_path, inline_limit=10)
+
+
+def test_recovering_parses_are_offloaded(tmp_path):
+    async def test(service, client):
+        result = await client.parse("expr", ["id", "+"])
+        assert not result["accepted"] and result["diagnostics"]
+        assert service.offloaded == 1
+    serve(test, tmp_path)
+
+
+def test_malformed_inputs_get_error_responses(tmp_path):
+    async def test(service, client):
+        with pytest.raises(ServiceError, match="'tokens' must be a list of strings"):
+            await client.request({"op": "parse", "grammar_id": "expr", "tokens": 5})
+        with pytest.raises(ServiceError, match="'tokens' must be a list of strings"):
+            await client.parse("expr", ["id", 1])
+        with pytest.raises(ServiceError, match="'text' must be a string"):
+            await client.request({"op": "parse", "grammar_id": "expr", "text": ["a"]})
+        with pytest.raises(ServiceError, match="'tokens' must be a list of strings"):
+            await client.request({"op": "parse", "grammar_id": "expr", "stream": True}, {"tokens": ["id"]},
+                                 {"tokens": "+"}, {"end": True})
+        assert (await client.parse("expr", ["id"]))["accepted"]
+    serve(test, tmp_path)
+
+
+def test_pool_failure_gets_error_response(tmp_path):
+    async def test(service, client):
+        service._pool.shutdown()
+        with pytest.raises(ServiceError, match="RuntimeError"):
+            await client.parse("expr", ["id", "+"])
+        assert (await client.parse("expr", ["id"]))["accepted"]
+    serve(test, tmp_path)
+
+
+def test_reregistration_swaps_versions(tmp_path):
+    async def test(service, client):
+        tokens = ["id"] + ["+", "id"] * 50
+        pending = asyncio.ensure_future(client.parse("expr", tokens))
+        other = await ParseClient.connect(service.address)
+        try:
+            registered = await other.register("expr", EXPRESSIONS, "lalr1", {"id": "[a-z]+"})
+            assert registered["version"] == 2 and registered["parser"] == "lalr1"
+            assert (await pending)["accepted"]
+            assert (await client.parse("expr", ["id"]))["version"] == 2
+            assert [grammar["version"] for grammar in await other.grammars()] == [2]
+        finally:
+            await other.close()
+    serve(test, tmp_path, inline_limit=10)
+
+
+def test_watched_grammar_file_is_reloaded(tmp_path):
+    async def run():
+        grammar = tmp_path / "expr.grammar"
+        grammar.write_text(EXPRESSIONS)
+        path = str(tmp_path / "parse.sock")
+        service = ParseService(workers=1, watch_interval=0.01)
+        await service.watch("expr", str(grammar), "slr1")
+        await service.start(path)
+        client = await ParseClient.connect(path)
+        try:
+            assert not (await client.parse("expr", ["id", "id"]))["accepted"]
+            grammar.write_text(EXPRESSIONS + "E -> E id\n")
+            os.utime(grammar, ns=(0, 0))
+            for _ in range(200):
+                if service.registry.current("expr").version > 1:
+                    break
+                await asyncio.sleep(0.01)
+            result = await client.parse("expr", ["id", "id"])
+            assert result["accepted"] and result["version"] == 2
+        finally:
+            await client.close()
+            await service.close()
+    asyncio.run(run())
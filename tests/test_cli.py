@@ -0,0 +1,198 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from src.cli import main
+
+# Cold-start budget for importing the CLI in a fresh interpreter
+IMPORT_BUDGET_SECONDS = 0.5
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def grammar_file(tmp_path):
+    path = tmp_path / "expr.json"
+    path.write_text(json.dumps({
+        "terminals": ["+", "*", "(", ")", "id"],
+        "non_terminals": ["E", "T", "F"],
+        "start_symbol": "E",
+        "productions": [
+            "E -> E + T | T",
+            "T -> T * F | F",
+            ["F", ["(", "E", ")"]],
+            ["F", ["id"]],
+        ],
+    }))
+    return str(path)
+
+
+def test_text_grammar_file(tmp_path, capsys):
+    path = tmp_path / "expr.grammar"
+    path.write_text("E -> E + T | T\nT -> id\n")
+    assert main(["parse", "--parser", "lr0", str(path), "id", "+", "id"]) == 0
+    assert capsys.readouterr().out.strip() == "accepted"
+
+
+def test_parse_accepts_and_rejects(grammar_file, capsys):
+    assert main(["parse", grammar_file, "id", "+", "id", "*", "id"]) == 0
+    assert capsys.readouterr().out.strip() == "accepted"
+    assert main(["parse", "--parser", "slr1", grammar_file, "id", "+"]) == 1
+    assert capsys.readouterr().out.strip() == "rejected"
+
+
+def test_parse_lazy(grammar_file, capsys):
+    assert main(["parse", "--parser", "lr1", "--lazy", grammar_file, "id", "*", "id"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "accepted"
+    assert "discovered states" in captured.err
+    assert main(["parse", "--lazy", grammar_file, "id"]) == 2
+
+
+def test_tables_json(grammar_file, tmp_path):
+    output = tmp_path / "tables.json"
+    assert main(["tables", grammar_file, "--parser", "lr0", "--format", "json", "-o", str(output)]) == 0
+    data = json.loads(output.read_text())
+    assert data["terminals"][-1] == "$"
+    assert len(data["action"]) == len(data["goto"]) > 0
+
+
+def test_tables_csv(grammar_file, capsys):
+    assert main(["tables", grammar_file, "--parser", "slr1"]) == 0
+    header = capsys.readouterr().out.splitlines()[0]
+    assert header == "State,+,*,(,),id,$,E,T,F"
+
+
+def test_bench_json(grammar_file, capsys):
+    assert main(["bench", grammar_file, "--parser", "lr0", "--parser", "lr1", "--repeat", "1", "--json"]) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert [result["parser"] for result in results] == ["LR0Parser", "LR1Parser"]
+    assert set(results[0]["best_ms"]) == {"init", "items", "table"}
+
+
+def test_generate_and_parse(grammar_file, tmp_path, capsys):
+    sentence = tmp_path / "sentence.txt"
+    assert main(["generate", grammar_file, "--length", "200", "--seed", "1", "-o", str(sentence)]) == 0
+    assert len(sentence.read_text().split()) >= 200
+    assert main(["parse", grammar_file, "--input", str(sentence)]) == 0
+
+    assert main(["generate", grammar_file, "--length", "50", "--near-miss", "-o", str(sentence)]) == 0
+    assert main(["parse", grammar_file, "--input", str(sentence)]) == 1
+
+
+def test_build_profile(grammar_file, capsys):
+    assert main(["build", grammar_file, "--parser", "lalr1", "--profile"]) == 0
+    out = capsys.readouterr().out
+    assert "merge_states" in out
+    assert "closure_calls" in out
+
+
+def test_parse_profile(grammar_file, capsys):
+    assert main(["parse", "--profile", grammar_file, "id", "*", "id"]) == 0
+    captured = capsys.readouterr()
+    assert captured.out.strip() == "accepted"
+    assert json.loads(captured.err)["shifts"] == 3
+
+
+def test_missing_grammar_file(tmp_path, capsys):
+    assert main(["build", str(tmp_path / "missing.json")]) == 2
+    assert "error" in capsys.readouterr().err
+
+
+def test_cold_start_avoids_ui_dependencies():
+    code = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "import src.cli\n"
+        "elapsed = time.perf_counter() - start\n"
+        "heavy = [m for m in ('streamlit', 'pandas', 'numpy', 'concurrent.futures.process') if m in sys.modules]\n"
+        "print(elapsed, ','.join(heavy))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    elapsed, heavy = output.stdout.strip().partition(" ")[::2]
+    assert heavy == ""
+    assert float(elapsed) < IMPORT_BUDGET_SECONDS
+
+
+def test_check_reports_conflicts(grammar_file, tmp_path, capsys):
+    assert main(["check", grammar_file, "--parser", "slr1"]) == 0
+    assert "SLR(1)   ok" in capsys.readouterr().out
+
+    ambiguous = tmp_path / "ambiguous.grammar"
+    ambiguous.write_text("E -> E + E | id\n")
+    assert main(["check", str(ambiguous), "--parser", "lalr1", "--all", "--json"]) == 1
+    conflicts = json.loads(capsys.readouterr().out)[str(ambiguous)]["LALR(1)"]
+    assert [conflict["kind"] for conflict in conflicts] == ["shift/reduce"]
+
+
+def test_build_warns_about_conflicts(tmp_path, capsys):
+    ambiguous = tmp_path / "ambiguous.grammar"
+    ambiguous.write_text("E -> E + E | id\n")
+    assert main(["build", str(ambiguous)]) == 0
+    assert "warning: shift/reduce conflict" in capsys.readouterr().err
+
+
+def test_parse_unit_shortcuts(grammar_file, capsys):
+    assert main(["parse", "--trace", grammar_file, "id", "*", "id"]) == 0
+    plain = capsys.readouterr().out
+    assert main(["parse", "--trace", "--unit-shortcuts", grammar_file, "id", "*", "id"]) == 0
+    assert capsys.readouterr().out == plain
+
+
+def test_build_prune(tmp_path, capsys):
+    path = tmp_path / "dead.grammar"
+    path.write_text("S -> a | B\nB -> b B\nC -> c\n")
+    assert main(["build", "--prune", str(path)]) == 0
+    err = capsys.readouterr().err
+    assert "unproductive: B" in err and "unreachable: C" in err
+
+
+def test_parse_recover(tmp_path, capsys):
+    path = tmp_path / "statements.grammar"
+    path.write_text("S -> S stmt | stmt\nstmt -> id = id ';'\n")
+    tokens = "id = ; id id = id ; id = id".split()
+    assert main(["parse", "--recover", "--sync", ";", str(path), *tokens]) == 1
+    captured = capsys.readouterr()
+    assert "rejected (3 errors)" in captured.out
+    assert captured.err.count("error: position") == 3
+
+
+def test_parse_glr(tmp_path, capsys):
+    path = tmp_path / "ambiguous.grammar"
+    path.write_text("E -> E + E | E * E | id\n")
+    assert main(["parse", "--glr", str(path), *"id + id * id + id".split()]) == 0
+    captured = capsys.readouterr()
+    assert "accepted (5 derivations" in captured.out and "warning:" in captured.err
+    assert main(["parse", "--glr", str(path), "id", "+"]) == 1
+    assert "at token 2" in capsys.readouterr().err
+
+
+def test_parse_lex(grammar_file, tmp_path, capsys):
+    source = tmp_path / "input.txt"
+    source.write_text("alpha+beta*(gamma)\n")
+    assert main(["parse", "--pattern", "id=[a-z]+", "--input", str(source), grammar_file]) == 0
+    assert main(["parse", "--lex", grammar_file, "id+id*", "(id)"]) == 0
+    assert main(["parse", "--lex", grammar_file, "id+$"]) == 2
+    assert "no terminal matches '$'" in capsys.readouterr().err
+
+
+def test_parse_mmap(grammar_file, tmp_path, capsys):
+    source = tmp_path / "input.txt"
+    source.write_text("alpha + beta\n* (gamma)\n" * 3)
+    assert main(["parse", "--mmap", "--pattern", "id=[a-z]+", "--input", str(source), grammar_file]) == 1
+    assert "rejected at byte 23" in capsys.readouterr().err
+    source.write_text("alpha + beta * (gamma)\n")
+    assert main(["parse", "--mmap", "--pattern", "id=[a-z]+", "--input", str(source), grammar_file]) == 0
+
+
+def test_compare(tmp_path, capsys):
+    pointers = tmp_path / "pointers.grammar"
+    pointers.write_text("S -> L = R | R\nL -> * R | id\nR -> L\n")
+    assert main(["compare", str(pointers)]) == 0
+    output = capsys.readouterr().out
+    assert "weakest conflict-free type: LALR(1)" in output and "\nLR(1) " not in output
+    assert main(["compare", str(pointers), "--lr1", "--json"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    assert [row["parser"] for row in result["parsers"]] == ["LR(0)", "SLR(1)", "LALR(1)", "LR(1)"]
+    assert [row["states"] for row in result["parsers"]] == [10, 10, 10, 14]
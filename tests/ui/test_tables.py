@@ -0,0 +1,40 @@
+import csv
+import io
+
+import pytest
+from src.grammars.loader import parse_grammar
+from src.parsers.parser_types import build_parser
+from src.parsers.tables import EncodedTables
+from src.ui import tables as ui_tables
+from tests.parsers.test_incremental import EXPRESSIONS
+
+
+@pytest.fixture
+def tables():
+    return EncodedTables.from_parser(build_parser(parse_grammar(EXPRESSIONS), "LALR(1)"))
+
+
+@pytest.mark.parametrize("table", ["action", "goto"])
+def test_csv_export_in_chunks(tables, table, monkeypatch):
+    expected = (ui_tables.action_dataframe if table == "action" else ui_tables.goto_dataframe)(tables)
+    monkeypatch.setattr(ui_tables, "EXPORT_CHUNK_ROWS", 3)
+    data = ui_tables.export_csv(tables, table)
+    rows = list(csv.reader(io.StringIO(data.decode("utf-8"))))
+
+    assert rows[0] == ["State"] + list(expected.columns)
+    assert rows[1:] == [[str(state), *row] for state, row in enumerate(expected.values.tolist())]
+
+    output = io.BytesIO()
+    assert ui_tables.export_csv(tables, table, output) is None
+    assert output.getvalue() == data
+
+
+def test_parquet_export_to_file(tables, tmp_path, monkeypatch):
+    pq = pytest.importorskip("pyarrow.parquet")
+    monkeypatch.setattr(ui_tables, "EXPORT_CHUNK_ROWS", 3)
+    path = tmp_path / "action.parquet"
+    assert ui_tables.export_parquet(tables, "action", str(path)) is None
+
+    read = pq.read_table(path)
+    assert read.num_rows == tables.n_states
+    assert pq.read_table(io.BytesIO(ui_tables.export_parquet(tables, "action"))).equals(read)